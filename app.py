@@ -1,14 +1,18 @@
 import os
-from flask import Flask, jsonify
+import json
+from flask import Flask, Response, jsonify, request
 from dotenv import load_dotenv
-from services.crawler import start_crawling_process
+from services.crawler import start_crawling_process, stream_crawling_process
+from services.replay import replay_archive
 from utils.logger import logger
+from utils.profiler import Profiler, authorized, profile_options
+from config import Config
 
 # 환경 변수 로드 (파일이 없어도 오류 발생하지 않음)
 try:
     load_dotenv()
 except Exception as e:
-    logger.warning(f"환경 변수 파일(.env) 로드 실패: {str(e)}")
+    logger.warning("환경 변수 파일(.env) 로드 실패: %s", e)
     logger.info("계속 진행: 환경 변수는 시스템 설정에서 불러옵니다.")
 
 app = Flask(__name__)
@@ -34,11 +38,11 @@ def index():
             'processed': len(results) if results else 0
         }
         
-        logger.info(f'뉴스 크롤링 요약 작업 완료: {len(results) if results else 0}개 기사 처리됨')
+        logger.info('뉴스 크롤링 요약 작업 완료: %s개 기사 처리됨', len(results) if results else 0)
         return jsonify(response), 200
     
     except Exception as error:
-        logger.error(f'크롤링 처리 중 오류 발생: {str(error)}')
+        logger.error('크롤링 처리 중 오류 발생: %s', error)
         
         response = {
             'status': 'error',
@@ -48,6 +52,97 @@ def index():
         
         return jsonify(response), 500
 
+@app.route('/stream')
+def stream():
+    """
+    스트리밍 크롤링 엔드포인트
+    
+    기사 하나의 요약과 Notion 저장이 끝날 때마다 결과를 한 줄씩 전송합니다.
+    기본 형식은 NDJSON이며, ?format=sse 또는 Accept: text/event-stream이면
+    Server-Sent Events 형식으로 전송합니다.
+    """
+    use_sse = (
+        request.args.get('format') == 'sse'
+        or 'text/event-stream' in request.headers.get('Accept', '')
+    )
+    logger.info("뉴스 크롤링 스트리밍 작업 시작 (%s)", 'SSE' if use_sse else 'NDJSON')
+    
+    def generate():
+        for item in stream_crawling_process():
+            line = json.dumps(item, ensure_ascii=False)
+            if use_sse:
+                yield f"event: {item['event']}\ndata: {line}\n\n"
+            else:
+                yield line + "\n"
+    
+    mimetype = 'text/event-stream' if use_sse else 'application/x-ndjson'
+    # 프록시 버퍼링을 끄고 결과를 즉시 전달
+    headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    return Response(generate(), mimetype=mimetype, headers=headers)
+
+@app.route('/replay')
+def replay():
+    """
+    오프라인 리플레이 엔드포인트
+    
+    아카이브에 저장된 페이지를 현재 추출/요약 코드로 다시 처리하고
+    원본 대비 변경 내역을 반환합니다. (?limit=N&summarize=true)
+    CPU 작업과 OpenAI 호출이 발생하므로 디버그 엔드포인트와 같은 인증이 필요합니다.
+    """
+    if not Config.Debug.ENABLED:
+        return jsonify({'status': 'error', 'error': 'Not Found'}), 404
+    if not authorized(request.headers.get('Authorization')):
+        return jsonify({'status': 'error', 'error': 'Unauthorized'}), 401
+    
+    try:
+        limit = request.args.get('limit', type=int)
+        summarize = request.args.get('summarize', 'false').lower() == 'true'
+        report = replay_archive(limit=limit, summarize=summarize)
+        return jsonify({'status': 'success', **report}), 200
+    
+    except Exception as error:
+        logger.error('리플레이 처리 중 오류 발생: %s', error)
+        return jsonify({'status': 'error', 'error': str(error)}), 500
+
+@app.route('/debug/profile')
+def debug_profile():
+    """
+    프로파일링 크롤링 엔드포인트 (DEBUG_ENDPOINTS=true, Authorization: Bearer <DEBUG_TOKEN> 필요)
+    
+    크롤링을 한 번 실행하면서 단계별 CPU 스택 샘플과 메모리 사용량을 기록합니다.
+    (?cpu=true&memory=true&interval=0.01&top=20&format=json|collapsed)
+    format=collapsed이면 flamegraph용 collapsed-stack 텍스트를 반환합니다.
+    """
+    if not Config.Debug.ENABLED:
+        return jsonify({'status': 'error', 'error': 'Not Found'}), 404
+    if not authorized(request.headers.get('Authorization')):
+        return jsonify({'status': 'error', 'error': 'Unauthorized'}), 401
+    
+    try:
+        options = profile_options(request.args)
+    except ValueError as error:
+        return jsonify({'status': 'error', 'error': str(error)}), 400
+    
+    try:
+        profiler = Profiler(**options)
+        with profiler:
+            results = start_crawling_process()
+    
+    except RuntimeError as error:
+        return jsonify({'status': 'error', 'error': str(error)}), 409
+    except Exception as error:
+        logger.error('프로파일링 크롤링 중 오류 발생: %s', error)
+        return jsonify({'status': 'error', 'error': str(error)}), 500
+    
+    if request.args.get('format') == 'collapsed':
+        return Response(profiler.collapsed(), mimetype='text/plain')
+    
+    return jsonify({
+        'status': 'success',
+        'processed': len(results) if results else 0,
+        'profile': profiler.report()
+    }), 200
+
 # 기본 홈 엔드포인트 추가
 @app.route('/home')
 def home():
@@ -57,5 +152,5 @@ def home():
     })
 
 if __name__ == '__main__':
-    logger.info(f'서버가 0.0.0.0의 포트 {PORT}에서 실행 중입니다.')
+    logger.info('서버가 0.0.0.0의 포트 %s에서 실행 중입니다.', PORT)
     app.run(host='0.0.0.0', port=PORT, debug=False) 
\ No newline at end of file
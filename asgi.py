@@ -0,0 +1,194 @@
+import os
+import json
+import asyncio
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+from utils.logger import logger
+from utils.profiler import Profiler, authorized, profile_options
+from config import Config
+
+# 환경 변수 로드 (파일이 없어도 오류 발생하지 않음)
+try:
+    load_dotenv()
+except Exception as e:
+    logger.warning("환경 변수 파일(.env) 로드 실패: %s", e)
+    logger.info("계속 진행: 환경 변수는 시스템 설정에서 불러옵니다.")
+
+from services.crawler import run_crawling_process, astream_crawling_process
+from services.replay import replay_archive
+from services.http import close_session
+
+PORT = int(os.getenv('PORT', 8080))
+
+# 진행 중인 크롤링 태스크 (종료 시 완료 대기)
+_running = set()
+
+def _json(data, status_code=200):
+    return JSONResponse(data, status_code=status_code)
+
+async def health(request):
+    """헬스 체크 엔드포인트"""
+    return _json({'status': 'OK'})
+
+async def index(request):
+    """메인 크롤링 엔드포인트 - GCP Cloud Scheduler에서 호출됨 (서버 이벤트 루프에서 실행)"""
+    logger.info('뉴스 크롤링 요약 작업 시작')
+    
+    task = asyncio.ensure_future(run_crawling_process())
+    _running.add(task)
+    task.add_done_callback(_running.discard)
+    
+    try:
+        # 클라이언트가 끊겨도 크롤링 태스크는 취소되지 않도록 보호
+        results = await asyncio.shield(task)
+        
+        response = {
+            'status': 'success',
+            'message': '뉴스 크롤링 및 요약 작업이 완료되었습니다.',
+            'processed': len(results) if results else 0
+        }
+        
+        logger.info('뉴스 크롤링 요약 작업 완료: %s개 기사 처리됨', len(results) if results else 0)
+        return _json(response, 200)
+    
+    except Exception as error:
+        logger.error('크롤링 처리 중 오류 발생: %s', error)
+        
+        response = {
+            'status': 'error',
+            'message': '뉴스 크롤링 및 요약 작업 중 오류가 발생했습니다.',
+            'error': str(error)
+        }
+        
+        return _json(response, 500)
+
+async def stream(request):
+    """스트리밍 크롤링 엔드포인트 (NDJSON 기본, ?format=sse 또는 Accept: text/event-stream이면 SSE)"""
+    use_sse = (
+        request.query_params.get('format') == 'sse'
+        or 'text/event-stream' in request.headers.get('accept', '')
+    )
+    logger.info("뉴스 크롤링 스트리밍 작업 시작 (%s)", 'SSE' if use_sse else 'NDJSON')
+    
+    async def generate():
+        async for item in astream_crawling_process():
+            line = json.dumps(item, ensure_ascii=False)
+            if use_sse:
+                yield f"event: {item['event']}\ndata: {line}\n\n"
+            else:
+                yield line + "\n"
+    
+    media_type = 'text/event-stream' if use_sse else 'application/x-ndjson'
+    headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    return StreamingResponse(generate(), media_type=media_type, headers=headers)
+
+async def replay(request):
+    """오프라인 리플레이 엔드포인트 (?limit=N&summarize=true, 디버그 엔드포인트와 같은 인증 필요)"""
+    if not Config.Debug.ENABLED:
+        return _json({'status': 'error', 'error': 'Not Found'}, 404)
+    if not authorized(request.headers.get('authorization')):
+        return _json({'status': 'error', 'error': 'Unauthorized'}, 401)
+    
+    try:
+        limit = request.query_params.get('limit')
+        summarize = request.query_params.get('summarize', 'false').lower() == 'true'
+        report = await asyncio.to_thread(
+            replay_archive,
+            limit=int(limit) if limit else None,
+            summarize=summarize
+        )
+        return _json({'status': 'success', **report}, 200)
+    
+    except Exception as error:
+        logger.error('리플레이 처리 중 오류 발생: %s', error)
+        return _json({'status': 'error', 'error': str(error)}, 500)
+
+async def debug_profile(request):
+    """
+    프로파일링 크롤링 엔드포인트 (DEBUG_ENDPOINTS=true, Authorization: Bearer <DEBUG_TOKEN> 필요)
+    
+    크롤링을 한 번 실행하면서 단계별 CPU 스택 샘플과 메모리 사용량을 기록합니다.
+    같은 프로세스에서 동시에 실행 중인 다른 크롤링도 샘플에 포함됩니다.
+    (?cpu=true&memory=true&interval=0.01&top=20&format=json|collapsed)
+    """
+    if not Config.Debug.ENABLED:
+        return _json({'status': 'error', 'error': 'Not Found'}, 404)
+    if not authorized(request.headers.get('authorization')):
+        return _json({'status': 'error', 'error': 'Unauthorized'}, 401)
+    
+    try:
+        options = profile_options(request.query_params)
+    except ValueError as error:
+        return _json({'status': 'error', 'error': str(error)}, 400)
+    
+    try:
+        profiler = Profiler(**options)
+        profiler.start()
+    except RuntimeError as error:
+        return _json({'status': 'error', 'error': str(error)}, 409)
+    
+    task = asyncio.ensure_future(run_crawling_process())
+    _running.add(task)
+    task.add_done_callback(_running.discard)
+    
+    try:
+        results = await asyncio.shield(task)
+    except Exception as error:
+        logger.error('프로파일링 크롤링 중 오류 발생: %s', error)
+        return _json({'status': 'error', 'error': str(error)}, 500)
+    finally:
+        profiler.stop()
+    
+    if request.query_params.get('format') == 'collapsed':
+        return PlainTextResponse(profiler.collapsed())
+    
+    return _json({
+        'status': 'success',
+        'processed': len(results) if results else 0,
+        'profile': profiler.report()
+    }, 200)
+
+# 기본 홈 엔드포인트
+async def home(request):
+    return _json({
+        "status": "success",
+        "message": "안녕하세요! Google Cloud Run에서 실행 중인 서비스입니다."
+    })
+
+@asynccontextmanager
+async def lifespan(app):
+    """
+    서버 수명 주기 관리
+    
+    시작 시 외부 API 호출(FireCrawl, OpenAI, Notion)을 실행할 스레드 풀을 루프에 지정하고,
+    종료 시 진행 중인 크롤링을 기다린 뒤 공유 HTTP 세션을 닫습니다.
+    """
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=Config.Crawler.BLOCKING_WORKERS, thread_name_prefix="blocking-io")
+    )
+    yield
+    if _running:
+        logger.info('진행 중인 크롤링 %s개 완료 대기', len(_running))
+        await asyncio.gather(*_running, return_exceptions=True)
+    await close_session()
+
+app = Starlette(
+    routes=[
+        Route('/health', health),
+        Route('/', index),
+        Route('/stream', stream),
+        Route('/replay', replay),
+        Route('/debug/profile', debug_profile),
+        Route('/home', home),
+    ],
+    lifespan=lifespan
+)
+
+if __name__ == '__main__':
+    import uvicorn
+    logger.info('서버가 0.0.0.0의 포트 %s에서 실행 중입니다.', PORT)
+    uvicorn.run(app, host='0.0.0.0', port=PORT)
@@ -0,0 +1,98 @@
+"""
+기사 레코드 메모리 벤치마크
+
+기존 dict 복사 방식({**headline, ...} -> {**article, "summary": ...})과
+Article 레코드(요약 후 본문 해제)의 최대 메모리 사용량을 비교합니다.
+각 방식은 별도 프로세스에서 실행되어 최대 RSS가 서로 섞이지 않습니다.
+
+사용법:
+    python benchmarks/bench_article_memory.py --articles 500
+"""
+import os
+import sys
+import json
+import asyncio
+import argparse
+import resource
+import subprocess
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fixtures import make_articles
+from models.article import Article
+
+# 요약/Notion 저장 단계 지연 시뮬레이션 (초)
+STAGE_DELAY = 0.01
+
+
+async def _run_dict(items):
+    async def process(headline, site, raw):
+        content = raw.decode("utf-8")
+        article = {
+            **headline,
+            "site": site["name"],
+            "country": site["country"],
+            "content": content,
+            "crawled_at": datetime.now().isoformat()
+        }
+        await asyncio.sleep(STAGE_DELAY)
+        summary = article["content"][:300]
+        saved = {**article, "summary": summary}
+        await asyncio.sleep(STAGE_DELAY)
+        return {"title": saved["title"], "summary": summary, "notion_page_id": None}
+
+    return await asyncio.gather(*[process(*item) for item in items])
+
+
+async def _run_article(items):
+    async def process(headline, site, raw):
+        content = raw.decode("utf-8")
+        article = Article.from_headline(headline, site, content)
+        await asyncio.sleep(STAGE_DELAY)
+        article.summary = article.content[:300]
+        article.release_content()
+        await asyncio.sleep(STAGE_DELAY)
+        return article.to_result()
+
+    return await asyncio.gather(*[process(*item) for item in items])
+
+
+def _measure(mode, count):
+    """단일 방식 측정 (하위 프로세스에서 실행)"""
+    # 본문은 바이트로 보관했다가 처리 시점에 디코딩 (응답 수신 시뮬레이션)
+    items = [(h, s, body.encode("utf-8")) for h, s, body in make_articles(count)]
+    runner = _run_dict if mode == "dict" else _run_article
+
+    tracemalloc.start()
+    asyncio.run(runner(items))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Linux에서 ru_maxrss 단위는 KB
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"mode": mode, "traced_peak_kb": peak // 1024, "max_rss_kb": max_rss}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기사 레코드 메모리 벤치마크')
+    parser.add_argument('--articles', type=int, default=500, help='처리할 기사 수')
+    parser.add_argument('--mode', choices=['dict', 'article'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        _measure(args.mode, args.articles)
+        return
+
+    for mode in ("dict", "article"):
+        output = subprocess.check_output(
+            [sys.executable, os.path.abspath(__file__), "--mode", mode, "--articles", str(args.articles)]
+        )
+        result = json.loads(output)
+        print(f"{mode:8s} tracemalloc 최대: {result['traced_peak_kb']:>8d} KB  최대 RSS: {result['max_rss_kb']:>8d} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+기사 본문 추출 벤치마크
+
+기존 방식(본문 선택자를 차례로 시도하고, 없으면 모든 <p>를 모음)과 텍스트 밀도
+기반 추출을 비교합니다. 추출 시간과 요약 모델로 보낼 텍스트 크기(문자 수,
+추정 토큰 수)를 출력합니다.
+
+--archive-dir을 주면 아카이브(ARCHIVE_ENABLED=true로 수집)에 저장된 실제 기사
+페이지 HTML을 사용합니다. 실제 페이지는 정답 본문을 알 수 없으므로 재현율과
+잡음 비율은 출력하지 않습니다. 생략하면 레이아웃 4종으로 만든 합성 페이지를
+사용하며, 이때는 정답 본문 대비 재현율과 잡음 비율도 출력합니다. 합성 페이지는
+추출기를 다듬을 때 쓴 구조와 같으므로 실제 사이트 성능을 대신하지 않습니다.
+
+토큰 수는 영문 기준 4글자당 1토큰으로 추정합니다.
+
+사용법:
+    python benchmarks/bench_content_extract.py --archive-dir /tmp/newsscrap-archive
+    python benchmarks/bench_content_extract.py --pages 200
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+from fixtures import SEED, make_article_page
+from config import Config
+from services.archive import ArchiveReader
+from services.html_extract import CONTENT_SELECTORS, UNWANTED_SELECTOR, extract_main_content
+
+# 추정 토큰당 글자 수
+CHARS_PER_TOKEN = 4
+
+
+def _legacy_extract(soup):
+    """기존 추출 방식 (본문 선택자를 차례로 시도하고, 없으면 모든 단락 수집)"""
+    for selector in CONTENT_SELECTORS:
+        content_element = soup.select_one(selector)
+        if content_element:
+            for unwanted in content_element.select(UNWANTED_SELECTOR):
+                unwanted.decompose()
+            content = content_element.get_text().strip()
+            content = " ".join(line.strip() for line in content.splitlines() if line.strip())
+            if content:
+                return content
+
+    paragraphs = soup.select("p")
+    return " ".join(p.get_text().strip() for p in paragraphs if p.get_text().strip())
+
+
+def _density_extract(soup):
+    """텍스트 밀도 기반 추출"""
+    return extract_main_content(soup)[0]
+
+
+def _archived_pages(directory, limit):
+    """아카이브에서 기사 페이지(본문 레코드가 있는 URL)의 최신 HTML 목록"""
+    pages = []
+    with ArchiveReader(directory) as reader:
+        for url in reader.iter_urls():
+            if reader.get(url, "content") is None:
+                continue
+            html = reader.get(url, "html")
+            if html is None:
+                continue
+            pages.append((html["data"], None))
+            if limit and len(pages) >= limit:
+                break
+    return pages
+
+
+def _synthetic_pages(count):
+    """합성 기사 페이지 목록 (정답 본문 포함)"""
+    sites = [
+        {"country": country, **site}
+        for country, country_sites in Config.ALL_NEWS_SITES.items()
+        for site in country_sites
+    ]
+    rng = random.Random(SEED)
+    return [make_article_page(rng, sites[i % len(sites)], i) for i in range(count)]
+
+
+def _measure(extract, pages):
+    """파싱을 제외한 추출 시간과 출력 크기, 정답 본문이 있으면 재현율/잡음 비율 측정"""
+    elapsed = 0.0
+    chars = 0
+    recall = 0.0
+    noise = 0.0
+
+    for html, body in pages:
+        soup = BeautifulSoup(html, "html.parser")
+        started = time.perf_counter()
+        content = extract(soup)
+        elapsed += time.perf_counter() - started
+        chars += len(content)
+
+        if body is not None:
+            found = sum(len(paragraph) for paragraph in body if paragraph in content)
+            recall += found / sum(len(paragraph) for paragraph in body)
+            noise += (len(content) - found) / len(content) if content else 0.0
+
+    count = len(pages)
+    return {
+        "ms": elapsed / count * 1000,
+        "chars": chars / count,
+        "tokens": chars / count / CHARS_PER_TOKEN,
+        "recall": recall / count,
+        "noise": noise / count
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기사 본문 추출 벤치마크')
+    parser.add_argument('--archive-dir', default=None, help='실제 기사 페이지를 읽을 아카이브 디렉터리 (생략 시 합성 페이지)')
+    parser.add_argument('--pages', type=int, default=200, help='추출할 페이지 수 (아카이브 사용 시 최대 수)')
+    args = parser.parse_args()
+
+    if args.archive_dir:
+        pages = _archived_pages(args.archive_dir, args.pages)
+        if not pages:
+            print(f"아카이브에 원본 HTML이 있는 기사 페이지가 없습니다: {args.archive_dir}")
+            return
+        print(f"아카이브 실제 기사 페이지 {len(pages)}개 (정답 본문 없음: 재현율/잡음 생략)")
+    else:
+        pages = _synthetic_pages(args.pages)
+        print(f"합성 페이지 {len(pages)}개 (레이아웃 4종, 실제 사이트 페이지 아님)")
+
+    synthetic = not args.archive_dir
+    header = f"{'방식':8s} {'추출 ms':>8s} {'글자':>8s} {'토큰':>7s}"
+    print(header + (f" {'재현율':>7s} {'잡음':>6s}" if synthetic else ""))
+    for name, extract in (("legacy", _legacy_extract), ("density", _density_extract)):
+        result = _measure(extract, pages)
+        line = f"{name:8s} {result['ms']:8.2f} {result['chars']:8.0f} {result['tokens']:7.0f}"
+        if synthetic:
+            line += f" {result['recall']:7.1%} {result['noise']:6.1%}"
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
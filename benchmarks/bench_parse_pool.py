@@ -0,0 +1,75 @@
+"""
+HTML 파싱 워커 풀 벤치마크
+
+같은 페이지 묶음을 호출한 곳에서 바로 파싱할 때와 워커 프로세스 수를
+바꿔 가며 파싱할 때의 처리 시간을 비교합니다. 크롤링 경로처럼 여러
+스레드가 동시에 파싱을 요청하고, 워커에는 원본 바이트를 넘겨 헤드라인과
+본문만 돌려받습니다. 워커 수가 CPU 코어 수를 넘으면 이득이 없습니다.
+
+사용법:
+    python benchmarks/bench_parse_pool.py --pages 200 --workers 1 2 4
+"""
+import os
+import sys
+import time
+import random
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fixtures import SEED, make_page_html
+from services.parser_pool import ParserPool
+
+# 동시에 파싱을 요청하는 스레드 수 (기사 처리 동시성 시뮬레이션)
+THREADS = 8
+
+
+def _run(pool, pages):
+    """모든 페이지에서 헤드라인과 본문 추출 후 걸린 시간과 결과 크기 반환"""
+    def parse(item):
+        url, raw = item
+        headlines = pool.parse("headlines", raw, url, limit=5)
+        content = pool.parse("content", raw, url)
+        return len(headlines), len(content)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(THREADS) as executor:
+        results = list(executor.map(parse, pages))
+    return time.perf_counter() - started, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파싱 워커 풀 벤치마크')
+    parser.add_argument('--pages', type=int, default=200, help='파싱할 페이지 수')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help='비교할 워커 프로세스 수')
+    args = parser.parse_args()
+
+    rng = random.Random(SEED)
+    pages = [
+        (f"https://example.com/page-{i}", make_page_html(rng).encode("utf-8"))
+        for i in range(args.pages)
+    ]
+    average_kb = sum(len(raw) for _, raw in pages) / len(pages) / 1024
+    print(f"페이지 {len(pages)}개 (평균 {average_kb:.0f} KB), CPU 코어 {os.cpu_count()}개, 요청 스레드 {THREADS}개")
+
+    baseline, expected = _run(ParserPool(workers=0), pages)
+    print(f"{'inline':>10s}  {baseline:6.2f}초  {len(pages) / baseline:7.1f} 페이지/초")
+
+    for workers in args.workers:
+        # 모든 페이지가 워커로 가도록 인라인 기준을 0으로 설정
+        pool = ParserPool(workers=workers, inline_max_bytes=0)
+        try:
+            # 워커 프로세스 시작 비용은 측정에서 제외
+            _run(pool, pages[:workers])
+            elapsed, results = _run(pool, pages)
+        finally:
+            pool.shutdown()
+
+        assert results == expected, "워커 파싱 결과가 인라인 파싱과 다릅니다"
+        print(f"{workers:>3d} workers  {elapsed:6.2f}초  {len(pages) / elapsed:7.1f} 페이지/초  (x{baseline / elapsed:.2f})")
+
+
+if __name__ == '__main__':
+    main()
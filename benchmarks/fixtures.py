@@ -0,0 +1,132 @@
+import random
+
+# 벤치마크용 고정 시드 (실행마다 같은 데이터 생성)
+SEED = 20240415
+
+SITES = [
+    {"country": "영국", "name": "BBC", "url": "https://www.bbc.com/news"},
+    {"country": "미국", "name": "CNN", "url": "https://www.cnn.com/"},
+    {"country": "한국", "name": "연합뉴스", "url": "https://www.yna.co.kr/"},
+    {"country": "일본", "name": "NHK", "url": "https://www3.nhk.or.jp/news/"}
+]
+
+_WORDS = (
+    "government minister said officials report economy market election policy "
+    "security council week talks president agency according statement city "
+    "people police health climate energy prices trade court investigation"
+).split()
+
+
+def make_body(rng, sentences=60):
+    """무작위 영문 기사 본문 생성"""
+    lines = []
+    for _ in range(sentences):
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(12, 24))]
+        lines.append(" ".join(words).capitalize() + ".")
+    return " ".join(lines)
+
+
+def make_articles(count, sentences=60):
+    """
+    (헤드라인, 사이트, 본문) 튜플 목록 생성
+
+    Args:
+        count (int): 생성할 기사 수
+        sentences (int): 기사당 문장 수
+
+    Returns:
+        list: (headline dict, site dict, 본문 str) 목록
+    """
+    rng = random.Random(SEED)
+    items = []
+    for i in range(count):
+        site = SITES[i % len(SITES)]
+        headline = {
+            "title": f"Headline {i}",
+            "url": f"{site['url'].rstrip('/')}/article-{i}"
+        }
+        items.append((headline, site, make_body(rng, sentences)))
+    return items
+
+
+def make_page_html(rng, headlines=40, sentences=60, boilerplate=200):
+    """
+    뉴스 메인/기사 페이지 형태의 HTML 생성 (내비게이션, 헤드라인 목록, 본문, 광고 포함)
+
+    Args:
+        rng (random.Random): 난수 생성기
+        headlines (int): 헤드라인 링크 수
+        sentences (int): 본문 문장 수
+        boilerplate (int): 내비게이션/푸터 링크 수
+
+    Returns:
+        str: 페이지 HTML
+    """
+    nav = "".join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(boilerplate))
+    links = "".join(
+        f'<h3 class="title"><a href="/article-{i}">{make_body(rng, 1)}</a></h3>'
+        for i in range(headlines)
+    )
+    paragraphs = "".join(f"<p>{make_body(rng, 4)}</p>" for _ in range(max(sentences // 4, 1)))
+    return (
+        "<html><head><title>News</title></head><body>"
+        f"<nav><ul>{nav}</ul></nav>"
+        f'<section class="headlines">{links}</section>'
+        f'<article><h1>{make_body(rng, 1)}</h1>{paragraphs}'
+        '<div class="ad">Advertisement</div><div class="related"><a href="/x">Related</a></div></article>'
+        f"<footer><ul>{nav}</ul></footer>"
+        "</body></html>"
+    )
+
+
+# 합성 기사 페이지 레이아웃 (본문 컨테이너 구조 4종, 실제 사이트 구조를 캡처한 것은 아님)
+_ARTICLE_LAYOUTS = [
+    '<article class="story">{body}</article>',
+    '<div id="main"><div class="story-body__inner">{body}</div></div>',
+    '<div class="content"><div class="text-a">{head}</div><div class="text-b">{tail}</div></div>',
+    '<div class="wrap"><div class="col">{body}</div></div>'
+]
+
+
+def make_article_page(rng, site, index, paragraphs=12):
+    """
+    합성 기사 페이지 생성 (사이트 정보는 <title>에만 사용)
+
+    본문 외에 내비게이션, 링크가 많은 추천 기사 목록, 단락으로 된 푸터 안내문을
+    포함해, 모든 <p>를 모으는 방식이면 본문이 아닌 텍스트가 섞이도록 만듭니다.
+
+    Args:
+        rng (random.Random): 난수 생성기
+        site (dict): 뉴스 사이트 정보
+        index (int): 기사 번호 (구조 선택에 사용)
+        paragraphs (int): 본문 단락 수
+
+    Returns:
+        tuple: (페이지 HTML, 본문 단락 목록)
+    """
+    body = [make_body(rng, rng.randint(2, 5)) for _ in range(paragraphs)]
+    html_body = "".join(f"<p>{text}</p>" for text in body)
+    half = len(body) // 2
+    layout = _ARTICLE_LAYOUTS[index % len(_ARTICLE_LAYOUTS)].format(
+        body=html_body,
+        head="".join(f"<p>{text}</p>" for text in body[:half]),
+        tail="".join(f"<p>{text}</p>" for text in body[half:])
+    )
+
+    nav = "".join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(60))
+    promos = "".join(
+        f'<div class="promo"><p><a href="/story-{i}">{make_body(rng, 1)}</a></p><p>{make_body(rng, 1)[:60]}</p></div>'
+        for i in range(12)
+    )
+    notices = "".join(f"<p>{make_body(rng, 2)}</p>" for _ in range(3))
+
+    html = (
+        f"<html><head><title>{site['name']}</title><script>var x = 1;</script></head><body>"
+        f"<nav><ul>{nav}</ul></nav>"
+        f"<h1>{make_body(rng, 1)}</h1>"
+        f"{layout}"
+        f'<div class="more-stories">{promos}</div>'
+        f'<div class="site-info">{notices}</div>'
+        "</body></html>"
+    )
+    return html, body
@@ -0,0 +1,137 @@
+"""
+크롤링 동시 실행 중 /health 응답 지연 부하 테스트
+
+외부 서비스(FireCrawl, OpenAI 요약/제목 번역, Notion) 호출을 지연만 있는 대역으로 바꾼 뒤,
+크롤링 요청(GET /)을 여러 개 동시에 보내면서 /health 지연 시간을 측정합니다.
+
+사용법:
+    python benchmarks/load_health.py --target asgi --crawls 8
+    python benchmarks/load_health.py --target flask --crawls 8
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+import statistics
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("FEEDS_ENABLED", "false")
+os.environ.setdefault("PREFETCH_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("TRANSLATION_CACHE_PATH", os.path.join(tempfile.mkdtemp(prefix="newsscrap-bench-"), "titles.sqlite3"))
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from services import crawler
+from services.firecrawl import firecrawl
+from services.summarizer import summarizer
+from services.notion import notion_service
+from services.translator import title_translator
+
+# 대역 서비스 지연 (초)
+SCRAPE_DELAY = 0.3
+SUMMARY_DELAY = 0.5
+NOTION_DELAY = 0.2
+TRANSLATE_DELAY = 0.3
+
+
+def _install_stubs(sites_per_crawl):
+    """외부 API 호출을 지연만 있는 대역으로 교체"""
+    def scrape(options):
+        time.sleep(SCRAPE_DELAY)
+        if "헤드라인" in options["extract"]["prompt"]:
+            return {"result": {"extract": [{"title": "Stub headline", "url": options["url"] + "article"}]}}
+        return {"result": {"extract": {"content": "Stub body. " * 200}}}
+
+    def batch_scrape(urls, options):
+        time.sleep(SCRAPE_DELAY)
+        return {url: {"result": {"extract": {"content": "Stub body. " * 200}}} for url in urls}
+
+    def summarize(article):
+        time.sleep(SUMMARY_DELAY)
+        return "Stub summary."
+
+    def save(article):
+        time.sleep(NOTION_DELAY)
+        return {"id": "stub-page"}
+
+    def translate(titles):
+        time.sleep(TRANSLATE_DELAY)
+        return [f"번역된 {title}" for title in titles]
+
+    firecrawl.scrape = scrape
+    firecrawl.batch_scrape = batch_scrape
+    summarizer.summarize_article = summarize
+    notion_service.save_to_notion = save
+    title_translator._request = translate
+
+    sites = [
+        {"country": "벤치마크", "name": f"Site {i}", "url": f"https://site{i}.example/"}
+        for i in range(sites_per_crawl)
+    ]
+    crawler.select_sites = lambda: sites
+
+
+def _serve(target, port):
+    """대상 서버를 백그라운드 스레드에서 실행"""
+    if target == "asgi":
+        import uvicorn
+        from asgi import app
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+        threading.Thread(target=server.run, daemon=True).start()
+    else:
+        from werkzeug.serving import make_server
+        from app import app
+        server = make_server("127.0.0.1", port, app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    base = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            requests.get(f"{base}/health", timeout=1)
+            return base
+        except requests.RequestException:
+            time.sleep(0.05)
+    raise RuntimeError("서버가 시작되지 않았습니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='/health 지연 부하 테스트')
+    parser.add_argument('--target', choices=['asgi', 'flask'], default='asgi', help='테스트할 앱')
+    parser.add_argument('--crawls', type=int, default=8, help='동시에 보낼 크롤링 요청 수')
+    parser.add_argument('--sites', type=int, default=10, help='크롤링당 사이트 수')
+    parser.add_argument('--port', type=int, default=8099, help='서버 포트')
+    args = parser.parse_args()
+
+    _install_stubs(args.sites)
+    base = _serve(args.target, args.port)
+
+    crawl_threads = [
+        threading.Thread(target=requests.get, args=(f"{base}/",), kwargs={"timeout": 600})
+        for _ in range(args.crawls)
+    ]
+    started = time.perf_counter()
+    for thread in crawl_threads:
+        thread.start()
+
+    latencies = []
+    while any(thread.is_alive() for thread in crawl_threads):
+        before = time.perf_counter()
+        requests.get(f"{base}/health", timeout=60)
+        latencies.append((time.perf_counter() - before) * 1000)
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) >= 20 else latencies[-1]
+    print(f"대상: {args.target}, 동시 크롤링: {args.crawls}, 크롤링당 사이트: {args.sites}")
+    print(f"크롤링 전체 소요: {elapsed:.2f}초, /health 요청 {len(latencies)}회")
+    print(f"/health 지연 p50 {statistics.median(latencies):.1f}ms, p95 {p95:.1f}ms, 최대 {latencies[-1]:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
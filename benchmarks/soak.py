@@ -0,0 +1,378 @@
+"""
+종단 간 부하/장시간(soak) 테스트
+
+실제 Flask 앱을 별도 프로세스로 띄우고, 뉴스 사이트·FireCrawl·OpenAI·Notion을
+로컬 대역 서버(stubs.py)로 바꾼 뒤 크롤링 요청(GET /)을 반복합니다.
+사이트 수와 사이트당 헤드라인 수를 수백 개까지 늘릴 수 있으며, 실행하는 동안
+앱 프로세스의 RSS, 열린 파일 디스크립터 수, 스레드 수를 주기적으로 기록합니다.
+
+처리량, 크롤링 p95 지연, 크롤링 중 /health p95 지연, 처리 성공률과 함께
+첫 크롤링(워밍업) 이후 자원 증가량(세션/이벤트 루프/스레드 누수)을 계산하고,
+soak_baseline.json에 저장된 시나리오별 기준을 넘으면 종료 코드 1로 실패합니다.
+
+사용법:
+    python benchmarks/soak.py --scenario smoke
+    python benchmarks/soak.py --scenario load --sites 300 --headlines 3
+    python benchmarks/soak.py --scenario soak --duration 1800 --output soak.json
+    python benchmarks/soak.py --scenario smoke --update-baseline
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import threading
+import subprocess
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+
+from stubs import StubServices
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "soak_baseline.json")
+
+# 시나리오별 기본값 (명령행 인자로 덮어쓸 수 있음)
+SCENARIOS = {
+    "smoke": {"sites": 20, "headlines": 3, "iterations": 10, "duration": 0, "clients": 1, "concurrency": 4},
+    "load": {"sites": 200, "headlines": 3, "iterations": 3, "duration": 0, "clients": 2, "concurrency": 16},
+    "soak": {"sites": 20, "headlines": 2, "iterations": 0, "duration": 600, "clients": 1, "concurrency": 4}
+}
+
+# 대역 사이트에 번갈아 붙일 국가 (라틴 문자 제목이 번역 대상이 되도록)
+COUNTRIES = ["미국", "영국", "프랑스", "독일"]
+
+# 자원 사용량 기록 간격 및 /health 측정 간격 (초)
+SAMPLE_INTERVAL = 0.5
+HEALTH_INTERVAL = 0.2
+
+
+def _serve(args):
+    """앱 프로세스: 대역 사이트를 선택하도록 바꾼 뒤 Flask 앱 실행"""
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from werkzeug.serving import make_server
+    from config import Config
+    from services import crawler
+    from app import app
+
+    Config.Crawler.HEADLINES_PER_SITE = args.headlines
+    Config.Crawler.CONCURRENCY = args.concurrency
+
+    sites = [
+        {"country": COUNTRIES[i % len(COUNTRIES)], "name": f"Soak Site {i}", "url": f"{args.stub_url}/site/{i}/"}
+        for i in range(args.sites)
+    ]
+    crawler.select_sites = lambda: sites
+
+    # 요청마다 찍히는 개발 서버 접근 로그 끄기
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    make_server("127.0.0.1", args.port, app, threaded=True).serve_forever()
+
+
+def _resources(pid):
+    """프로세스의 RSS(MB), 열린 파일 디스크립터 수, 스레드 수"""
+    rss_kb = threads = 0
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                rss_kb = int(line.split()[1])
+            elif line.startswith("Threads:"):
+                threads = int(line.split()[1])
+    return {"rss_mb": round(rss_kb / 1024, 1), "fds": len(os.listdir(f"/proc/{pid}/fd")), "threads": threads}
+
+
+def _percentile(values, q):
+    """q 분위수 (값이 부족하면 최대값)"""
+    if len(values) < 2:
+        return max(values, default=0.0)
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+class Monitor:
+    """앱 프로세스 자원 사용량과 /health 지연을 백그라운드에서 기록"""
+
+    def __init__(self, pid, base):
+        self.pid = pid
+        self.base = base
+        self.samples = []
+        self.health = []
+        self.started = time.monotonic()
+        self._stop = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._sample, daemon=True),
+            threading.Thread(target=self._probe, daemon=True)
+        ]
+
+    def start(self):
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+
+    def snapshot(self):
+        """현재 자원 사용량"""
+        return _resources(self.pid)
+
+    def _sample(self):
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            self.samples.append({"t": round(time.monotonic() - self.started, 1), **_resources(self.pid)})
+
+    def _probe(self):
+        session = requests.Session()
+        while not self._stop.wait(HEALTH_INTERVAL):
+            started = time.perf_counter()
+            try:
+                session.get(f"{self.base}/health", timeout=10)
+                self.health.append(time.perf_counter() - started)
+            except requests.RequestException:
+                self.health.append(10.0)
+        session.close()
+
+
+def _crawl(base):
+    """크롤링 요청 1회 (지연 시간, 처리 건수, 성공 여부)"""
+    started = time.perf_counter()
+    try:
+        response = requests.get(f"{base}/", timeout=1800)
+        processed = response.json().get("processed", 0) if response.status_code == 200 else 0
+        return time.perf_counter() - started, processed, response.status_code == 200
+    except requests.RequestException:
+        return time.perf_counter() - started, 0, False
+
+
+def _wait_ready(base, process):
+    for _ in range(200):
+        if process.poll() is not None:
+            raise RuntimeError("앱 프로세스가 시작 중 종료되었습니다.")
+        try:
+            requests.get(f"{base}/health", timeout=1)
+            return
+        except requests.RequestException:
+            time.sleep(0.1)
+    raise RuntimeError("앱 서버가 시작되지 않았습니다.")
+
+
+def run(settings, port, latency):
+    """
+    시나리오 실행
+
+    Args:
+        settings (dict): 시나리오 설정 (sites, headlines, iterations, duration, clients, concurrency)
+        port (int): 앱 서버 포트
+        latency (float): 대역 서비스 응답 지연 (초)
+
+    Returns:
+        dict: 측정 결과
+    """
+    stubs = StubServices(headlines=settings["headlines"], latency=latency)
+    stub_url = stubs.start()
+
+    env = {
+        **os.environ,
+        "OPENAI_API_KEY": "soak",
+        "OPENAI_BASE_URL": f"{stub_url}/v1",
+        "FIRECRAWL_API_KEY": "soak",
+        "FIRECRAWL_API_URL": stub_url,
+        "NOTION_TOKEN": "soak",
+        "NOTION_DATABASE_ID": "soak-database",
+        "NOTION_API_URL": stub_url,
+        "TRANSLATION_CACHE_PATH": os.path.join(tempfile.mkdtemp(prefix="newsscrap-soak-"), "titles.sqlite3"),
+        "ARCHIVE_ENABLED": "false",
+        "LOG_LEVEL": os.environ.get("LOG_LEVEL", "ERROR")
+    }
+    command = [
+        sys.executable, os.path.abspath(__file__), "--serve",
+        "--port", str(port), "--stub-url", stub_url,
+        "--sites", str(settings["sites"]), "--headlines", str(settings["headlines"]),
+        "--concurrency", str(settings["concurrency"])
+    ]
+    process = subprocess.Popen(command, env=env)
+    base = f"http://127.0.0.1:{port}"
+
+    try:
+        _wait_ready(base, process)
+        monitor = Monitor(process.pid, base)
+        monitor.start()
+
+        crawls = []
+        warm = None
+        started = time.monotonic()
+        iteration = 0
+
+        with ThreadPoolExecutor(settings["clients"]) as executor:
+            while True:
+                iteration += 1
+                batch = list(executor.map(lambda _: _crawl(base), range(settings["clients"])))
+                crawls.extend(batch)
+
+                elapsed = time.monotonic() - started
+                done = sum(processed for _, processed, _ in batch)
+                print(f"  반복 {iteration}: {done}개 처리, {max(seconds for seconds, _, _ in batch):.2f}초, 경과 {elapsed:.0f}초", flush=True)
+
+                # 첫 반복(워밍업) 직후 자원 사용량을 누수 비교 기준으로 사용
+                if warm is None:
+                    time.sleep(1)
+                    warm = monitor.snapshot()
+
+                if settings["duration"]:
+                    if elapsed >= settings["duration"]:
+                        break
+                elif iteration >= settings["iterations"]:
+                    break
+
+        total = time.monotonic() - started
+
+        # 진행 중인 백그라운드 작업이 정리될 시간을 둔 뒤 최종 측정
+        time.sleep(1)
+        final = monitor.snapshot()
+        monitor.stop()
+
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    latencies = [latency for latency, _, _ in crawls]
+    processed = sum(count for _, count, _ in crawls)
+    expected = settings["sites"] * settings["headlines"] * len(crawls)
+
+    return {
+        "settings": settings,
+        "crawls": len(crawls),
+        "processed": processed,
+        "success_rate": round(processed / expected, 3) if expected else 0.0,
+        "failed_requests": sum(1 for _, _, ok in crawls if not ok),
+        "throughput": round(processed / total, 2),
+        "crawl_p95": round(_percentile(latencies, 95), 3),
+        "health_p95_ms": round(_percentile(monitor.health, 95) * 1000, 1),
+        "warm": warm,
+        "final": final,
+        "peak": {
+            key: max((sample[key] for sample in monitor.samples), default=final[key])
+            for key in ("rss_mb", "fds", "threads")
+        },
+        "fd_growth": final["fds"] - warm["fds"],
+        "thread_growth": final["threads"] - warm["threads"],
+        "rss_growth_mb": round(final["rss_mb"] - warm["rss_mb"], 1),
+        "stub_requests": stubs.requests,
+        "samples": monitor.samples
+    }
+
+
+def check(result, baseline):
+    """
+    기준 대비 회귀 확인
+
+    Returns:
+        list: 기준을 넘은 항목 설명 목록
+    """
+    rules = [
+        ("throughput", "min_throughput", lambda value, limit: value >= limit),
+        ("success_rate", "min_success_rate", lambda value, limit: value >= limit),
+        ("crawl_p95", "max_crawl_p95", lambda value, limit: value <= limit),
+        ("health_p95_ms", "max_health_p95_ms", lambda value, limit: value <= limit),
+        ("fd_growth", "max_fd_growth", lambda value, limit: value <= limit),
+        ("thread_growth", "max_thread_growth", lambda value, limit: value <= limit),
+        ("rss_growth_mb", "max_rss_growth_mb", lambda value, limit: value <= limit)
+    ]
+    return [
+        f"{metric}={result[metric]} (기준 {key}={baseline[key]})"
+        for metric, key, passes in rules
+        if key in baseline and not passes(result[metric], baseline[key])
+    ]
+
+
+def thresholds(result):
+    """측정 결과에 여유를 둔 기준값"""
+    return {
+        "min_throughput": round(result["throughput"] * 0.7, 2),
+        "min_success_rate": round(max(result["success_rate"] - 0.02, 0), 3),
+        "max_crawl_p95": round(result["crawl_p95"] * 1.5, 2),
+        "max_health_p95_ms": round(max(result["health_p95_ms"] * 2, 50), 1),
+        "max_fd_growth": max(result["fd_growth"], 0) + 10,
+        "max_thread_growth": max(result["thread_growth"], 0) + 4,
+        "max_rss_growth_mb": round(max(result["rss_growth_mb"] * 2, 32), 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='종단 간 부하/장시간 테스트')
+    parser.add_argument('--scenario', choices=sorted(SCENARIOS), default='smoke', help='실행할 시나리오')
+    parser.add_argument('--sites', type=int, help='사이트 수')
+    parser.add_argument('--headlines', type=int, help='사이트당 헤드라인 수')
+    parser.add_argument('--iterations', type=int, help='크롤링 반복 횟수 (--duration이 있으면 무시)')
+    parser.add_argument('--duration', type=int, help='지정한 시간(초) 동안 반복')
+    parser.add_argument('--clients', type=int, help='동시 크롤링 요청 수')
+    parser.add_argument('--concurrency', type=int, help='앱의 동시 처리 수 (Config.Crawler.CONCURRENCY)')
+    parser.add_argument('--latency', type=float, default=0.02, help='대역 서비스 응답 지연 (초)')
+    parser.add_argument('--port', type=int, default=8093, help='앱 서버 포트')
+    parser.add_argument('--output', help='측정 결과(시계열 포함)를 저장할 JSON 파일')
+    parser.add_argument('--update-baseline', action='store_true', help='이번 결과로 시나리오 기준 갱신')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--stub-url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args)
+        return
+
+    settings = dict(SCENARIOS[args.scenario])
+    for key in settings:
+        if getattr(args, key) is not None:
+            settings[key] = getattr(args, key)
+
+    print(f"시나리오 {args.scenario}: {settings}")
+    result = run(settings, args.port, args.latency)
+
+    print(
+        f"처리 {result['processed']}개 / 크롤링 {result['crawls']}회 (성공률 {result['success_rate']:.1%}), "
+        f"처리량 {result['throughput']}개/초"
+    )
+    print(f"크롤링 p95 {result['crawl_p95']}초, /health p95 {result['health_p95_ms']}ms")
+    print(
+        f"워밍업 이후 증가: FD {result['fd_growth']:+d}, 스레드 {result['thread_growth']:+d}, "
+        f"RSS {result['rss_growth_mb']:+.1f}MB (최대 RSS {result['peak']['rss_mb']}MB, FD {result['peak']['fds']}, 스레드 {result['peak']['threads']})"
+    )
+    print(f"대역 서비스 요청: {result['stub_requests']}")
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(result, output, ensure_ascii=False, indent=2)
+
+    baselines = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as baseline_file:
+            baselines = json.load(baseline_file)
+
+    if args.update_baseline:
+        baselines[args.scenario] = thresholds(result)
+        with open(BASELINE_PATH, "w") as baseline_file:
+            json.dump(baselines, baseline_file, ensure_ascii=False, indent=2)
+            baseline_file.write("\n")
+        print(f"기준 갱신: {args.scenario} -> {baselines[args.scenario]}")
+        return
+
+    baseline = baselines.get(args.scenario)
+    if baseline is None:
+        print(f"{args.scenario} 시나리오 기준이 없습니다. --update-baseline으로 먼저 기록하세요.")
+        return
+
+    failures = check(result, baseline)
+    if failures:
+        print("기준 초과:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+    print("기준 통과")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+"""
+외부 서비스 로컬 대역 서버
+
+뉴스 사이트(메인 페이지, RSS 피드, 기사 페이지), FireCrawl API(단건/배치),
+OpenAI Chat Completions(요약/제목 번역), Notion API(페이지 생성/블록 추가)를
+하나의 aiohttp 서버로 흉내 냅니다. 애플리케이션은 FIRECRAWL_API_URL,
+OPENAI_BASE_URL, NOTION_API_URL 환경 변수로 이 서버를 바라보게 합니다.
+
+사이트 번호에 따라 경로가 갈리도록 만들어 모든 추출 경로를 거치게 합니다.
+    - 짝수 사이트: 메인 페이지에 RSS 피드 링크가 있어 피드에서 헤드라인 추출
+    - 홀수 사이트: FireCrawl 헤드라인 추출 (5로 나눈 나머지가 3이면 FireCrawl이 실패해 직접 크롤링)
+    - 배치 스크래핑은 일부 기사를 결과에서 빼서 개별 요청으로 대체되게 함
+"""
+import json
+import time
+import uuid
+import random
+import asyncio
+import threading
+from urllib.parse import urlparse
+from aiohttp import web
+from fixtures import SEED, make_body
+
+
+class StubServices:
+    """외부 서비스 대역 서버 (백그라운드 스레드의 이벤트 루프에서 실행)"""
+
+    def __init__(self, headlines=1, latency=0.02, batch_miss_rate=0.1):
+        """
+        대역 서버 초기화
+
+        Args:
+            headlines (int): 사이트당 헤드라인 수
+            latency (float): 외부 API 응답 지연 (초)
+            batch_miss_rate (float): 배치 스크래핑 결과에서 뺄 기사 비율
+        """
+        self.headlines = headlines
+        self.latency = latency
+        self.batch_miss_rate = batch_miss_rate
+        self.base_url = None
+        self.requests = {}
+
+        self._rng = random.Random(SEED)
+        self._body = make_body(self._rng, 40)
+        self._batches = {}
+        self._loop = None
+        self._runner = None
+
+    def start(self, port=0):
+        """서버 시작 후 기본 URL 반환"""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self._start(port))
+            ready.set()
+            self._loop.run_forever()
+
+        threading.Thread(target=run, name="stub-services", daemon=True).start()
+        ready.wait()
+        return self.base_url
+
+    async def _start(self, port):
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_get("/site/{site}/", self.home)
+        app.router.add_get("/site/{site}/rss.xml", self.feed)
+        app.router.add_get("/site/{site}/article-{article}", self.article)
+        app.router.add_post("/scrape", self.scrape)
+        app.router.add_post("/v1/batch/scrape", self.batch_submit)
+        app.router.add_get("/v1/batch/scrape/{job}", self.batch_status)
+        app.router.add_post("/v1/chat/completions", self.chat)
+        app.router.add_post("/v1/pages", self.create_page)
+        app.router.add_patch("/v1/blocks/{block}/children", self.append_blocks)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    def _count(self, name):
+        self.requests[name] = self.requests.get(name, 0) + 1
+
+    def site_url(self, index):
+        """사이트 메인 페이지 URL"""
+        return f"{self.base_url}/site/{index}/"
+
+    def _headlines(self, site):
+        return [
+            {"title": f"Site {site} headline {i}: {self._body[i * 7:i * 7 + 60]}", "url": f"{self.base_url}/site/{site}/article-{i}"}
+            for i in range(self.headlines)
+        ]
+
+    # 뉴스 사이트
+
+    async def home(self, request):
+        self._count("site_home")
+        site = int(request.match_info["site"])
+        feed = '<link rel="alternate" type="application/rss+xml" href="rss.xml">' if site % 2 == 0 else ""
+        links = "".join(f'<h3><a href="{h["url"]}">{h["title"]}</a></h3>' for h in self._headlines(site))
+        html = f"<html><head><title>Site {site}</title>{feed}</head><body><nav><a href='/'>Home</a></nav>{links}</body></html>"
+        return web.Response(text=html, content_type="text/html")
+
+    async def feed(self, request):
+        self._count("site_feed")
+        site = int(request.match_info["site"])
+        etag = f'"site-{site}-v1"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+        items = "".join(
+            f"<item><title>{h['title']}</title><link>{h['url']}</link></item>"
+            for h in self._headlines(site)
+        )
+        xml = f'<?xml version="1.0"?><rss version="2.0"><channel><title>Site {site}</title>{items}</channel></rss>'
+        return web.Response(text=xml, content_type="application/rss+xml", headers={"ETag": etag})
+
+    async def article(self, request):
+        self._count("site_article")
+        paragraphs = "".join(f"<p>{self._body[i:i + 300]}</p>" for i in range(0, len(self._body), 300))
+        html = f"<html><body><nav><a href='/'>Home</a></nav><article><h1>Article</h1>{paragraphs}</article></body></html>"
+        return web.Response(text=html, content_type="text/html")
+
+    # FireCrawl
+
+    def _site_of(self, url):
+        return int(urlparse(url).path.split("/")[2])
+
+    async def scrape(self, request):
+        self._count("firecrawl_scrape")
+        options = await request.json()
+        await asyncio.sleep(self.latency)
+
+        if "헤드라인" in options["extract"]["prompt"]:
+            site = self._site_of(options["url"])
+            if site % 5 == 3:
+                return web.json_response({"error": "stub failure"}, status=500)
+            return web.json_response({"result": {"extract": self._headlines(site)}})
+
+        return web.json_response({"result": {"extract": {"content": self._body}}})
+
+    async def batch_submit(self, request):
+        self._count("firecrawl_batch")
+        options = await request.json()
+        await asyncio.sleep(self.latency)
+        job = uuid.uuid4().hex
+        self._batches[job] = options["urls"]
+        return web.json_response({"success": True, "id": job})
+
+    async def batch_status(self, request):
+        # 제출 시 지연을 이미 반영했으므로 첫 조회에서 완료 (폴링 간격만큼 기다리지 않음)
+        urls = self._batches.pop(request.match_info["job"])
+        data = [
+            {"metadata": {"sourceURL": url}, "extract": {"content": self._body}}
+            for url in urls
+            if self._rng.random() >= self.batch_miss_rate
+        ]
+        return web.json_response({"status": "completed", "completed": len(data), "total": len(urls), "data": data})
+
+    # OpenAI
+
+    async def chat(self, request):
+        payload = await request.json()
+        await asyncio.sleep(self.latency)
+
+        system = payload["messages"][0]["content"]
+        if "번역" in system:
+            self._count("openai_translate")
+            titles = json.loads(payload["messages"][1]["content"].split("\n\n", 1)[1])
+            content = json.dumps([f"번역된 제목 {title[:40]}" for title in titles], ensure_ascii=False)
+        else:
+            self._count("openai_summarize")
+            content = "대역 요약 문장입니다. " * 3
+
+        return web.json_response({
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload["model"],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+        })
+
+    # Notion
+
+    async def create_page(self, request):
+        self._count("notion_create")
+        await request.read()
+        await asyncio.sleep(self.latency)
+        return web.json_response({"object": "page", "id": str(uuid.uuid4())})
+
+    async def append_blocks(self, request):
+        self._count("notion_append")
+        await request.read()
+        await asyncio.sleep(self.latency)
+        return web.json_response({"object": "list", "results": []})
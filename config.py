@@ -96,20 +96,93 @@ class Config:
         # 재시도 횟수
         RETRIES = 2
         
+        # 요약 후 기사 본문을 임시 파일로 내보낼지 여부 (False이면 메모리에서 바로 해제)
+        SPILL_ARTICLE_CONTENT = os.getenv('SPILL_ARTICLE_CONTENT', 'false').lower() == 'true'
+        
+        # 공유 HTTP 연결 풀 크기
+        HTTP_POOL_SIZE = 32
+        
+        # 외부 API 호출(FireCrawl, OpenAI, Notion)을 실행할 ASGI 서버 스레드 수
+        BLOCKING_WORKERS = 32
+        
         # 브라우저 사용자 에이전트
         USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     
+    # 기사 페이지 프리페치 설정 (BeautifulSoup 헤드라인 경로)
+    class Prefetch:
+        # 프리페치 사용 여부
+        ENABLED = os.getenv('PREFETCH_ENABLED', 'true').lower() == 'true'
+        
+        # 실행당 프리페치로 보관할 최대 바이트 수
+        BYTE_BUDGET = int(os.getenv('PREFETCH_BYTE_BUDGET', 16 * 1024 * 1024))
+        
+        # 동시 프리페치 요청 수
+        CONCURRENCY = 4
+    
+    # HTML 파싱 워커 설정
+    class Parser:
+        # 파싱 워커 프로세스 수 (0이면 워커 없이 호출한 곳에서 파싱)
+        WORKERS = int(os.getenv('PARSER_WORKERS', max((os.cpu_count() or 1) - 1, 0)))
+        
+        # 이 크기 이하의 페이지는 프로세스 간 전달 없이 바로 파싱 (바이트)
+        INLINE_MAX_BYTES = int(os.getenv('PARSER_INLINE_MAX_BYTES', 64 * 1024))
+    
     # FireCrawl 설정
     class FireCrawl:
         # API 키
         API_KEY = os.getenv('FIRECRAWL_API_KEY')
         
-        # 헤드라인 추출 프롬프트 (5개 뉴스만 요청)
-        HEADLINE_PROMPT = """이 페이지에서 광고를 제외하고 가장 중요한 뉴스 헤드라인 1개와 링크를 찾아서 반환해주세요. 헤드라인의 제목(title)과 링크(url)를 정확하게 추출하세요. title은 한국어로 반환해주세요. URL은 상대 경로인 경우 완전한 URL로 변환해주세요."""
+        # API 기본 URL (로컬 스텁으로 바꿔 테스트 가능)
+        API_URL = os.getenv('FIRECRAWL_API_URL', 'https://api.firecrawl.dev').rstrip('/')
+        
+        # 기사 본문을 배치 API로 한 번에 스크래핑할지 여부
+        BATCH_ENABLED = os.getenv('FIRECRAWL_BATCH', 'true').lower() == 'true'
+        
+        # 배치 작업 상태 조회 간격 및 최대 대기 시간 (초)
+        BATCH_POLL_INTERVAL = 2
+        BATCH_TIMEOUT = 180
+        
+        # 헤드라인 추출 프롬프트 (extract_headlines에서 사용, 제목 번역은 번역 캐시에서 처리)
+        HEADLINE_PROMPT = """이 뉴스 사이트의 메인 페이지에서 오늘의 가장 중요한 뉴스 헤드라인 5개를 찾아줘. 각 헤드라인의 제목과 링크가 필요해. 뉴스 제목은 원문 그대로 'title' 필드에, 링크는 'url' 필드에 담아서 결과를 JSON 배열로 반환해줘."""
         
         # 콘텐츠 추출 프롬프트
         CONTENT_PROMPT = """이 뉴스 기사의 본문 내용만 추출해주세요. 광고나 관련기사 링크, 댓글 섹션은 제외합니다. 기사 본문만 텍스트로 반환해주세요."""
     
+    # RSS/Atom 피드 및 뉴스 사이트맵 설정
+    class Feeds:
+        # 피드 우선 헤드라인 추출 사용 여부
+        ENABLED = os.getenv('FEEDS_ENABLED', 'true').lower() == 'true'
+        
+        # 피드 요청 타임아웃 (초)
+        TIMEOUT = 10
+        
+        # 자동 탐색으로 사용할 최대 피드 수
+        MAX_DISCOVERED = 3
+        
+        # 사이트맵 인덱스(<sitemapindex>)에서 따라갈 최대 하위 사이트맵 수 (최근 lastmod 순)
+        MAX_INDEX_SITEMAPS = 3
+        
+        # 사이트별 피드 URL (없는 사이트는 메인 페이지에서 자동 탐색)
+        REGISTRY = {
+            "연합뉴스": ["https://www.yna.co.kr/rss/news.xml"],
+            "NHK": ["https://www3.nhk.or.jp/rss/news/cat0.xml"],
+            "CNN": ["http://rss.cnn.com/rss/edition.rss"],
+            "New York Times": ["https://rss.nytimes.com/services/xml/rss/nyt/HomePage.xml"],
+            "CNBC": ["https://www.cnbc.com/id/100003114/device/rss/rss.html"],
+            "BBC": ["https://feeds.bbci.co.uk/news/rss.xml"],
+            "The Guardian": ["https://www.theguardian.com/world/rss"],
+            "Le Monde": ["https://www.lemonde.fr/rss/une.xml"],
+            "France 24": ["https://www.france24.com/en/rss"],
+            "Der Spiegel": ["https://www.spiegel.de/schlagzeilen/index.rss"],
+            "Deutsche Welle": ["https://rss.dw.com/rdf/rss-en-all"],
+            "Russia Today": ["https://www.rt.com/rss/news/"],
+            "Tass": ["https://tass.com/rss/v2.xml"],
+            "The Times of India": ["https://timesofindia.indiatimes.com/rssfeedstopstories.cms"],
+            "The Hindu": ["https://www.thehindu.com/feeder/default.rss"],
+            "CBC": ["https://www.cbc.ca/webfeed/rss/rss-topstories"],
+            "ABC News": ["https://www.abc.net.au/news/feed/51120/rss.xml"]
+        }
+    
     # 요약 설정 (GPT-3.5-turbo 사용)
     class Summarization:
         # API 키
@@ -124,6 +197,55 @@ class Config:
         
         TEMPERATURE = 0.5
     
+    # 헤드라인 제목 번역 설정
+    class Translation:
+        # 제목 번역 사용 여부
+        ENABLED = os.getenv('TRANSLATE_TITLES', 'true').lower() == 'true'
+        
+        # 번역 캐시 파일 (SQLite)
+        # 기본 경로(/tmp)는 Cloud Run에서 메모리 기반이라 인스턴스가 바뀌면 사라지므로,
+        # 실행 간 캐시를 유지하려면 영구 볼륨(예: Filestore NFS 마운트) 경로를 지정해야 함
+        CACHE_PATH = os.getenv('TRANSLATION_CACHE_PATH', '/tmp/newsscrap-titles.sqlite3')
+        
+        # 모델 설정
+        MODEL = 'gpt-3.5-turbo'
+        TEMPERATURE = 0
+        
+        # 번역 요청 한 번에 보낼 최대 제목 수
+        BATCH_SIZE = 50
+        
+        # 문자 체계로 언어를 판별할 수 없는 제목(라틴 문자 등)의 국가별 원문 언어
+        COUNTRY_LANGUAGES = {
+            "미국": "en", "영국": "en", "인도": "en", "호주": "en", "캐나다": "en",
+            "남아프리카공화국": "en", "프랑스": "fr", "독일": "de", "브라질": "pt",
+            "러시아": "ru", "중국": "zh", "일본": "ja", "한국": "ko"
+        }
+    
+    # 원본 페이지 아카이브 설정
+    class Archive:
+        # 아카이브 사용 여부
+        ENABLED = os.getenv('ARCHIVE_ENABLED', 'false').lower() == 'true'
+        
+        # 세그먼트 파일 저장 디렉터리
+        DIR = os.getenv('ARCHIVE_DIR', '/tmp/newsscrap-archive')
+        
+        # 세그먼트 교체 기준 크기 (바이트)
+        SEGMENT_MAX_BYTES = int(os.getenv('ARCHIVE_SEGMENT_MAX_BYTES', 64 * 1024 * 1024))
+        
+        # 전체 보존 한도 (바이트) - 초과 시 오래된 세그먼트부터 삭제
+        MAX_TOTAL_BYTES = int(os.getenv('ARCHIVE_MAX_TOTAL_BYTES', 512 * 1024 * 1024))
+        
+        # zstd 압축 레벨
+        COMPRESSION_LEVEL = 3
+    
+    # 오프라인 리플레이 설정
+    class Replay:
+        # 동시 처리 스레드 수
+        WORKERS = 8
+        
+        # 항목당 리포트에 포함할 최대 diff 줄 수
+        MAX_DIFF_LINES = 40
+    
     # Notion 통합 설정
     class Notion:
         # Notion API 토큰
@@ -132,6 +254,9 @@ class Config:
         # Notion 데이터베이스 ID
         DATABASE_ID = os.getenv('NOTION_DATABASE_ID')
         
+        # API 기본 URL (로컬 스텁으로 바꿔 테스트 가능)
+        API_URL = os.getenv('NOTION_API_URL', 'https://api.notion.com').rstrip('/')
+        
         # 프로퍼티 필드 이름
         PROPERTY_FIELDS = {
             'title': 'Title',
@@ -141,4 +266,33 @@ class Config:
             'summary': 'Summary',
             'content': 'Content',
             'crawled_at': 'Date'
-        } 
\ No newline at end of file
+        }
+        
+        # 기사 본문을 페이지 블록으로 저장할지 여부
+        WRITE_CONTENT = os.getenv('NOTION_WRITE_CONTENT', 'true').lower() == 'true'
+        
+        # rich text 한 조각의 최대 글자 수 (Notion API 한도)
+        MAX_TEXT_LENGTH = 2000
+        
+        # 요청당 최대 블록 수 (Notion API 한도)
+        MAX_BLOCKS_PER_REQUEST = 100
+        
+        # 본문 블록 추가를 동시에 처리할 페이지 수
+        APPEND_WORKERS = 3
+    
+    # 디버그(프로파일링) 엔드포인트 설정
+    class Debug:
+        # 디버그 엔드포인트 사용 여부 (기본값: 비활성화)
+        ENABLED = os.getenv('DEBUG_ENDPOINTS', 'false').lower() == 'true'
+        
+        # 디버그 엔드포인트 인증 토큰 (Authorization: Bearer <토큰>, 없으면 항상 거부)
+        TOKEN = os.getenv('DEBUG_TOKEN')
+        
+        # 스택 샘플링 간격 (초)
+        SAMPLE_INTERVAL = float(os.getenv('PROFILE_SAMPLE_INTERVAL', 0.01))
+        
+        # 보고서에 포함할 상위 스택/할당 위치 수
+        TOP_N = 20
+        
+        # tracemalloc이 할당마다 저장할 프레임 수
+        TRACEBACK_LIMIT = 10
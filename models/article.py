@@ -0,0 +1,126 @@
+import os
+import tempfile
+from datetime import datetime
+
+
+class Article:
+    """크롤링 파이프라인(추출 -> 요약 -> Notion 저장)을 따라 이동하는 기사 레코드
+
+    단계마다 dict를 복사하지 않고 같은 객체의 필드만 채워 나갑니다.
+    본문은 요약이 끝나면 release_content()로 메모리에서 해제하거나
+    임시 파일로 내보낼 수 있습니다.
+    """
+
+    __slots__ = (
+        "title", "url", "site", "country", "crawled_at",
+        "summary", "notion_page_id", "timings", "_content", "_content_path"
+    )
+
+    def __init__(self, title, url, site, country, content="", crawled_at=None):
+        """
+        기사 레코드 초기화
+
+        Args:
+            title (str): 기사 제목
+            url (str): 기사 URL
+            site (str): 뉴스 사이트 이름
+            country (str): 국가 이름
+            content (str): 기사 본문
+            crawled_at (str): 수집 시각 (ISO 형식, 생략 시 현재 시각)
+        """
+        self.title = title
+        self.url = url
+        self.site = site
+        self.country = country
+        self.crawled_at = crawled_at or datetime.now().isoformat()
+        self.summary = None
+        self.notion_page_id = None
+        self.timings = {}
+        self._content = content
+        self._content_path = None
+
+    @classmethod
+    def from_headline(cls, headline, site, content=""):
+        """
+        헤드라인 dict와 사이트 정보로 기사 레코드 생성
+
+        Args:
+            headline (dict): 헤드라인 정보 (title, url)
+            site (dict): 뉴스 사이트 정보 (name, country)
+            content (str): 기사 본문
+
+        Returns:
+            Article: 생성된 기사 레코드
+        """
+        return cls(
+            title=headline["title"],
+            url=headline["url"],
+            site=site["name"],
+            country=site["country"],
+            content=content
+        )
+
+    @property
+    def content(self):
+        """기사 본문 (임시 파일로 내보낸 경우 파일에서 다시 읽음)"""
+        if self._content is None and self._content_path:
+            with open(self._content_path, "r", encoding="utf-8") as f:
+                return f.read()
+        return self._content or ""
+
+    @content.setter
+    def content(self, value):
+        self.discard_spill()
+        self._content = value
+
+    @property
+    def content_released(self):
+        """본문이 메모리에서 해제되었는지 여부"""
+        return self._content is None
+
+    def release_content(self, spill=False):
+        """
+        본문을 메모리에서 해제
+
+        Args:
+            spill (bool): True이면 해제 전에 임시 파일로 내보내 이후에도 읽을 수 있게 함
+        """
+        if self._content is None:
+            return
+
+        if spill and self._content:
+            fd, path = tempfile.mkstemp(prefix="newsscrap-article-", suffix=".txt")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self._content)
+            self._content_path = path
+
+        self._content = None
+
+    def discard_spill(self):
+        """임시 파일로 내보낸 본문이 있으면 삭제"""
+        if self._content_path:
+            try:
+                os.remove(self._content_path)
+            except OSError:
+                pass
+            self._content_path = None
+
+    def to_result(self):
+        """
+        처리 결과 dict 반환
+
+        Returns:
+            dict: 제목, 사이트, 국가, 요약, Notion 페이지 ID, 단계별 소요 시간(초)
+        """
+        return {
+            "title": self.title,
+            "site": self.site,
+            "country": self.country,
+            "url": self.url,
+            "summary": self.summary,
+            "notion_page_id": self.notion_page_id,
+            "timings": dict(self.timings)
+        }
+
+    def __repr__(self):
+        return f"Article(title={self.title!r}, site={self.site!r}, country={self.country!r})"
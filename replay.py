@@ -0,0 +1,67 @@
+import json
+import argparse
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv()
+
+from services.replay import replay_archive
+
+def main():
+    parser = argparse.ArgumentParser(description='저장된 페이지로 추출/요약 파이프라인 리플레이')
+    parser.add_argument('--archive-dir', default=None, help='아카이브 디렉터리 (기본값: ARCHIVE_DIR)')
+    parser.add_argument('--limit', type=int, default=None, help='최대 항목 수')
+    parser.add_argument('--workers', type=int, default=None, help='동시 처리 스레드 수')
+    parser.add_argument('--summarize', action='store_true', help='본문을 다시 요약해 원본 요약과 비교 (OpenAI API 호출)')
+    parser.add_argument('--show-diff', action='store_true', help='항목별 diff 출력')
+    parser.add_argument('--json', action='store_true', help='전체 리포트를 JSON으로 출력')
+    
+    args = parser.parse_args()
+    
+    report = replay_archive(
+        directory=args.archive_dir,
+        limit=args.limit,
+        workers=args.workers,
+        summarize=args.summarize
+    )
+    
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+    
+    print(f"항목: {report['items']} (기사 {report['articles']}, 메인 페이지 {report['front_pages']})")
+    print(f"소요 시간: {report['elapsed']}초, 처리량: {report['throughput']}건/초")
+    print(f"본문 변경: {report['content_changed']}건, 요약 변경: {report['summary_changed']}건, 헤드라인 변경: {report['headlines_changed']}건")
+    
+    for result in report['results']:
+        if result['type'] == 'headlines':
+            diff = result['headlines_diff']
+            state = '원본 기록 없음' if diff is None else ('변경됨' if diff['changed'] else '변경 없음')
+            print(f"\n[메인] {result['url']}: 헤드라인 {len(result['headlines'])}개 ({result['source']}, {state})")
+            for headline in result['headlines']:
+                print(f"  - {headline['title']} ({headline['url']})")
+            if args.show_diff and diff:
+                for headline in diff['removed']:
+                    print(f"  - [삭제] {headline['title']} ({headline['url']})")
+                for headline in diff['added']:
+                    print(f"  + [추가] {headline['title']} ({headline['url']})")
+            continue
+        
+        content = result.get('content')
+        if content is None:
+            print(f"\n[기사] {result['url']}: 원본 HTML 없음 (저장된 본문으로 요약)")
+        else:
+            print(f"\n[기사] {result['url']}: 본문 유사도 {content['similarity']}{' (변경됨)' if content['changed'] else ''}")
+            if args.show_diff:
+                for line in content['diff']:
+                    print(f"  {line}")
+        
+        if 'summary' in result:
+            summary = result['summary']
+            print(f"  요약 유사도 {summary['similarity']}{' (변경됨)' if summary['changed'] else ''}")
+            if args.show_diff:
+                for line in summary['diff']:
+                    print(f"  {line}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,311 @@
+import os
+import json
+import mmap
+import time
+import glob
+import struct
+import hashlib
+import threading
+import zstandard
+from utils.logger import logger
+from config import Config
+
+# 인덱스 엔트리: URL 해시(8) + 수집 시각 ms(8) + 오프셋(8) + 길이(4) + 종류(1)
+INDEX_ENTRY = struct.Struct("<QqQIB")
+
+# 레코드 종류
+KIND_HTML = 1
+KIND_CONTENT = 2
+KIND_SUMMARY = 3
+# 메인 페이지 HTML에서 추출한 헤드라인 ({"source": 추출 경로, "headlines": 목록})
+KIND_HEADLINES = 4
+KINDS = {"html": KIND_HTML, "content": KIND_CONTENT, "summary": KIND_SUMMARY, "headlines": KIND_HEADLINES}
+KIND_NAMES = {value: name for name, value in KINDS.items()}
+
+
+def url_key(url):
+    """URL을 8바이트 정수 키로 변환"""
+    return int.from_bytes(hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _segment_paths(directory):
+    """세그먼트 파일 경로 목록 (오래된 순)"""
+    return sorted(glob.glob(os.path.join(directory, "segment-*.zst")))
+
+
+def _index_path(segment_path):
+    """세그먼트 파일에 대응하는 인덱스 파일 경로"""
+    return segment_path[:-len(".zst")] + ".idx"
+
+
+class PageArchive:
+    """원본 HTML, 추출 본문, 요약을 저장하는 추가 전용(append-only) 압축 아카이브
+
+    레코드마다 독립된 zstd 프레임으로 압축해 세그먼트 파일 끝에 추가하고,
+    URL 해시와 수집 시각으로 찾을 수 있도록 고정 크기 인덱스 엔트리를
+    별도 파일에 기록합니다. 세그먼트가 일정 크기를 넘으면 새 세그먼트로
+    교체하고, 전체 크기가 보존 한도를 넘으면 가장 오래된 세그먼트를 삭제합니다.
+    """
+
+    def __init__(self, directory=None, enabled=None, segment_max_bytes=None, max_total_bytes=None, level=None):
+        """아카이브 초기화 (세그먼트 파일은 첫 기록 시 생성)"""
+        self.directory = directory or Config.Archive.DIR
+        self.enabled = Config.Archive.ENABLED if enabled is None else enabled
+        self.segment_max_bytes = segment_max_bytes or Config.Archive.SEGMENT_MAX_BYTES
+        self.max_total_bytes = max_total_bytes or Config.Archive.MAX_TOTAL_BYTES
+        self.compressor = zstandard.ZstdCompressor(level=level or Config.Archive.COMPRESSION_LEVEL)
+
+        self._lock = threading.Lock()
+        self._segment = None
+        self._index = None
+        self._segment_path = None
+
+    def append(self, url, kind, data, crawled_at=None):
+        """
+        레코드를 아카이브에 추가 (비활성화 상태면 아무것도 하지 않음)
+
+        Args:
+            url (str): 페이지 URL
+            kind (str): 레코드 종류 ("html", "content", "summary", "headlines")
+            data (str|dict): 저장할 내용 (JSON으로 직렬화 가능한 값)
+            crawled_at (float): 수집 시각 (epoch 초, 생략 시 현재 시각)
+        """
+        if not self.enabled or not data:
+            return
+
+        try:
+            crawled_at = crawled_at or time.time()
+            payload = json.dumps({
+                "url": url,
+                "kind": kind,
+                "crawled_at": crawled_at,
+                "data": data
+            }, ensure_ascii=False).encode("utf-8")
+            frame = self.compressor.compress(payload)
+
+            with self._lock:
+                self._ensure_segment()
+                offset = self._segment.tell()
+                self._segment.write(frame)
+                self._segment.flush()
+                self._index.write(INDEX_ENTRY.pack(
+                    url_key(url), int(crawled_at * 1000), offset, len(frame), KINDS[kind]
+                ))
+                self._index.flush()
+
+                if self._segment.tell() >= self.segment_max_bytes:
+                    self._rotate()
+
+        except Exception as error:
+            # 아카이브 실패는 크롤링을 중단시키지 않음
+            logger.error("아카이브 기록 실패 (%s): %s", url, error)
+
+    def close(self):
+        """열린 세그먼트와 인덱스 파일 닫기"""
+        with self._lock:
+            self._close_files()
+
+    def _ensure_segment(self):
+        """기록할 세그먼트가 없으면 마지막 세그먼트를 열거나 새로 생성"""
+        if self._segment is not None:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        segments = _segment_paths(self.directory)
+
+        if segments and os.path.getsize(segments[-1]) < self.segment_max_bytes:
+            path = segments[-1]
+        else:
+            path = self._next_segment_path(segments)
+
+        self._open(path)
+
+    def _next_segment_path(self, segments):
+        """다음 세그먼트 파일 경로 생성"""
+        sequence = 0
+        if segments:
+            sequence = int(os.path.basename(segments[-1])[len("segment-"):-len(".zst")]) + 1
+        return os.path.join(self.directory, f"segment-{sequence:08d}.zst")
+
+    def _open(self, path):
+        self._segment = open(path, "ab")
+        self._index = open(_index_path(path), "ab")
+        self._segment_path = path
+
+        # 이전 실행이 엔트리 기록 도중 중단됐으면 남은 조각을 잘라 이후 엔트리 정렬 유지
+        size = self._index.tell()
+        partial = size % INDEX_ENTRY.size
+        if partial:
+            self._index.truncate(size - partial)
+            logger.warning("아카이브 인덱스 끝의 불완전한 엔트리 제거 (%s바이트): %s", partial, _index_path(path))
+
+    def _close_files(self):
+        for handle in (self._segment, self._index):
+            if handle is not None:
+                handle.close()
+        self._segment = None
+        self._index = None
+        self._segment_path = None
+
+    def _rotate(self):
+        """현재 세그먼트를 닫고 새 세그먼트를 연 뒤 보존 한도 적용"""
+        self._close_files()
+        segments = _segment_paths(self.directory)
+        self._open(self._next_segment_path(segments))
+        self._apply_retention()
+
+    def _apply_retention(self):
+        """전체 크기가 한도를 넘으면 가장 오래된 세그먼트부터 삭제"""
+        segments = _segment_paths(self.directory)
+        sizes = {path: os.path.getsize(path) for path in segments}
+        total = sum(sizes.values())
+
+        for path in segments:
+            if total <= self.max_total_bytes or path == self._segment_path:
+                break
+
+            os.remove(path)
+            if os.path.exists(_index_path(path)):
+                os.remove(_index_path(path))
+            total -= sizes[path]
+            logger.info("아카이브 보존 한도 초과로 세그먼트 삭제: %s", os.path.basename(path))
+
+
+class ArchiveReader:
+    """메모리 맵 기반 아카이브 읽기 클래스
+
+    열 때 모든 인덱스 파일을 읽어 URL 키별 엔트리 목록을 만들고,
+    세그먼트 파일은 mmap으로 열어 필요한 프레임만 잘라 압축을 풉니다.
+    """
+
+    def __init__(self, directory=None):
+        """
+        아카이브 읽기 초기화
+
+        Args:
+            directory (str): 아카이브 디렉터리 (생략 시 설정값 사용)
+        """
+        self.directory = directory or Config.Archive.DIR
+        self.decompressor = zstandard.ZstdDecompressor()
+        self._maps = {}
+        self._entries = {}
+        self._load_index()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _load_index(self):
+        """모든 인덱스 파일을 읽어 URL 키별 엔트리 목록 구성"""
+        for segment_path in _segment_paths(self.directory):
+            index_path = _index_path(segment_path)
+            if not os.path.exists(index_path):
+                continue
+
+            with open(index_path, "rb") as f:
+                raw = f.read()
+
+            # 기록 도중 중단된 마지막 엔트리는 무시
+            usable = len(raw) - len(raw) % INDEX_ENTRY.size
+            for key, crawled_ms, offset, length, kind in INDEX_ENTRY.iter_unpack(raw[:usable]):
+                self._entries.setdefault(key, []).append((crawled_ms, kind, segment_path, offset, length))
+
+        for entries in self._entries.values():
+            entries.sort()
+
+    def _map(self, segment_path, end):
+        """세그먼트 파일의 메모리 맵 반환 (파일이 커졌으면 다시 매핑)"""
+        mapped = self._maps.get(segment_path)
+        if mapped is None or len(mapped) < end:
+            if mapped is not None:
+                mapped.close()
+            with open(segment_path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment_path] = mapped
+        return mapped
+
+    def _read(self, segment_path, offset, length):
+        mapped = self._map(segment_path, offset + length)
+        payload = self.decompressor.decompress(mapped[offset:offset + length])
+        return json.loads(payload)
+
+    def get(self, url, kind="html", at=None):
+        """
+        URL의 레코드 조회
+
+        Args:
+            url (str): 페이지 URL
+            kind (str): 레코드 종류 ("html", "content", "summary", "headlines")
+            at (float): 이 시각(epoch 초) 이전의 가장 최근 레코드를 조회 (생략 시 최신)
+
+        Returns:
+            dict: 레코드 (url, kind, crawled_at, data) 또는 None
+        """
+        wanted = KINDS[kind]
+        limit = int(at * 1000) if at is not None else None
+
+        for crawled_ms, entry_kind, segment_path, offset, length in reversed(self._entries.get(url_key(url), [])):
+            if entry_kind != wanted or (limit is not None and crawled_ms > limit):
+                continue
+            if not os.path.exists(segment_path):
+                continue
+
+            record = self._read(segment_path, offset, length)
+            # 해시 충돌 방지를 위해 실제 URL 확인
+            if record["url"] == url:
+                return record
+
+        return None
+
+    def iter_urls(self):
+        """
+        아카이브에 기록된 URL을 처음 기록된 순서대로 반환
+
+        인덱스에는 URL 해시만 있으므로 URL별로 가장 작은 레코드 하나만 풀어서 URL을 얻습니다.
+
+        Yields:
+            str: 페이지 URL
+        """
+        firsts = []
+        for url_entries in self._entries.values():
+            available = [entry for entry in url_entries if os.path.exists(entry[2])]
+            if available:
+                smallest = min(available, key=lambda entry: entry[4])
+                firsts.append((available[0][0], smallest))
+
+        for _, (_, _, segment_path, offset, length) in sorted(firsts, key=lambda item: item[0]):
+            yield self._read(segment_path, offset, length)["url"]
+
+    def iter_records(self, kind=None):
+        """
+        아카이브의 모든 레코드를 기록 순서대로 반환
+
+        Args:
+            kind (str): 특정 종류만 반환 (생략 시 전체)
+
+        Yields:
+            dict: 레코드 (url, kind, crawled_at, data)
+        """
+        wanted = KINDS[kind] if kind else None
+        entries = [
+            (segment_path, offset, length)
+            for url_entries in self._entries.values()
+            for _, entry_kind, segment_path, offset, length in url_entries
+            if wanted is None or entry_kind == wanted
+        ]
+
+        for segment_path, offset, length in sorted(entries):
+            if os.path.exists(segment_path):
+                yield self._read(segment_path, offset, length)
+
+    def close(self):
+        """열린 메모리 맵 닫기"""
+        for mapped in self._maps.values():
+            mapped.close()
+        self._maps = {}
+
+
+# 싱글톤 인스턴스
+page_archive = PageArchive()
@@ -1,16 +1,25 @@
+import time
+import uuid
+import queue
 import random
 import asyncio
-import aiohttp
-from datetime import datetime
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
+import threading
 
-from utils.logger import logger
+from utils.logger import logger, log_context
 from config import Config
+from models.article import Article
 from services.firecrawl import firecrawl
 from services.summarizer import summarizer
 from services.notion import notion_service
+from services.archive import page_archive
+from services.feeds import feed_service
+from services.page_cache import PageCache, current_page_cache
+from services.http import get_session, close_session
+from services.parser_pool import parser_pool
+from services.translator import title_translator
+
+# 메인 페이지 헤드라인 선택자 (사이트마다 다를 수 있음)
+HEADLINE_SELECTORS = ["h1 a", "h2 a", "h3 a", "article a", ".headline a", ".title a"]
 
 def select_random_countries(count):
     """
@@ -58,7 +67,7 @@ def get_news_sites_for_countries(countries):
 
 async def extract_headlines(site):
     """
-    헤드라인 추출 - FireCrawl API 또는 BeautifulSoup 사용
+    헤드라인 추출 - RSS/Atom 피드 우선, 실패 시 FireCrawl API 또는 BeautifulSoup 사용
     
     Args:
         site (dict): 뉴스 사이트 정보
@@ -66,15 +75,20 @@ async def extract_headlines(site):
     Returns:
         list: 헤드라인 목록
     """
-    logger.info(f"{site['name']}({site['country']}) 헤드라인 추출 시작")
+    logger.info("%s(%s) 헤드라인 추출 시작", site['name'], site['country'])
+    
+    # 피드/사이트맵에서 먼저 시도 (수 KB의 구조화된 데이터로 LLM 추출 불필요)
+    headlines = await feed_service.get_headlines(site)
+    if headlines:
+        return headlines
     
     try:
-        # FireCrawl API 사용 시도 (LLM 프롬프팅 방식)
-        result = firecrawl.scrape({
+        # FireCrawl API 사용 시도 (LLM 프롬프팅 방식, 이벤트 루프를 막지 않도록 스레드에서 실행)
+        result = await asyncio.to_thread(firecrawl.scrape, {
             "url": site["url"],
             "formats": ["extract"],
             "extract": {
-                "prompt": "이 뉴스 사이트의 메인 페이지에서 오늘의 가장 중요한 뉴스 헤드라인 5개를 찾아줘. 각 헤드라인의 제목과 링크가 필요해. 뉴스 제목은 'title' 필드에, 링크는 'url' 필드에 담아서 결과를 JSON 배열로 반환해줘.",
+                "prompt": Config.FireCrawl.HEADLINE_PROMPT,
                 "schema": {
                     "type": "array",
                     "items": {
@@ -93,14 +107,14 @@ async def extract_headlines(site):
         headlines = result.get("result", {}).get("extract", [])
         
         if headlines and len(headlines) > 0:
-            logger.info(f"{site['name']}에서 {len(headlines)}개 헤드라인 추출 완료 (FireCrawl API 사용)")
+            logger.info("%s에서 %s개 헤드라인 추출 완료 (FireCrawl API 사용)", site['name'], len(headlines))
             return headlines[:Config.Crawler.HEADLINES_PER_SITE]
         
         # FireCrawl 실패 시 BeautifulSoup 사용
         return await scrape_headlines(site["url"])
     
     except Exception as error:
-        logger.error(f"FireCrawl API 헤드라인 추출 실패 ({site['name']}): {str(error)}")
+        logger.error("FireCrawl API 헤드라인 추출 실패 (%s): %s", site['name'], error)
         # 실패 시 BeautifulSoup 사용하여 백업 추출
         return await scrape_headlines(site["url"])
 
@@ -115,219 +129,454 @@ async def scrape_headlines(url):
         list: 헤드라인 목록
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = {"User-Agent": Config.Crawler.USER_AGENT}
+        session = get_session()
+        headers = {"User-Agent": Config.Crawler.USER_AGENT}
+        
+        async with session.get(url, headers=headers, timeout=Config.Crawler.TIMEOUT/1000) as response:
+            if response.status != 200:
+                logger.error("BeautifulSoup 헤드라인 스크랩 실패: %s - 상태 코드 %s", url, response.status)
+                return []
+            
+            # 원본 바이트를 그대로 파싱 워커에 넘김 (문자열 변환은 보관할 때만 수행)
+            raw = await response.read()
+            if page_archive.enabled:
+                page_archive.append(url, "html", raw.decode(response.charset or "utf-8", errors="replace"))
+            
+            headlines = await parser_pool.aparse(
+                "headlines", raw, url,
+                selectors=HEADLINE_SELECTORS,
+                limit=Config.Crawler.HEADLINES_PER_SITE
+            )
+            
+            logger.info("BeautifulSoup로 %s개 헤드라인 추출 완료: %s", len(headlines), url)
+            page_archive.append(url, "headlines", {"source": "scrape", "headlines": headlines})
+            
+            # 기사 페이지를 미리 받아 둠 (본문 추출이 직접 크롤링으로 대체될 때 사용)
+            page_cache = current_page_cache()
+            if page_cache:
+                page_cache.prefetch([headline["url"] for headline in headlines])
+            return headlines
             
-            async with session.get(url, headers=headers, timeout=Config.Crawler.TIMEOUT/1000) as response:
-                if response.status != 200:
-                    logger.error(f"BeautifulSoup 헤드라인 스크랩 실패: {url} - 상태 코드 {response.status}")
-                    return []
-                
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-                headlines = []
-                
-                # 헤드라인 선택자는 사이트마다 다를 수 있음
-                selectors = ["h1 a", "h2 a", "h3 a", "article a", ".headline a", ".title a"]
-                
-                for selector in selectors:
-                    elements = soup.select(selector)
-                    
-                    for element in elements:
-                        if len(headlines) >= Config.Crawler.HEADLINES_PER_SITE:
-                            break
-                        
-                        title = element.get_text().strip()
-                        href = element.get("href", "")
-                        
-                        # 상대 경로인 경우 기본 URL과 결합
-                        if href and not href.startswith(("http://", "https://")):
-                            href = urljoin(url, href)
-                        
-                        if title and href and not any(h["title"] == title for h in headlines):
-                            headlines.append({
-                                "title": title,
-                                "url": href
-                            })
-                
-                logger.info(f"BeautifulSoup로 {len(headlines)}개 헤드라인 추출 완료: {url}")
-                return headlines
-                
     except Exception as error:
-        logger.error(f"BeautifulSoup 헤드라인 스크랩 실패: {url} - {str(error)}")
+        logger.error("BeautifulSoup 헤드라인 스크랩 실패: %s - %s", url, error)
         return []
 
-async def extract_article_content(headline, site):
+def _content_scrape_options():
+    """
+    기사 본문 추출용 FireCrawl 옵션 (url 제외)
+    
+    Returns:
+        dict: formats, extract 옵션
+    """
+    return {
+        "formats": ["extract"],
+        "extract": {
+            "prompt": "이 뉴스 기사의 본문 내용만 추출해주세요. 광고나 관련기사 링크, 댓글 섹션은 제외합니다. 기사 본문만 텍스트로 반환해주세요.",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "content": {"type": "string", "description": "뉴스 기사 본문 내용"}
+                },
+                "required": ["content"]
+            }
+        }
+    }
+
+async def extract_article_content(headline, site, result=None):
     """
     기사 내용 추출 - FireCrawl API 사용
     
     Args:
         headline (dict): 헤드라인 정보
         site (dict): 뉴스 사이트 정보
+        result (dict): 배치 스크래핑으로 미리 받은 결과 (없으면 개별 요청)
         
     Returns:
-        dict: 추출된 기사 정보
+        Article: 추출된 기사 레코드
     """
-    logger.info(f"기사 내용 추출 시작: {headline['title']}")
+    logger.info("기사 내용 추출 시작: %s", headline['title'])
     
     try:
-        # FireCrawl API로 기사 내용 추출
-        result = firecrawl.scrape({
-            "url": headline["url"],
-            "formats": ["extract"],
-            "extract": {
-                "prompt": "이 뉴스 기사의 본문 내용만 추출해주세요. 광고나 관련기사 링크, 댓글 섹션은 제외합니다. 기사 본문만 텍스트로 반환해주세요.",
-                "schema": {
-                    "type": "object",
-                    "properties": {
-                        "content": {"type": "string", "description": "뉴스 기사 본문 내용"}
-                    },
-                    "required": ["content"]
-                }
-            }
-        })
+        # FireCrawl API로 기사 내용 추출 (배치 결과가 없을 때만 개별 요청)
+        if result is None:
+            result = await asyncio.to_thread(firecrawl.scrape, {"url": headline["url"], **_content_scrape_options()})
         
         # 추출된 본문 내용
         content = result.get("result", {}).get("extract", {}).get("content", "")
         
         if not content:
-            logger.warn(f"기사 내용을 추출할 수 없음: {headline['title']}")
+            logger.warning("기사 내용을 추출할 수 없음: %s", headline['title'])
             return None
         
-        logger.info(f"기사 내용 추출 완료: {headline['title']} ({len(content)} 글자)")
+        logger.info("기사 내용 추출 완료: %s (%s 글자)", headline['title'], len(content))
+        page_archive.append(headline["url"], "content", content)
         
-        return {
-            **headline,
-            "site": site["name"],
-            "country": site["country"],
-            "content": content,
-            "crawled_at": datetime.now().isoformat()
-        }
+        return Article.from_headline(headline, site, content)
     
     except Exception as error:
-        logger.error(f"기사 내용 추출 실패 ({headline['title']}): {str(error)}")
+        logger.error("기사 내용 추출 실패 (%s): %s", headline['title'], error)
         return None
 
-async def process_article(headline, site):
+def _log_stage_done(started):
+    """
+    현재 단계의 소요 시간을 구조화 로그로 남기고 반환
+    
+    Args:
+        started (float): 단계 시작 시각 (time.perf_counter)
+        
+    Returns:
+        float: 소요 시간 (초)
+    """
+    duration = round(time.perf_counter() - started, 3)
+    logger.info("단계 완료 (%s초)", duration, extra={"duration": duration})
+    return duration
+
+async def process_article(headline, site, scraped=None):
     """
     단일 기사 처리 (내용 추출 -> 요약 -> Notion 저장)
     
     Args:
         headline (dict): 헤드라인 정보
         site (dict): 사이트 정보
+        scraped (dict): 배치 스크래핑으로 미리 받은 결과
         
     Returns:
         dict: 처리 결과
     """
     try:
         # 1. 기사 내용 추출
-        article = await extract_article_content(headline, site)
-        if not article:
-            return None
+        with log_context(stage="extract"):
+            started = time.perf_counter()
+            article = await extract_article_content(headline, site, scraped)
+            if not article:
+                return None
+            article.timings["extract"] = _log_stage_done(started)
         
-        # 2. GPT-3.5-turbo로 요약 (스레드 풀에서 실행)
-        with ThreadPoolExecutor() as executor:
-            summary_future = executor.submit(summarizer.summarize_article, article)
-            summary = summary_future.result()
+        # 2. GPT-3.5-turbo로 요약 (이벤트 루프를 막지 않도록 스레드에서 실행, 로그 컨텍스트 전달됨)
+        with log_context(stage="summarize"):
+            started = time.perf_counter()
+            summary = await asyncio.to_thread(summarizer.summarize_article, article)
+            article.timings["summarize"] = _log_stage_done(started)
         
         if not summary:
+            article.release_content()
             return None
         
-        # 3. Notion에 저장 (스레드 풀에서 실행)
-        with ThreadPoolExecutor() as executor:
-            notion_future = executor.submit(notion_service.save_to_notion, {
-                **article,
-                "summary": summary
-            })
-            notion_page = notion_future.result()
+        # 요약이 끝난 본문 해제 (설정 시 임시 파일로 보관)
+        # Notion에 본문을 저장하는 경우 임시 파일로 보관하지 않으면 저장 후 해제
+        article.summary = summary
+        page_archive.append(article.url, "summary", summary)
+        if Config.Crawler.SPILL_ARTICLE_CONTENT or not Config.Notion.WRITE_CONTENT:
+            article.release_content(spill=Config.Crawler.SPILL_ARTICLE_CONTENT)
         
-        logger.info(f"기사 처리 완료: {headline['title']}")
-        return {
-            "title": headline["title"],
-            "summary": summary,
-            "notion_page_id": notion_page["id"] if notion_page else None
-        }
+        # 3. Notion에 저장 (스레드에서 실행, 로그 컨텍스트 전달됨)
+        with log_context(stage="notion"):
+            started = time.perf_counter()
+            notion_page = await asyncio.to_thread(notion_service.save_to_notion, article)
+            article.timings["notion"] = _log_stage_done(started)
+        
+        article.notion_page_id = notion_page["id"] if notion_page else None
+        article.release_content()
+        article.discard_spill()
+        
+        logger.info("기사 처리 완료: %s", headline['title'])
+        return article.to_result()
     
     except Exception as error:
-        logger.error(f"기사 처리 실패 ({headline['title']}): {str(error)}")
+        logger.error("기사 처리 실패 (%s): %s", headline['title'], error)
         return None
 
-async def process_site(site):
+async def translate_titles(items):
+    """
+    헤드라인 제목을 한국어로 번역 (번역 캐시 사용, 스레드에서 실행)
+    
+    피드, FireCrawl, 직접 크롤링 중 어느 경로로 추출했든 같은 제목은 같은 번역을 사용합니다.
+    
+    Args:
+        items (list): (헤드라인 dict, 사이트 정보) 목록
+    """
+    if not items:
+        return
+    
+    with log_context(stage="translate"):
+        started = time.perf_counter()
+        await asyncio.to_thread(title_translator.translate_headlines, items)
+        _log_stage_done(started)
+
+async def process_site(site, on_result=None):
     """
     단일 뉴스 사이트 처리
     
     Args:
         site (dict): 뉴스 사이트 정보
+        on_result (callable): 기사 처리가 끝날 때마다 결과 dict로 호출할 콜백
         
     Returns:
         list: 처리된 기사 목록
     """
     # 1. 헤드라인 추출
-    headlines = await extract_headlines(site)
+    with log_context(stage="headlines"):
+        started = time.perf_counter()
+        headlines = await extract_headlines(site)
+        headline_time = _log_stage_done(started)
     
     if not headlines or len(headlines) == 0:
-        logger.warn(f"{site['name']}에서 헤드라인을 추출할 수 없음")
+        logger.warning("%s에서 헤드라인을 추출할 수 없음", site['name'])
         return []
     
+    await translate_titles([(headline, site) for headline in headlines])
+    
     # 2. 각 기사 처리 (내용 추출, 요약, Notion 저장)
     results = []
     for headline in headlines:
         result = await process_article(headline, site)
         if result:
+            result["timings"] = {"headlines": headline_time, **result["timings"]}
             results.append(result)
+            if on_result:
+                on_result(result)
     
     return results
 
-def start_crawling_process():
+def select_sites():
     """
-    뉴스 사이트 크롤링 프로세스 시작
+    이번 실행에서 처리할 뉴스 사이트 선택
     
     Returns:
-        list: 처리 결과
+        list: 뉴스 사이트 정보 목록
     """
-    logger.info("뉴스 크롤링 프로세스 시작")
-    
     # 랜덤 국가 선택
     selected_countries = select_random_countries(Config.Crawler.RANDOM_COUNTRIES)
-    logger.info(f"선택된 국가: {', '.join(selected_countries)}")
+    logger.info("선택된 국가: %s", ', '.join(selected_countries))
     
     # 선택된 국가의 뉴스 사이트 가져오기
     sites = get_news_sites_for_countries(selected_countries)
-    logger.info(f"총 {len(sites)}개의 뉴스 사이트를 처리합니다.")
+    logger.info("총 %s개의 뉴스 사이트를 처리합니다.", len(sites))
+    return sites
+
+async def crawl_sites(sites, on_result=None):
+    """
+    여러 뉴스 사이트를 동시성 제한 하에 처리
     
-    # 비동기 처리를 위한 이벤트 루프 생성
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    배치 스크래핑은 모든 사이트의 헤드라인 추출과 배치 작업이 끝나야 첫 기사를 처리할 수 있어
+    (최대 BATCH_TIMEOUT), 결과를 기사 단위로 바로 보내야 하는 스트리밍 요청(on_result 지정)은
+    사이트별 개별 처리를 사용합니다.
     
-    # 사이트 처리를 비동기로 실행
-    try:
-        # 사이트 처리 태스크 생성
-        tasks = [process_site(site) for site in sites]
-        
-        # 병렬 처리 (동시성 제한 적용)
-        semaphore = asyncio.Semaphore(Config.Crawler.CONCURRENCY)
+    Args:
+        sites (list): 뉴스 사이트 정보 목록
+        on_result (callable): 기사 처리가 끝날 때마다 결과 dict로 호출할 콜백
         
-        async def process_with_semaphore(task):
-            async with semaphore:
-                return await task
+    Returns:
+        list: 처리 결과
+    """
+    if Config.FireCrawl.BATCH_ENABLED and on_result is None:
+        return await _crawl_sites_batched(sites)
+    
+    # 병렬 처리 (동시성 제한 적용)
+    semaphore = asyncio.Semaphore(Config.Crawler.CONCURRENCY)
+    
+    async def process_with_semaphore(site):
+        async with semaphore:
+            with log_context(site=site["name"]):
+                return await process_site(site, on_result)
+    
+    # 모든 태스크 실행 및 결과 수집
+    site_results = await asyncio.gather(*[process_with_semaphore(site) for site in sites])
+    
+    # 결과 병합
+    all_results = []
+    for result in site_results:
+        all_results.extend(result)
+    
+    return all_results
+
+async def _crawl_sites_batched(sites, on_result=None):
+    """
+    모든 사이트의 헤드라인을 먼저 모은 뒤 기사 본문을 한 번의 배치 요청으로 스크래핑
+    
+    배치에서 결과를 받지 못한 기사는 process_article에서 개별 요청으로 처리됩니다.
+    
+    Args:
+        sites (list): 뉴스 사이트 정보 목록
+        on_result (callable): 기사 처리가 끝날 때마다 결과 dict로 호출할 콜백
         
-        # 모든 태스크 실행 및 결과 수집
-        site_results = loop.run_until_complete(
-            asyncio.gather(*[process_with_semaphore(task) for task in tasks])
+    Returns:
+        list: 처리 결과
+    """
+    semaphore = asyncio.Semaphore(Config.Crawler.CONCURRENCY)
+    
+    # 1. 헤드라인 추출
+    async def headlines_for(site):
+        async with semaphore:
+            with log_context(site=site["name"], stage="headlines"):
+                started = time.perf_counter()
+                headlines = await extract_headlines(site)
+                if not headlines:
+                    logger.warning("%s에서 헤드라인을 추출할 수 없음", site['name'])
+                return site, headlines or [], _log_stage_done(started)
+    
+    site_headlines = await asyncio.gather(*[headlines_for(site) for site in sites])
+    jobs = [
+        (site, headline, headline_time)
+        for site, headlines, headline_time in site_headlines
+        for headline in headlines
+    ]
+    
+    # 제목 번역 (모든 사이트의 캐시에 없는 제목을 한 번에 요청)
+    await translate_titles([(headline, site) for site, headline, _ in jobs])
+    
+    # 2. 기사 본문 배치 스크래핑
+    with log_context(stage="batch_extract"):
+        started = time.perf_counter()
+        scraped = await asyncio.to_thread(
+            firecrawl.batch_scrape,
+            list(dict.fromkeys(headline["url"] for _, headline, _ in jobs)),
+            _content_scrape_options()
         )
+        _log_stage_done(started)
+    
+    # 3. 각 기사 처리 (요약, Notion 저장 - 배치 실패분은 개별 추출)
+    async def process_with_semaphore(site, headline, headline_time):
+        async with semaphore:
+            with log_context(site=site["name"]):
+                result = await process_article(headline, site, scraped.get(headline["url"]))
+        if result:
+            result["timings"] = {"headlines": headline_time, **result["timings"]}
+            if on_result:
+                on_result(result)
+        return result
+    
+    results = await asyncio.gather(*[process_with_semaphore(*job) for job in jobs])
+    return [result for result in results if result]
+
+async def _crawl_with_page_cache(sites, on_result=None):
+    """실행 단위 페이지 캐시를 연 상태로 crawl_sites 실행 (종료 시 남은 프리페치 취소)"""
+    if not Config.Prefetch.ENABLED:
+        return await crawl_sites(sites, on_result)
+    
+    async with PageCache():
+        return await crawl_sites(sites, on_result)
+
+async def run_crawling_process(on_result=None):
+    """
+    현재 이벤트 루프에서 뉴스 사이트 크롤링 실행 (ASGI 서버에서 직접 호출)
+    
+    Args:
+        on_result (callable): 기사 처리가 끝날 때마다 결과 dict로 호출할 콜백
         
-        # 결과 병합
-        all_results = []
-        for result in site_results:
-            all_results.extend(result)
+    Returns:
+        list: 처리 결과
+    """
+    with log_context(run_id=uuid.uuid4().hex[:12]):
+        logger.info("뉴스 크롤링 프로세스 시작")
+        
+        try:
+            sites = select_sites()
+            all_results = await _crawl_with_page_cache(sites, on_result)
+            
+            # 긴 기사의 남은 본문 블록 추가가 끝날 때까지 대기
+            await asyncio.to_thread(notion_service.flush)
+            
+            logger.info("크롤링 프로세스 완료: 총 %s개 기사 처리됨", len(all_results))
+            return all_results
         
-        logger.info(f"크롤링 프로세스 완료: 총 {len(all_results)}개 기사 처리됨")
-        return all_results
+        except Exception as error:
+            logger.error("크롤링 프로세스 오류: %s", error)
+            return []
+
+def start_crawling_process(on_result=None):
+    """
+    뉴스 사이트 크롤링 프로세스 시작 (새 이벤트 루프를 만들어 동기 실행)
     
-    except Exception as error:
-        logger.error(f"크롤링 프로세스 오류: {str(error)}")
-        return []
+    Args:
+        on_result (callable): 기사 처리가 끝날 때마다 결과 dict로 호출할 콜백
+        
+    Returns:
+        list: 처리 결과
+    """
+    # 비동기 처리를 위한 이벤트 루프 생성
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    
+    async def run():
+        try:
+            return await run_crawling_process(on_result)
+        finally:
+            # 이 루프에서 만든 공유 HTTP 세션 닫기
+            await close_session()
+    
+    try:
+        return loop.run_until_complete(run())
     
     finally:
         # 이벤트 루프 닫기
-        loop.close() 
\ No newline at end of file
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+def stream_crawling_process():
+    """
+    크롤링 결과를 기사 단위로 생성하는 제너레이터
+    
+    크롤링은 별도 스레드에서 실행되고, 기사 하나의 요약과 Notion 저장이
+    끝날 때마다 결과가 즉시 반환됩니다. 마지막 항목은 전체 처리 건수를
+    담은 완료 이벤트입니다.
+    
+    Yields:
+        dict: 기사 결과 ({"event": "article", ...}) 또는 완료 이벤트 ({"event": "done", ...})
+    """
+    results_queue = queue.Queue()
+    done = object()
+    
+    def on_result(result):
+        results_queue.put({"event": "article", **result})
+    
+    def run():
+        try:
+            results = start_crawling_process(on_result)
+            results_queue.put({"event": "done", "processed": len(results)})
+        except Exception as error:
+            results_queue.put({"event": "error", "error": str(error)})
+        finally:
+            results_queue.put(done)
+    
+    worker = threading.Thread(target=run, name="crawl-stream", daemon=True)
+    worker.start()
+    
+    while True:
+        item = results_queue.get()
+        if item is done:
+            break
+        yield item
+
+async def astream_crawling_process():
+    """
+    stream_crawling_process의 비동기 버전 (현재 이벤트 루프에서 크롤링 실행)
+    
+    Yields:
+        dict: 기사 결과 ({"event": "article", ...}) 또는 완료 이벤트 ({"event": "done", ...})
+    """
+    results_queue = asyncio.Queue()
+    done = object()
+    
+    def on_result(result):
+        results_queue.put_nowait({"event": "article", **result})
+    
+    async def run():
+        try:
+            results = await run_crawling_process(on_result)
+            results_queue.put_nowait({"event": "done", "processed": len(results)})
+        except Exception as error:
+            results_queue.put_nowait({"event": "error", "error": str(error)})
+        finally:
+            results_queue.put_nowait(done)
+    
+    # 클라이언트 연결이 끊겨도 크롤링은 끝까지 진행
+    task = asyncio.ensure_future(run())
+    
+    while True:
+        item = await results_queue.get()
+        if item is done:
+            break
+        yield item
+    
+    await task
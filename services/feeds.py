@@ -0,0 +1,328 @@
+import re
+import codecs
+import asyncio
+import aiohttp
+from urllib.parse import urljoin
+from xml.etree.ElementTree import XMLPullParser, ParseError
+from bs4 import BeautifulSoup, SoupStrainer
+from utils.logger import logger
+from config import Config
+from services.http import get_session
+
+# 피드 자동 탐색 시 인정하는 <link rel="alternate"> 타입
+FEED_TYPES = ("application/rss+xml", "application/atom+xml", "application/rdf+xml")
+
+# 한 번에 읽어 파서에 넘길 바이트 수
+CHUNK_SIZE = 16 * 1024
+
+# expat이 바이트로 직접 처리하는 인코딩 (codecs 정규화 이름)
+# EUC-KR, Shift_JIS, GB2312 같은 멀티바이트 인코딩은 문자열로 디코딩해서 전달
+NATIVE_ENCODINGS = {"utf-8", "utf-16", "iso8859-1", "ascii"}
+
+# XML 선언의 encoding 속성
+_XML_ENCODING = re.compile(rb'^(?:\xef\xbb\xbf)?\s*<\?xml[^>]*?encoding\s*=\s*["\']([A-Za-z0-9._:-]+)["\']')
+
+
+def _local(tag):
+    """네임스페이스를 제거한 태그 이름"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(element, name):
+    """이름이 일치하는 첫 번째 자식 요소의 텍스트"""
+    for child in element:
+        if _local(child.tag) == name:
+            return (child.text or "").strip()
+    return ""
+
+
+def _decoder(head, charset):
+    """
+    expat이 지원하지 않는 인코딩의 피드를 위한 증분 디코더
+
+    Args:
+        head (bytes): 응답 본문 첫 청크 (XML 선언 확인용)
+        charset (str): 응답 Content-Type의 charset
+
+    Returns:
+        codecs.IncrementalDecoder: 청크를 문자열로 바꿀 디코더 (바이트 그대로 넘겨도 되면 None)
+    """
+    match = _XML_ENCODING.match(head)
+    encoding = match.group(1).decode("ascii") if match else charset
+    if not encoding:
+        return None
+
+    try:
+        info = codecs.lookup(encoding)
+    except LookupError:
+        return None
+
+    if info.name in NATIVE_ENCODINGS:
+        return None
+    return info.incrementaldecoder(errors="replace")
+
+
+def _parse_item(element, base_url):
+    """
+    RSS <item>, Atom <entry>, 사이트맵 <url> 요소에서 헤드라인 추출
+
+    Args:
+        element (Element): 항목 요소
+        base_url (str): 상대 경로 변환 기준 URL
+
+    Returns:
+        dict: 헤드라인 (title, url) 또는 None
+    """
+    kind = _local(element.tag)
+    title = ""
+    link = ""
+
+    if kind == "item":
+        title = _child_text(element, "title")
+        link = _child_text(element, "link")
+        if not link:
+            # guid는 고유 식별자일 뿐 URL이 아닐 수 있으므로 permalink일 때만 링크로 사용
+            for child in element:
+                if _local(child.tag) == "guid" and child.get("isPermaLink", "true").lower() != "false":
+                    link = (child.text or "").strip()
+                    break
+    elif kind == "entry":
+        title = _child_text(element, "title")
+        for child in element:
+            if _local(child.tag) == "link" and child.get("rel", "alternate") == "alternate":
+                link = child.get("href", "")
+                break
+    elif kind == "url":
+        link = _child_text(element, "loc")
+        for child in element:
+            if _local(child.tag) == "news":
+                title = _child_text(child, "title")
+                break
+
+    if not title or not link:
+        return None
+
+    return {"title": title, "url": urljoin(base_url, link)}
+
+
+class FeedService:
+    """RSS/Atom 피드와 뉴스 사이트맵 기반 헤드라인 추출 클래스
+
+    사이트별 피드 URL은 설정의 레지스트리를 우선 사용하고, 없으면
+    메인 페이지의 <link rel="alternate">와 robots.txt의 Sitemap 항목에서
+    찾습니다. 피드는 청크 단위로 파싱해 필요한 헤드라인 수만큼 읽으면
+    다운로드를 중단하며, ETag/Last-Modified로 조건부 요청을 보냅니다.
+    사이트맵 인덱스는 한 단계만 따라가 최근 하위 사이트맵에서 헤드라인을 모읍니다.
+    """
+
+    def __init__(self):
+        """피드 서비스 초기화"""
+        self.enabled = Config.Feeds.ENABLED
+        self.registry = Config.Feeds.REGISTRY
+        self.timeout = aiohttp.ClientTimeout(total=Config.Feeds.TIMEOUT)
+
+        # 사이트 이름 -> 탐색된 피드 URL 목록 (탐색 실패 시 빈 목록)
+        self._discovered = {}
+
+        # 피드 URL -> (ETag, Last-Modified, 헤드라인 목록)
+        self._validators = {}
+
+        # 사이트맵 인덱스 URL -> 따라갈 하위 사이트맵 URL 목록
+        self._indexes = {}
+
+    async def get_headlines(self, site, limit=None):
+        """
+        피드에서 사이트 헤드라인 추출
+
+        Args:
+            site (dict): 뉴스 사이트 정보
+            limit (int): 추출할 헤드라인 수 (생략 시 설정값)
+
+        Returns:
+            list: 헤드라인 목록 (피드가 없거나 실패하면 빈 목록)
+        """
+        if not self.enabled:
+            return []
+
+        limit = limit or Config.Crawler.HEADLINES_PER_SITE
+
+        session = get_session()
+        for feed_url in await self._feed_urls(session, site):
+            # 피드 하나가 실패해도 다음 피드 시도
+            try:
+                headlines = await self._fetch_feed(session, feed_url, limit)
+            except Exception as error:
+                logger.warning("피드 헤드라인 추출 실패 (%s, %s): %s", site['name'], feed_url, error)
+                continue
+
+            if headlines:
+                logger.info("%s에서 %s개 헤드라인 추출 완료 (피드 사용: %s)", site['name'], len(headlines), feed_url)
+                return headlines
+
+        return []
+
+    async def _feed_urls(self, session, site):
+        """사이트의 피드 URL 목록 (레지스트리 -> 자동 탐색 순)"""
+        if site["name"] in self.registry:
+            return self.registry[site["name"]]
+
+        if site["name"] not in self._discovered:
+            self._discovered[site["name"]] = await self._discover(session, site["url"])
+
+        return self._discovered[site["name"]]
+
+    async def _discover(self, session, url):
+        """
+        메인 페이지와 robots.txt에서 피드/뉴스 사이트맵 URL 탐색
+
+        Args:
+            session (aiohttp.ClientSession): HTTP 세션
+            url (str): 사이트 메인 URL
+
+        Returns:
+            list: 탐색된 피드 URL 목록
+        """
+        headers = {"User-Agent": Config.Crawler.USER_AGENT}
+        feeds = []
+
+        try:
+            async with session.get(url, headers=headers, timeout=self.timeout) as response:
+                if response.status == 200:
+                    html = await response.text()
+                    # <head>의 <link> 태그만 파싱
+                    soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("link"))
+                    for link in soup.find_all("link", href=True):
+                        rel = link.get("rel") or []
+                        if "alternate" in rel and link.get("type", "").lower() in FEED_TYPES:
+                            feeds.append(urljoin(url, link["href"]))
+
+            if not feeds:
+                async with session.get(urljoin(url, "/robots.txt"), headers=headers, timeout=self.timeout) as response:
+                    if response.status == 200:
+                        for line in (await response.text()).splitlines():
+                            key, _, value = line.partition(":")
+                            if key.strip().lower() == "sitemap" and "news" in value.lower():
+                                feeds.append(value.strip())
+
+        except Exception as error:
+            logger.warning("피드 자동 탐색 실패 (%s): %s", url, error)
+
+        logger.info("피드 자동 탐색 결과 (%s): %s개", url, len(feeds))
+        return feeds[:Config.Feeds.MAX_DISCOVERED]
+
+    async def _fetch_feed(self, session, feed_url, limit, nested=False):
+        """
+        피드를 조건부 요청으로 가져와 스트리밍 파싱
+
+        Args:
+            session (aiohttp.ClientSession): HTTP 세션
+            feed_url (str): 피드 URL
+            limit (int): 추출할 헤드라인 수
+            nested (bool): 사이트맵 인덱스의 하위 사이트맵 여부 (더 이상 인덱스를 따라가지 않음)
+
+        Returns:
+            list: 헤드라인 목록
+        """
+        headers = {"User-Agent": Config.Crawler.USER_AGENT}
+        etag, last_modified, cached = self._validators.get(feed_url, (None, None, []))
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        async with session.get(feed_url, headers=headers, timeout=self.timeout) as response:
+            if response.status == 304:
+                # 인덱스가 그대로여도 하위 사이트맵은 바뀌었을 수 있으므로 다시 조회
+                if feed_url in self._indexes:
+                    return await self._fetch_index(session, self._indexes[feed_url], limit)
+                logger.info("피드 변경 없음, 이전 헤드라인 사용: %s", feed_url)
+                return cached[:limit]
+
+            if response.status != 200:
+                logger.warning("피드 요청 실패: %s - 상태 코드 %s", feed_url, response.status)
+                return []
+
+            headlines, sitemaps = await self._parse_stream(response, feed_url, limit)
+            validators = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+        if not headlines and sitemaps and not nested:
+            # 최근 수정된 하위 사이트맵부터 (lastmod가 없으면 인덱스 순서)
+            sitemaps.sort(key=lambda sitemap: sitemap[0], reverse=True)
+            children = [loc for _, loc in sitemaps[:Config.Feeds.MAX_INDEX_SITEMAPS]]
+            self._indexes[feed_url] = children
+            self._validators[feed_url] = (*validators, [])
+            logger.info("사이트맵 인덱스, 하위 사이트맵 %s개 조회: %s", len(children), feed_url)
+            return await self._fetch_index(session, children, limit)
+
+        if headlines:
+            self._validators[feed_url] = (*validators, headlines)
+
+        return headlines
+
+    async def _fetch_index(self, session, children, limit):
+        """사이트맵 인덱스의 하위 사이트맵을 차례로 읽어 헤드라인 수집"""
+        headlines = []
+        for child_url in children:
+            try:
+                for headline in await self._fetch_feed(session, child_url, limit - len(headlines), nested=True):
+                    if not any(h["title"] == headline["title"] for h in headlines):
+                        headlines.append(headline)
+            except Exception as error:
+                logger.warning("하위 사이트맵 요청 실패 (%s): %s", child_url, error)
+
+            if len(headlines) >= limit:
+                break
+
+        return headlines[:limit]
+
+    async def _parse_stream(self, response, feed_url, limit):
+        """
+        응답 본문을 청크 단위로 파싱하고 필요한 수만큼 모이면 중단
+
+        Returns:
+            tuple: (헤드라인 목록, 사이트맵 인덱스의 (lastmod, 하위 사이트맵 URL) 목록)
+        """
+        parser = XMLPullParser(events=("end",))
+        headlines = []
+        sitemaps = []
+        decoder = None
+        first = True
+
+        try:
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                if first:
+                    decoder = _decoder(chunk, response.charset)
+                    first = False
+                parser.feed(decoder.decode(chunk) if decoder else chunk)
+
+                for _, element in parser.read_events():
+                    kind = _local(element.tag)
+                    if kind == "sitemap":
+                        loc = _child_text(element, "loc")
+                        if loc:
+                            sitemaps.append((_child_text(element, "lastmod"), urljoin(feed_url, loc)))
+                        element.clear()
+                        continue
+
+                    if kind not in ("item", "entry", "url"):
+                        continue
+
+                    headline = _parse_item(element, feed_url)
+                    element.clear()
+
+                    if headline and not any(h["title"] == headline["title"] for h in headlines):
+                        headlines.append(headline)
+                        if len(headlines) >= limit:
+                            return headlines, sitemaps
+
+                # 다른 작업이 실행될 수 있도록 양보
+                await asyncio.sleep(0)
+
+        except ParseError as error:
+            logger.warning("피드 파싱 오류 (%s): %s", feed_url, error)
+
+        return headlines, sitemaps
+
+
+# 싱글톤 인스턴스
+feed_service = FeedService()
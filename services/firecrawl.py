@@ -1,17 +1,28 @@
+import time
 import requests
 import json
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
 from utils.logger import logger
 from config import Config
+from services.archive import page_archive
+from services.page_cache import current_page_cache
+from services.parser_pool import parser_pool
 
 class FireCrawl:
     """FireCrawl API 관련 기능 클래스"""
     
-    def __init__(self):
-        """FireCrawl API 초기화"""
+    def __init__(self, offline=False):
+        """
+        FireCrawl API 초기화
+        
+        Args:
+            offline (bool): 네트워크 요청 금지 여부 (리플레이 전용 인스턴스에서 사용)
+        """
         self.api_key = Config.FireCrawl.API_KEY
-        self.api_url = "https://api.firecrawl.dev/scrape"
+        self.api_url = f"{Config.FireCrawl.API_URL}/scrape"
+        self.batch_url = f"{Config.FireCrawl.API_URL}/v1/batch/scrape"
+        
+        # 오프라인 모드 (네트워크 요청 금지)
+        self.offline = offline
     
     def scrape(self, options):
         """
@@ -23,8 +34,11 @@ class FireCrawl:
         Returns:
             dict: 스크래핑 결과
         """
+        if self.offline:
+            raise RuntimeError(f"오프라인 모드에서는 스크래핑할 수 없습니다: {options['url']}")
+        
         try:
-            logger.info(f"FireCrawl API 스크래핑 시작: {options['url']}")
+            logger.info("FireCrawl API 스크래핑 시작: %s", options['url'])
             
             # API 헤더 설정
             headers = {
@@ -43,146 +57,215 @@ class FireCrawl:
             # 응답 확인
             response.raise_for_status()
             
-            logger.info(f"FireCrawl API 스크래핑 완료: {options['url']}")
+            logger.info("FireCrawl API 스크래핑 완료: %s", options['url'])
             return response.json()
             
         except Exception as error:
-            logger.error(f"FireCrawl API 오류: {str(error)}")
+            logger.error("FireCrawl API 오류: %s", error)
             
             # 대체 방법: 직접 크롤링 시도
-            logger.info(f"대체 방법으로 직접 크롤링 시도: {options['url']}")
+            logger.info("대체 방법으로 직접 크롤링 시도: %s", options['url'])
             return self._fallback_scrape(options)
     
-    def _fallback_scrape(self, options):
+    def batch_scrape(self, urls, options):
         """
-        API 실패시 직접 크롤링 시도
+        FireCrawl 배치 API로 여러 URL을 한 번에 스크래핑
+        
+        배치 작업을 제출한 뒤 완료될 때까지 상태를 조회하고, 결과를 URL별로
+        scrape()와 같은 형식으로 돌려줍니다. 배치 안에서 실패했거나 결과가
+        없는 URL, 추출된 본문(content)이 비어 있는 URL은 반환값에 포함되지 않으므로
+        호출하는 쪽에서 개별 요청으로 대체해야 합니다.
         
         Args:
-            options (dict): 스크래핑 옵션
+            urls (list): 스크래핑할 URL 목록
+            options (dict): 스크래핑 옵션 (formats, extract 등, url 제외)
             
         Returns:
-            dict: 스크래핑 결과
+            dict: URL -> 스크래핑 결과
         """
+        if self.offline:
+            raise RuntimeError("오프라인 모드에서는 스크래핑할 수 없습니다: 배치 요청")
+        
+        if not urls:
+            return {}
+        
         try:
-            # 웹페이지 요청
+            logger.info("FireCrawl 배치 스크래핑 시작: %s개 URL", len(urls))
+            
             headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self.api_key}"
             }
             
-            response = requests.get(
-                options["url"],
+            # 배치 작업 제출
+            response = requests.post(
+                self.batch_url,
                 headers=headers,
-                timeout=30
+                json={"urls": urls, **options},
+                timeout=60
             )
             response.raise_for_status()
+            job_id = response.json()["id"]
             
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # 결과 객체
-            result = {}
+            # 완료될 때까지 상태 조회
+            items = self._poll_batch(job_id, headers)
             
-            # 요청에 formats가 있고 extract가 포함되어 있는 경우
-            if "formats" in options and "extract" in options.get("formats", []):
-                extract_prompt = options.get("extract", {}).get("prompt", "")
+            # 결과를 요청 URL에 대응시킴
+            wanted = {self._normalize_url(url): url for url in urls}
+            results = {}
+            for item in items:
+                metadata = item.get("metadata", {})
+                extract = item.get("extract") or item.get("json")
+                # 본문이 비어 있는 결과도 실패로 보고 개별 요청으로 대체되게 함
+                if not isinstance(extract, dict) or not extract.get("content") or metadata.get("error"):
+                    continue
                 
-                # 헤드라인 추출하는 경우
-                if "헤드라인" in extract_prompt:
-                    headlines = self._extract_headlines(soup, options["url"])
-                    result["result"] = {"extract": headlines}
-                    logger.info(f"대체 방법으로 {len(headlines)}개 헤드라인 추출 완료: {options['url']}")
-                
-                # 기사 본문 추출하는 경우
-                elif "본문" in extract_prompt:
-                    content = self._extract_content(soup, options["url"])
-                    result["result"] = {"extract": {"content": content}}
-                    logger.info(f"대체 방법으로 기사 본문 추출 완료 ({len(content)} 글자): {options['url']}")
+                for candidate in (metadata.get("sourceURL"), metadata.get("url")):
+                    url = wanted.get(self._normalize_url(candidate or ""))
+                    if url:
+                        results[url] = {"result": {"extract": extract}}
+                        break
             
-            return result
+            logger.info("FireCrawl 배치 스크래핑 완료: %s/%s개 성공", len(results), len(urls))
+            return results
             
-        except Exception as fallback_error:
-            logger.error(f"대체 크롤링 방법도 실패: {str(fallback_error)}")
-            raise
+        except Exception as error:
+            logger.error("FireCrawl 배치 API 오류: %s", error)
+            return {}
     
-    def _extract_headlines(self, soup, url):
+    def _poll_batch(self, job_id, headers):
         """
-        BeautifulSoup으로 헤드라인 추출
+        배치 작업이 끝날 때까지 상태를 조회하고 결과 항목 수집
         
         Args:
-            soup (BeautifulSoup): 파싱된 HTML
-            url (str): 웹페이지 URL
+            job_id (str): 배치 작업 ID
+            headers (dict): 요청 헤더
             
         Returns:
-            list: 헤드라인 목록
+            list: 결과 항목 목록
         """
-        headlines = []
-        base_url = url
-        
-        # 일반적인 뉴스 사이트 패턴의 CSS 선택자
-        selectors = [
-            "h1 a", "h2 a", "h3 a", ".headline a", ".title a",
-            ".card a", ".news-item a", ".article-title a"
-        ]
-        
-        # 각 선택자에 대해 요소 찾기
-        for selector in selectors:
-            elements = soup.select(selector)
-            
-            for element in elements:
-                if len(headlines) >= 5:
-                    break
-                    
-                title = element.get_text().strip()
-                link = element.get("href", "")
-                
-                # 상대 경로를 절대 경로로 변환
-                if link and not link.startswith(("http://", "https://")):
-                    link = urljoin(base_url, link)
-                
-                # 중복 방지 및 유효성 검사
-                if title and link and not any(h["title"] == title for h in headlines):
-                    headlines.append({"title": title, "url": link})
+        status_url = f"{self.batch_url}/{job_id}"
+        deadline = time.monotonic() + Config.FireCrawl.BATCH_TIMEOUT
+        
+        while True:
+            response = requests.get(status_url, headers=headers, timeout=30)
+            response.raise_for_status()
+            status = response.json()
+            
+            if status.get("status") == "completed":
+                break
+            if status.get("status") == "failed":
+                raise RuntimeError(f"배치 작업 실패: {job_id}")
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"배치 작업 시간 초과: {job_id}")
+            
+            logger.info("FireCrawl 배치 진행 중: %s/%s", status.get("completed", 0), status.get("total", "?"))
+            time.sleep(Config.FireCrawl.BATCH_POLL_INTERVAL)
+        
+        # 결과가 여러 페이지로 나뉜 경우 next URL을 따라 수집
+        items = list(status.get("data", []))
+        next_url = status.get("next")
+        while next_url:
+            response = requests.get(next_url, headers=headers, timeout=30)
+            response.raise_for_status()
+            page = response.json()
+            items.extend(page.get("data", []))
+            next_url = page.get("next")
         
-        return headlines[:5]  # 최대 5개
+        return items
+    
+    @staticmethod
+    def _normalize_url(url):
+        """URL 비교용 정규화 (끝의 / 제거)"""
+        return url.rstrip("/")
     
-    def _extract_content(self, soup, url):
+    def _fallback_scrape(self, options):
         """
-        BeautifulSoup으로 기사 본문 추출
+        API 실패시 직접 크롤링 시도
         
         Args:
-            soup (BeautifulSoup): 파싱된 HTML
-            url (str): 웹페이지 URL
+            options (dict): 스크래핑 옵션
             
         Returns:
-            str: 추출된 기사 본문
+            dict: 스크래핑 결과
         """
-        # 일반적인 뉴스 본문 컨테이너 CSS 선택자
-        content_selectors = [
-            "article", ".article", ".article-content", ".story-content",
-            ".news-content", ".entry-content", ".post-content",
-            "#article-body", ".article-body", ".article__body"
-        ]
-        
-        # 각 선택자 시도
-        for selector in content_selectors:
-            content_element = soup.select_one(selector)
-            if content_element:
-                # 불필요한 요소 제거 (광고, 관련기사 등)
-                for unwanted in content_element.select(".ad, .advertisement, .related, .share, .social, .comments"):
-                    unwanted.decompose()
+        try:
+            # 프리페치된 페이지가 있으면 다시 요청하지 않음
+            page_cache = current_page_cache()
+            html = page_cache.lookup(options["url"]) if page_cache else None
+            
+            if html is None:
+                # 웹페이지 요청
+                headers = {
+                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+                }
                 
-                # 텍스트 추출 및 정리
-                content = content_element.get_text().strip()
-                content = " ".join(line.strip() for line in content.splitlines() if line.strip())
+                response = requests.get(
+                    options["url"],
+                    headers=headers,
+                    timeout=30
+                )
+                response.raise_for_status()
                 
-                if content:
-                    return content
+                # 파싱은 원본 바이트로 하고, 문자열 변환은 보관할 때만 수행
+                html = response.content
+                if page_archive.enabled:
+                    page_archive.append(options["url"], "html", response.text)
+            else:
+                logger.info("프리페치된 페이지 사용: %s", options["url"])
+                page_archive.append(options["url"], "html", html)
+            
+            result = self.extract_from_html(html, options)
+            
+            # 헤드라인을 추출한 경우 리플레이 비교용으로 추출 결과를 보관하고 상위 기사 페이지를 미리 받아 둠
+            extracted = result.get("result", {}).get("extract")
+            if isinstance(extracted, list):
+                page_archive.append(options["url"], "headlines", {"source": "fallback", "headlines": extracted})
+            if page_cache and isinstance(extracted, list):
+                page_cache.prefetch([h["url"] for h in extracted[:Config.Crawler.HEADLINES_PER_SITE]])
+            
+            return result
+            
+        except Exception as fallback_error:
+            logger.error("대체 크롤링 방법도 실패: %s", fallback_error)
+            raise
+    
+    def extract_from_html(self, html, options):
+        """
+        이미 받아온 HTML에서 옵션에 맞는 내용 추출 (네트워크 요청 없음)
+        
+        큰 페이지는 파싱 워커 프로세스에서 처리하고 추출 결과만 돌려받습니다.
+        
+        Args:
+            html (bytes|str): 페이지 HTML (원본 바이트 또는 문자열)
+            options (dict): 스크래핑 옵션 (url, formats, extract 등)
+            
+        Returns:
+            dict: 스크래핑 결과
+        """
+        # 결과 객체
+        result = {}
         
-        # 선택자로 찾지 못한 경우 단락 텍스트 수집
-        paragraphs = soup.select("p")
-        content = " ".join(p.get_text().strip() for p in paragraphs if p.get_text().strip())
+        # 요청에 formats가 있고 extract가 포함되어 있는 경우
+        if "formats" in options and "extract" in options.get("formats", []):
+            extract_prompt = options.get("extract", {}).get("prompt", "")
+            
+            # 헤드라인 추출하는 경우
+            if "헤드라인" in extract_prompt:
+                headlines = parser_pool.parse("headlines", html, options["url"])
+                result["result"] = {"extract": headlines}
+                logger.info("대체 방법으로 %s개 헤드라인 추출 완료: %s", len(headlines), options['url'])
+            
+            # 기사 본문 추출하는 경우
+            elif "본문" in extract_prompt:
+                extracted = parser_pool.parse("content", html, options["url"])
+                result["result"] = {"extract": extracted}
+                logger.info(
+                    "대체 방법으로 기사 본문 추출 완료 (%s 글자, 신뢰도 %s): %s",
+                    len(extracted["content"]), extracted["confidence"], options['url']
+                )
         
-        return content
+        return result
 
 
 # 싱글톤 인스턴스
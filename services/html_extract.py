@@ -0,0 +1,273 @@
+"""
+HTML에서 헤드라인과 기사 본문을 추출하는 순수 함수 모음
+
+파싱 워커 프로세스에서도 가볍게 불러올 수 있도록 BeautifulSoup 외의
+애플리케이션 모듈(설정, 로거 등)에 의존하지 않습니다.
+"""
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+from bs4.element import Tag, PreformattedString
+
+# 일반적인 뉴스 사이트 패턴의 헤드라인 CSS 선택자
+HEADLINE_SELECTORS = [
+    "h1 a", "h2 a", "h3 a", ".headline a", ".title a",
+    ".card a", ".news-item a", ".article-title a"
+]
+
+# 일반적인 뉴스 본문 컨테이너 CSS 선택자
+CONTENT_SELECTORS = [
+    "article", ".article", ".article-content", ".story-content",
+    ".news-content", ".entry-content", ".post-content",
+    "#article-body", ".article-body", ".article__body"
+]
+
+# 본문에서 제거할 요소 (광고, 관련기사 등)
+UNWANTED_SELECTOR = ".ad, .advertisement, .related, .share, .social, .comments"
+UNWANTED_CLASSES = {"ad", "advertisement", "related", "share", "social", "comments"}
+
+# 본문 점수 계산에서 통째로 건너뛰는 태그
+SKIP_TAGS = {
+    "script", "style", "noscript", "template", "nav", "header", "footer",
+    "aside", "form", "iframe", "svg", "button", "select"
+}
+
+# 점수를 매기는 단락 태그와 최소 길이
+PARAGRAPH_TAGS = {"p", "pre", "blockquote"}
+MIN_PARAGRAPH_CHARS = 25
+
+# 최고 점수 블록 대비 이 비율 이상인 형제 블록은 본문에 포함
+SIBLING_SCORE_RATIO = 0.2
+SIBLING_PARAGRAPH_CHARS = 80
+SEMANTIC_TAGS = {"article", "main"}
+
+
+def extract_headlines(soup, url, selectors=None, limit=5):
+    """
+    파싱된 HTML에서 헤드라인 추출
+
+    Args:
+        soup (BeautifulSoup): 파싱된 HTML
+        url (str): 웹페이지 URL (상대 경로 변환 기준)
+        selectors (list): 헤드라인 CSS 선택자 목록 (생략 시 기본 목록)
+        limit (int): 최대 헤드라인 수
+
+    Returns:
+        list: 헤드라인 목록
+    """
+    headlines = []
+
+    # 각 선택자에 대해 요소 찾기
+    for selector in selectors or HEADLINE_SELECTORS:
+        if len(headlines) >= limit:
+            break
+
+        for element in soup.select(selector):
+            if len(headlines) >= limit:
+                break
+
+            title = element.get_text().strip()
+            link = element.get("href", "")
+
+            # 상대 경로를 절대 경로로 변환
+            if link and not link.startswith(("http://", "https://")):
+                link = urljoin(url, link)
+
+            # 중복 방지 및 유효성 검사
+            if title and link and not any(h["title"] == title for h in headlines):
+                headlines.append({"title": title, "url": link})
+
+    return headlines
+
+
+def _skipped(tag):
+    """본문 점수 계산에서 제외할 요소인지 여부 (스크립트, 내비게이션, 광고 등)"""
+    if tag.name in SKIP_TAGS:
+        return True
+    return any(name in UNWANTED_CLASSES for name in tag.get("class") or ())
+
+
+def _strings(node):
+    """제외 요소를 건너뛰며 하위 텍스트 조각을 문서 순서대로 반환"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, Tag):
+            if current is node or not _skipped(current):
+                stack.extend(reversed(current.contents))
+        elif not isinstance(current, PreformattedString):
+            text = current.strip()
+            if text:
+                yield text
+
+
+def _score_blocks(soup):
+    """
+    DOM을 한 번 후위 순회하며 요소별 텍스트/링크 길이와 본문 점수 계산
+
+    단락(p, pre, blockquote)마다 길이와 쉼표 수로 점수를 매겨 부모에 전체,
+    조부모에 절반을 더합니다. 각 요소는 한 번만 방문하므로 문서 크기에 선형입니다.
+
+    Returns:
+        tuple: (요소 id -> [텍스트 길이, 링크 텍스트 길이], 요소 id -> [요소, 점수, 단락 수])
+    """
+    stats = {}
+    candidates = {}
+    stack = [(soup, False)]
+
+    while stack:
+        node, visited = stack.pop()
+        if not visited:
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.children if isinstance(child, Tag) and not _skipped(child))
+            continue
+
+        text = links = commas = 0
+        for child in node.children:
+            if isinstance(child, Tag):
+                child_stats = stats.get(id(child))
+                if child_stats:
+                    text += child_stats[0]
+                    links += child_stats[1]
+                    commas += child_stats[2]
+            elif not isinstance(child, PreformattedString):
+                stripped = child.strip()
+                text += len(stripped)
+                commas += stripped.count(",")
+
+        if node.name == "a":
+            links = text
+        stats[id(node)] = [text, links, commas]
+
+        if node.name in PARAGRAPH_TAGS and text >= MIN_PARAGRAPH_CHARS:
+            score = 1 + commas + min(text / 100, 3)
+            for ancestor, weight in ((node.parent, 1), (node.parent.parent if node.parent else None, 0.5)):
+                if ancestor is None:
+                    break
+                entry = candidates.setdefault(id(ancestor), [ancestor, 0.0, 0])
+                entry[1] += score * weight
+                entry[2] += 1
+
+    return stats, candidates
+
+
+def extract_main_content(soup):
+    """
+    텍스트 밀도와 링크 밀도로 기사 본문 블록을 찾아 추출
+
+    점수가 가장 높은 블록과, 본문이 여러 블록으로 나뉜 경우를 위해 점수가
+    충분히 높은 형제 블록을 함께 사용합니다. 내비게이션, 푸터, 관련 기사
+    목록은 링크 비율이 높거나 제외 요소라 선택되지 않습니다.
+
+    Args:
+        soup (BeautifulSoup): 파싱된 HTML
+
+    Returns:
+        tuple: (본문 텍스트, 신뢰도 0~1) - 본문 블록을 찾지 못하면 ("", 0.0)
+    """
+    stats, candidates = _score_blocks(soup)
+
+    def final_score(entry):
+        text, links, _ = stats.get(id(entry[0]), (0, 0, 0))
+        return entry[1] * (1 - links / text) if text else 0.0
+
+    if not candidates:
+        return "", 0.0
+
+    ranked = sorted(candidates.values(), key=final_score, reverse=True)
+    top = ranked[0]
+    top_score = final_score(top)
+    if top_score <= 0:
+        return "", 0.0
+
+    # 점수가 충분한 형제 블록을 문서 순서대로 포함 (<article>/<main>은 그 자체를 본문으로 봄)
+    blocks = [top[0]]
+    if top[0].parent is not None and top[0].name not in SEMANTIC_TAGS:
+        threshold = max(top_score * SIBLING_SCORE_RATIO, 10)
+        blocks = []
+        for sibling in top[0].parent.children:
+            if not isinstance(sibling, Tag) or _skipped(sibling):
+                continue
+            entry = candidates.get(id(sibling))
+            if sibling is top[0] or (entry and final_score(entry) >= threshold):
+                blocks.append(sibling)
+            elif sibling.name in PARAGRAPH_TAGS:
+                # 본문 블록 밖에 떨어져 있는 긴 단락
+                text, links, _ = stats.get(id(sibling), (0, 0, 0))
+                if text >= SIBLING_PARAGRAPH_CHARS and links < text * 0.25:
+                    blocks.append(sibling)
+
+    content = " ".join(text for block in blocks for text in _strings(block))
+
+    # 신뢰도: 다른 계열의 차순위 블록 대비 우위 x 링크가 아닌 텍스트 비율 x 단락 수
+    included = {id(block) for block in blocks}
+    lineage = {id(parent) for parent in top[0].parents}
+    runner_up = 0.0
+    for entry in ranked[1:]:
+        node = entry[0]
+        if id(node) in included or id(node) in lineage or any(id(parent) in included for parent in node.parents):
+            continue
+        runner_up = final_score(entry)
+        break
+
+    text, links, _ = stats[id(top[0])]
+    dominance = top_score / (top_score + runner_up)
+    confidence = dominance * (1 - links / text) * min(top[2] / 3, 1)
+
+    return content, round(confidence, 2)
+
+
+def extract_content(soup):
+    """
+    파싱된 HTML에서 기사 본문 추출
+
+    텍스트 밀도 기반 추출을 우선 사용하고, 본문 블록을 찾지 못하면
+    본문 컨테이너 선택자, 마지막으로 전체 단락 순서로 찾습니다.
+
+    Args:
+        soup (BeautifulSoup): 파싱된 HTML
+
+    Returns:
+        tuple: (추출된 기사 본문, 신뢰도 0~1)
+    """
+    content, confidence = extract_main_content(soup)
+    if content:
+        return content, confidence
+
+    # 각 선택자 시도
+    for selector in CONTENT_SELECTORS:
+        content_element = soup.select_one(selector)
+        if content_element:
+            # 불필요한 요소 제거 (광고, 관련기사 등)
+            for unwanted in content_element.select(UNWANTED_SELECTOR):
+                unwanted.decompose()
+
+            # 텍스트 추출 및 정리
+            content = content_element.get_text().strip()
+            content = " ".join(line.strip() for line in content.splitlines() if line.strip())
+
+            if content:
+                return content, 0.0
+
+    # 선택자로도 찾지 못한 경우 단락 텍스트 수집
+    paragraphs = soup.select("p")
+    return " ".join(p.get_text().strip() for p in paragraphs if p.get_text().strip()), 0.0
+
+
+def parse_headlines(raw, url, selectors=None, limit=5):
+    """
+    원본 HTML(바이트 또는 문자열)을 파싱해 헤드라인 추출
+
+    파싱 트리는 호출한 프로세스 밖으로 나가지 않고 결과 목록만 반환됩니다.
+    """
+    return extract_headlines(BeautifulSoup(raw, "html.parser"), url, selectors, limit)
+
+
+def parse_content(raw, url):
+    """
+    원본 HTML(바이트 또는 문자열)을 파싱해 기사 본문 추출
+
+    Returns:
+        dict: 추출 결과 (content, confidence)
+    """
+    content, confidence = extract_content(BeautifulSoup(raw, "html.parser"))
+    return {"content": content, "confidence": confidence}
@@ -0,0 +1,35 @@
+import asyncio
+import aiohttp
+from config import Config
+
+# 이벤트 루프별 공유 aiohttp 세션 (연결 풀 재사용)
+_sessions = {}
+
+
+def get_session():
+    """
+    현재 이벤트 루프에서 공유하는 aiohttp 세션 반환
+
+    ASGI 서버에서는 서버 루프 하나에서 모든 크롤링이 같은 연결 풀을 쓰고,
+    Flask 경로에서는 실행마다 만든 루프에서 쓰고 실행이 끝나면 닫습니다.
+
+    Returns:
+        aiohttp.ClientSession: 공유 세션
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=Config.Crawler.HTTP_POOL_SIZE)
+        timeout = aiohttp.ClientTimeout(total=Config.Crawler.TIMEOUT / 1000)
+        session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        _sessions[loop] = session
+
+    return session
+
+
+async def close_session():
+    """현재 이벤트 루프의 공유 세션 닫기"""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
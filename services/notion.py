@@ -1,4 +1,7 @@
+import re
+from concurrent.futures import ThreadPoolExecutor, wait
 from notion_client import Client
+from notion_client.errors import HTTPResponseError
 from datetime import datetime
 from utils.logger import logger
 from config import Config
@@ -12,20 +15,31 @@ class NotionService:
         self.database_id = Config.Notion.DATABASE_ID
         self.property_fields = Config.Notion.PROPERTY_FIELDS
         
+        self.write_content = Config.Notion.WRITE_CONTENT
+        self.max_text_length = Config.Notion.MAX_TEXT_LENGTH
+        self.max_blocks = Config.Notion.MAX_BLOCKS_PER_REQUEST
+        
         # Notion 클라이언트 초기화
-        self.client = Client(auth=self.token)
+        self.client = Client(auth=self.token, base_url=Config.Notion.API_URL)
+        
+        # 본문 블록 추가 파이프라인 (페이지 내부는 순서대로, 페이지 간에는 병렬로 추가)
+        self._append_executor = ThreadPoolExecutor(
+            max_workers=Config.Notion.APPEND_WORKERS,
+            thread_name_prefix="notion-append"
+        )
+        self._pending_appends = set()
     
     def save_to_notion(self, article):
         """
         기사 정보를 Notion 데이터베이스에 저장
         
         Args:
-            article (dict): 저장할 기사 정보
+            article (Article): 저장할 기사 레코드
             
         Returns:
             dict: 생성된 Notion 페이지 정보
         """
-        logger.info(f"Notion에 저장 시작: {article['title']}")
+        logger.info("Notion에 저장 시작: %s", article.title)
         
         try:
             # 현재 날짜 생성
@@ -35,19 +49,19 @@ class NotionService:
             properties = {
                 # 제목 속성
                 self.property_fields["title"]: {
-                    "title": [{"text": {"content": article["title"]}}]
+                    "title": [{"text": {"content": article.title}}]
                 },
                 # 요약 속성
                 self.property_fields["summary"]: {
-                    "rich_text": [{"text": {"content": article["summary"]}}]
+                    "rich_text": [{"text": {"content": article.summary}}]
                 },
                 # 국가 속성 (select 유형)
                 self.property_fields["country"]: {
-                    "select": {"name": article["country"]}
+                    "select": {"name": article.country}
                 },
                 # 출처 속성
                 self.property_fields["site"]: {
-                    "rich_text": [{"text": {"content": article["site"]}}]
+                    "rich_text": [{"text": {"content": article.site}}]
                 },
                 # 날짜 속성
                 self.property_fields["crawled_at"]: {
@@ -55,23 +69,140 @@ class NotionService:
                 },
                 # URL 속성
                 self.property_fields["url"]: {
-                    "url": article["url"]
+                    "url": article.url
                 }
             }
             
+            # 본문 블록 (첫 100개는 페이지 생성 요청에 포함해 왕복 횟수를 줄임)
+            blocks = self.build_content_blocks(article.content) if self.write_content else []
+            
             # Notion 페이지 생성 요청
-            response = self.client.pages.create(
-                parent={"database_id": self.database_id},
-                properties=properties
-            )
+            try:
+                response = self.client.pages.create(
+                    parent={"database_id": self.database_id},
+                    properties=properties,
+                    children=blocks[:self.max_blocks]
+                )
+                remaining = blocks[self.max_blocks:]
+            
+            except HTTPResponseError as error:
+                # 본문 블록이 검증(400)이나 요청 크기(413) 한도에 걸려도 속성만으로 페이지는 저장
+                if not blocks or error.status not in (400, 413):
+                    raise
+                logger.warning("본문 블록 포함 페이지 생성 실패, 속성만 저장 후 본문 추가 (%s): %s", article.title, error)
+                response = self.client.pages.create(
+                    parent={"database_id": self.database_id},
+                    properties=properties
+                )
+                remaining = blocks
+            
+            # 남은 블록은 추가 파이프라인으로 넘기고 바로 반환
+            if remaining:
+                future = self._append_executor.submit(
+                    self._append_blocks, response["id"], remaining, article.title
+                )
+                self._pending_appends.add(future)
+                future.add_done_callback(self._pending_appends.discard)
             
-            logger.info(f"Notion에 저장 완료: {article['title']} (페이지 ID: {response['id']})")
+            logger.info("Notion에 저장 완료: %s (페이지 ID: %s, 본문 블록 %s개)", article.title, response['id'], len(blocks))
             return response
             
         except Exception as error:
-            logger.error(f"Notion 저장 오류 ({article['title']}): {str(error)}")
+            logger.error("Notion 저장 오류 (%s): %s", article.title, error)
             return None
 
+    
+    def build_content_blocks(self, text):
+        """
+        기사 본문을 문단 블록 목록으로 변환
+        
+        Notion rich text 한도(2000자)에 맞춰 문장 경계에서 나누고,
+        한도보다 긴 문장은 공백 또는 글자 단위로 나눕니다.
+        
+        Args:
+            text (str): 기사 본문
+            
+        Returns:
+            list: paragraph 블록 목록
+        """
+        return [
+            {
+                "object": "block",
+                "type": "paragraph",
+                "paragraph": {"rich_text": [{"type": "text", "text": {"content": chunk}}]}
+            }
+            for chunk in split_text(text, self.max_text_length)
+        ]
+    
+    def _append_blocks(self, page_id, blocks, title):
+        """페이지에 블록을 최대 100개씩 순서대로 추가"""
+        try:
+            for start in range(0, len(blocks), self.max_blocks):
+                self.client.blocks.children.append(
+                    block_id=page_id,
+                    children=blocks[start:start + self.max_blocks]
+                )
+            logger.info("Notion 본문 블록 추가 완료: %s (%s개)", title, len(blocks))
+        
+        except Exception as error:
+            logger.error("Notion 본문 블록 추가 오류 (%s): %s", title, error)
+    
+    def flush(self, timeout=None):
+        """
+        진행 중인 본문 블록 추가가 모두 끝날 때까지 대기
+        
+        Args:
+            timeout (float): 최대 대기 시간 (초)
+        """
+        pending = list(self._pending_appends)
+        if pending:
+            wait(pending, timeout=timeout)
+
+
+def split_text(text, limit):
+    """
+    텍스트를 limit 글자 이하 조각으로 분할 (문장 경계 우선)
+    
+    Args:
+        text (str): 분할할 텍스트
+        limit (int): 조각당 최대 글자 수
+        
+    Returns:
+        list: 텍스트 조각 목록
+    """
+    chunks = []
+    current = ""
+    
+    for sentence in _SENTENCE_END.split(text or ""):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        
+        # 한도보다 긴 문장은 공백 기준으로, 공백이 없으면 글자 단위로 자름
+        while len(sentence) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            cut = sentence.rfind(" ", 0, limit)
+            cut = cut if cut > 0 else limit
+            chunks.append(sentence[:cut].rstrip())
+            sentence = sentence[cut:].lstrip()
+        
+        if current and len(current) + 1 + len(sentence) > limit:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    
+    if current:
+        chunks.append(current)
+    
+    return chunks
+
+
+# 문장 끝 (구두점 뒤 공백 포함) 또는 줄바꿈에서 분할, 구분자는 앞 문장에 붙여 보존
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s+|(?<=\n)")
+
 
 # 싱글톤 인스턴스
 notion_service = NotionService() 
\ No newline at end of file
@@ -0,0 +1,201 @@
+import asyncio
+import contextvars
+import aiohttp
+from utils.logger import logger
+from config import Config
+
+# 현재 크롤링 실행에 묶인 페이지 캐시
+_current = contextvars.ContextVar('page_cache', default=None)
+
+
+def current_page_cache():
+    """
+    현재 실행의 페이지 캐시 반환
+
+    Returns:
+        PageCache: 실행 중인 캐시 (크롤링 실행 밖이거나 비활성화 상태면 None)
+    """
+    return _current.get()
+
+
+class PageCache:
+    """크롤링 실행 단위 페이지 캐시와 추측성 프리페치
+
+    헤드라인이 정해지는 즉시 기사 페이지를 미리 받아 두어, 이후 본문 추출이
+    직접 크롤링으로 대체될 때 다시 요청하지 않도록 합니다. 전체 바이트 예산과
+    동시 요청 수를 제한하며, 실행이 끝나면 남은 프리페치를 취소합니다.
+    """
+
+    def __init__(self, byte_budget=None, concurrency=None):
+        """
+        캐시 초기화
+
+        Args:
+            byte_budget (int): 프리페치로 보관할 최대 바이트 수
+            concurrency (int): 동시 프리페치 요청 수
+        """
+        self.byte_budget = byte_budget or Config.Prefetch.BYTE_BUDGET
+        self.concurrency = concurrency or Config.Prefetch.CONCURRENCY
+
+        self._pages = {}
+        self._tasks = {}
+        self._bytes = 0
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._session = None
+        self._loop = None
+        self._token = None
+
+        self.hits = 0
+
+    async def __aenter__(self):
+        self._loop = asyncio.get_running_loop()
+        self._token = _current.set(self)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        _current.reset(self._token)
+        await self.close()
+
+    def _in_loop_thread(self):
+        """현재 스레드가 캐시의 이벤트 루프를 실행 중인지 여부"""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def prefetch(self, urls):
+        """
+        URL 목록을 백그라운드에서 미리 요청 (이미 요청했거나 예산이 없으면 건너뜀)
+
+        작업 스레드에서 호출하면 이벤트 루프에 넘겨 실행합니다.
+
+        Args:
+            urls (list): 프리페치할 URL 목록
+        """
+        if self._in_loop_thread():
+            self._start(urls)
+        else:
+            self._loop.call_soon_threadsafe(self._start, list(urls))
+
+    def _start(self, urls):
+        """이벤트 루프에서 프리페치 태스크 생성"""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.concurrency)
+            timeout = aiohttp.ClientTimeout(total=Config.Crawler.TIMEOUT / 1000)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+        for url in urls:
+            if self._bytes >= self.byte_budget:
+                break
+            if url in self._pages or url in self._tasks:
+                continue
+            self._tasks[url] = asyncio.ensure_future(self._fetch(url))
+
+    async def _fetch(self, url):
+        """단일 페이지 프리페치 (예산을 넘는 페이지는 버림)"""
+        headers = {"User-Agent": Config.Crawler.USER_AGENT}
+        # 받는 즉시 예산에서 차감해 동시 프리페치가 예산을 함께 넘지 않도록 함
+        reserved = 0
+
+        try:
+            async with self._semaphore:
+                async with self._session.get(url, headers=headers) as response:
+                    if response.status != 200:
+                        return
+
+                    if (response.content_length or 0) > self.byte_budget - self._bytes:
+                        logger.info("프리페치 예산 초과로 건너뜀: %s", url)
+                        return
+
+                    chunks = []
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        if self._bytes + len(chunk) > self.byte_budget:
+                            logger.info("프리페치 예산 초과로 중단: %s", url)
+                            return
+                        self._bytes += len(chunk)
+                        reserved += len(chunk)
+                        chunks.append(chunk)
+
+                    self._pages[url] = b"".join(chunks).decode(response.charset or "utf-8", errors="replace")
+                    logger.info("프리페치 완료: %s (%s 바이트)", url, reserved)
+                    reserved = 0
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            logger.info("프리페치 실패: %s - %s", url, error)
+        finally:
+            # 저장하지 못한 페이지의 예산 반환
+            self._bytes -= reserved
+            self._tasks.pop(url, None)
+
+    def peek(self, url):
+        """
+        완료된 프리페치 결과 조회 (대기하지 않음)
+
+        Args:
+            url (str): 페이지 URL
+
+        Returns:
+            str: 페이지 HTML 또는 None
+        """
+        html = self._pages.get(url)
+        if html is not None:
+            self.hits += 1
+        return html
+
+    async def get(self, url):
+        """
+        프리페치 결과 조회 (진행 중이면 완료될 때까지 대기)
+
+        Args:
+            url (str): 페이지 URL
+
+        Returns:
+            str: 페이지 HTML 또는 None
+        """
+        task = self._tasks.get(url)
+        if task is not None:
+            await asyncio.shield(task)
+        return self.peek(url)
+
+    def lookup(self, url):
+        """
+        작업 스레드에서 프리페치 결과 조회
+
+        프리페치가 진행 중이면 이벤트 루프에서 완료될 때까지 기다립니다.
+        이벤트 루프 스레드에서 호출하면 기다리지 않고 완료된 결과만 반환합니다.
+
+        Args:
+            url (str): 페이지 URL
+
+        Returns:
+            str: 페이지 HTML 또는 None
+        """
+        if self._in_loop_thread() or url not in self._tasks:
+            return self.peek(url)
+
+        future = asyncio.run_coroutine_threadsafe(self.get(url), self._loop)
+        try:
+            return future.result(timeout=Config.Crawler.TIMEOUT / 1000)
+        except Exception:
+            future.cancel()
+            return None
+
+    async def close(self):
+        """남은 프리페치를 취소하고 세션 종료"""
+        pending = list(self._tasks.values())
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+        logger.info(
+            "페이지 캐시 종료: 프리페치 %s개 (%s 바이트), 사용 %s회, 취소 %s개",
+            len(self._pages), self._bytes, self.hits, len(pending)
+        )
+        self._pages = {}
@@ -0,0 +1,98 @@
+import atexit
+import asyncio
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from utils.logger import logger
+from config import Config
+from services import html_extract
+
+# 작업 종류 -> 워커에서 실행할 함수
+_TASKS = {
+    "headlines": html_extract.parse_headlines,
+    "content": html_extract.parse_content
+}
+
+
+class ParserPool:
+    """HTML 파싱 전용 프로세스 풀
+
+    BeautifulSoup 파싱은 순수 파이썬 CPU 작업이라 GIL을 잡고 있으므로,
+    큰 페이지는 원본 바이트를 워커 프로세스로 넘겨 파싱하고 헤드라인 목록이나
+    본문 텍스트 같은 작은 결과만 돌려받습니다. 작은 페이지는 프로세스 간
+    전달 비용이 더 크므로 호출한 곳에서 바로 파싱합니다.
+    """
+
+    def __init__(self, workers=None, inline_max_bytes=None):
+        """
+        파싱 풀 초기화 (워커 프로세스는 첫 사용 시 생성)
+
+        Args:
+            workers (int): 워커 프로세스 수 (0이면 항상 호출한 곳에서 파싱)
+            inline_max_bytes (int): 이 크기 이하의 페이지는 호출한 곳에서 파싱
+        """
+        self.workers = Config.Parser.WORKERS if workers is None else workers
+        self.inline_max_bytes = Config.Parser.INLINE_MAX_BYTES if inline_max_bytes is None else inline_max_bytes
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        """워커 프로세스 풀 (spawn 방식으로 생성해 부모의 스레드/락 상태를 물려받지 않음)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                logger.info("HTML 파싱 워커 %s개 시작", self.workers)
+            return self._executor
+
+    def _inline(self, raw):
+        """호출한 곳에서 바로 파싱할지 여부 (워커 비활성화 또는 작은 페이지)"""
+        return self.workers <= 0 or len(raw) <= self.inline_max_bytes
+
+    def parse(self, kind, raw, url, **options):
+        """
+        HTML 파싱 (동기 호출, 작업 스레드용)
+
+        Args:
+            kind (str): 작업 종류 ("headlines" 또는 "content")
+            raw (bytes|str): 원본 HTML
+            url (str): 페이지 URL
+            **options: 추출 함수에 넘길 추가 옵션 (selectors, limit 등)
+
+        Returns:
+            list|str: 헤드라인 목록 또는 기사 본문
+        """
+        if self._inline(raw):
+            return _TASKS[kind](raw, url, **options)
+        return self._pool().submit(_TASKS[kind], raw, url, **options).result()
+
+    async def aparse(self, kind, raw, url, **options):
+        """
+        HTML 파싱 (이벤트 루프용, 큰 페이지는 루프를 막지 않고 워커에서 파싱)
+
+        Args:
+            kind (str): 작업 종류 ("headlines" 또는 "content")
+            raw (bytes|str): 원본 HTML
+            url (str): 페이지 URL
+            **options: 추출 함수에 넘길 추가 옵션 (selectors, limit 등)
+
+        Returns:
+            list|str: 헤드라인 목록 또는 기사 본문
+        """
+        if self._inline(raw):
+            return _TASKS[kind](raw, url, **options)
+        return await asyncio.wrap_future(self._pool().submit(_TASKS[kind], raw, url, **options))
+
+    def shutdown(self):
+        """워커 프로세스 종료"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+# 싱글톤 인스턴스
+parser_pool = ParserPool()
+atexit.register(parser_pool.shutdown)
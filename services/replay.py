@@ -0,0 +1,186 @@
+import time
+import difflib
+from concurrent.futures import ThreadPoolExecutor
+from utils.logger import logger
+from config import Config
+from models.article import Article
+from services.archive import ArchiveReader
+from services.firecrawl import FireCrawl
+from services.parser_pool import parser_pool
+from services.summarizer import summarizer
+from services.crawler import HEADLINE_SELECTORS
+
+# 리플레이 전용 추출기 (네트워크 요청 금지, 같은 프로세스의 실시간 크롤링과 분리)
+_offline = FireCrawl(offline=True)
+
+
+def _load_items(directory, limit, summarize):
+    """
+    아카이브에서 URL별 최신 HTML과 당시 추출 결과(본문 또는 헤드라인), 요약을 읽어옴
+
+    원본 HTML이 없는 URL(FireCrawl API로 본문을 받은 기사)은 저장된 본문을
+    다시 요약할 때만 포함합니다. 메인 페이지는 헤드라인을 추출했던 시점의 HTML을 사용합니다.
+
+    Args:
+        directory (str): 아카이브 디렉터리
+        limit (int): 최대 항목 수
+        summarize (bool): 본문 재요약 여부
+
+    Returns:
+        list: 리플레이 항목 목록
+    """
+    items = []
+
+    with ArchiveReader(directory) as reader:
+        for url in reader.iter_urls():
+            html = reader.get(url, "html")
+            content = reader.get(url, "content")
+            if html is None and (content is None or not summarize):
+                continue
+
+            headlines = reader.get(url, "headlines") if content is None else None
+            if headlines is not None:
+                html = reader.get(url, "html", at=headlines["crawled_at"]) or html
+
+            summary = reader.get(url, "summary")
+            items.append({
+                "url": url,
+                "html": html["data"] if html else None,
+                "content": content["data"] if content else None,
+                "summary": summary["data"] if summary else None,
+                "headlines": headlines["data"] if headlines else None
+            })
+
+            if limit and len(items) >= limit:
+                break
+
+    return items
+
+
+def _diff(original, current):
+    """원본과 현재 출력 비교 결과 (유사도와 축약된 unified diff)"""
+    original = original or ""
+    current = current or ""
+    ratio = difflib.SequenceMatcher(None, original, current, autojunk=False).quick_ratio()
+    diff = list(difflib.unified_diff(
+        original.split(". "), current.split(". "),
+        fromfile="original", tofile="current", lineterm="", n=0
+    ))
+    return {
+        "changed": original != current,
+        "similarity": round(ratio, 3),
+        "diff": diff[:Config.Replay.MAX_DIFF_LINES]
+    }
+
+
+def _headline_options(source):
+    """
+    헤드라인 추출 경로별 추출 옵션
+
+    Args:
+        source (str): 아카이브 headlines 레코드의 추출 경로
+            ("scrape": crawler.scrape_headlines, "fallback": FireCrawl 대체 크롤링)
+
+    Returns:
+        dict: parse_headlines 인자 (selectors, limit)
+    """
+    if source == "scrape":
+        return {"selectors": HEADLINE_SELECTORS, "limit": Config.Crawler.HEADLINES_PER_SITE}
+    return {}
+
+
+def _diff_headlines(original, current):
+    """원본과 현재 헤드라인 목록 비교 결과 (원본 기록이 없으면 None)"""
+    if original is None:
+        return None
+
+    before = [(h["title"], h["url"]) for h in original]
+    after = [(h["title"], h["url"]) for h in current]
+    return {
+        "changed": before != after,
+        "added": [{"title": title, "url": url} for title, url in after if (title, url) not in before],
+        "removed": [{"title": title, "url": url} for title, url in before if (title, url) not in after]
+    }
+
+
+def _replay_item(item, summarize):
+    """
+    단일 항목을 현재 추출/요약 코드로 다시 처리
+
+    원본 본문이 있으면 기사 페이지로, 없으면 메인 페이지로 간주합니다.
+    원본 HTML이 없는 기사는 본문 추출 없이 저장된 본문을 그대로 다시 요약합니다.
+    """
+    started = time.perf_counter()
+    url = item["url"]
+    result = {"url": url}
+
+    if item["content"] is not None:
+        content = item["content"]
+        result["type"] = "article"
+
+        if item["html"] is not None:
+            extracted = _offline.extract_from_html(item["html"], {
+                "url": url,
+                "formats": ["extract"],
+                "extract": {"prompt": Config.FireCrawl.CONTENT_PROMPT}
+            })
+            content = extracted.get("result", {}).get("extract", {}).get("content", "")
+            result["content"] = _diff(item["content"], content)
+
+        if summarize:
+            article = Article(title=url, url=url, site="", country="", content=content)
+            summary = summarizer.summarize_article(article)
+            result["summary"] = _diff(item["summary"], summary)
+    else:
+        # 당시 헤드라인을 추출한 경로와 같은 선택자/개수로 다시 추출 (기록이 없으면 FireCrawl 대체 추출기)
+        archived = item["headlines"] or {}
+        source = archived.get("source", "fallback")
+        headlines = parser_pool.parse("headlines", item["html"], url, **_headline_options(source))
+        result["type"] = "headlines"
+        result["source"] = source
+        result["headlines"] = headlines
+        result["headlines_diff"] = _diff_headlines(archived.get("headlines"), headlines)
+
+    result["elapsed"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def replay_archive(directory=None, limit=None, workers=None, summarize=False):
+    """
+    저장된 페이지를 현재 추출/요약 코드로 다시 처리 (네트워크 스크래핑 없음)
+
+    Args:
+        directory (str): 아카이브 디렉터리 (생략 시 설정값 사용)
+        limit (int): 최대 항목 수
+        workers (int): 동시 처리 스레드 수
+        summarize (bool): 본문 재요약 여부 (OpenAI API 호출 발생)
+
+    Returns:
+        dict: 처리량과 원본 대비 변경 내역을 담은 리포트
+    """
+    items = _load_items(directory or Config.Archive.DIR, limit, summarize)
+    logger.info("리플레이 시작: %s개 항목", len(items))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers or Config.Replay.WORKERS) as executor:
+        results = list(executor.map(lambda item: _replay_item(item, summarize), items))
+    elapsed = time.perf_counter() - started
+
+    articles = [r for r in results if r["type"] == "article"]
+    report = {
+        "items": len(results),
+        "articles": len(articles),
+        "front_pages": len(results) - len(articles),
+        "elapsed": round(elapsed, 3),
+        "throughput": round(len(results) / elapsed, 2) if elapsed > 0 else None,
+        "content_changed": sum(1 for r in articles if r.get("content", {}).get("changed")),
+        "summary_changed": sum(1 for r in articles if r.get("summary", {}).get("changed")),
+        "headlines_changed": sum(1 for r in results if (r.get("headlines_diff") or {}).get("changed")),
+        "results": results
+    }
+
+    logger.info(
+        "리플레이 완료: %s개 항목, %s건/초, 본문 변경 %s건, 헤드라인 변경 %s건",
+        report['items'], report['throughput'], report['content_changed'], report['headlines_changed']
+    )
+    return report
@@ -21,16 +21,16 @@ class Summarizer:
         기사 내용을 요약
         
         Args:
-            article (dict): 기사 정보 (title, content 등 포함)
+            article (Article): 기사 레코드 (title, content 등 포함)
             
         Returns:
             str: 요약된 내용
         """
-        logger.info(f"기사 요약 시작: {article['title']}")
+        logger.info("기사 요약 시작: %s", article.title)
         
         try:
             # 프롬프트 생성
-            prompt = f"{self.prompt}\n\n{article['content']}"
+            prompt = f"{self.prompt}\n\n{article.content}"
             
             # GPT-3.5-turbo를 이용하여 기사 요약 (최신 API 형식)
             response = self.client.chat.completions.create(
@@ -47,14 +47,14 @@ class Summarizer:
             summary = response.choices[0].message.content.strip()
             
             if not summary:
-                logger.warn(f"기사 요약 실패: 응답이 비어있음 ({article['title']})")
+                logger.warning("기사 요약 실패: 응답이 비어있음 (%s)", article.title)
                 return None
             
-            logger.info(f"기사 요약 완료: {article['title']} ({len(summary)} 글자)")
+            logger.info("기사 요약 완료: %s (%s 글자)", article.title, len(summary))
             return summary
             
         except Exception as error:
-            logger.error(f"기사 요약 오류 ({article['title']}): {str(error)}")
+            logger.error("기사 요약 오류 (%s): %s", article.title, error)
             return None
 
 
@@ -0,0 +1,229 @@
+import re
+import json
+import time
+import sqlite3
+import threading
+import unicodedata
+from openai import OpenAI
+from utils.logger import logger
+from config import Config
+
+# 문자 체계별 유니코드 범위 (제목 원문 언어 판별용)
+_SCRIPTS = (
+    ("ko", re.compile(r"[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]")),
+    ("ja", re.compile(r"[\u3040-\u30ff]")),
+    ("zh", re.compile(r"[\u4e00-\u9fff]")),
+    ("ru", re.compile(r"[\u0400-\u04ff]")),
+    ("hi", re.compile(r"[\u0900-\u097f]"))
+)
+
+# 한자를 쓰는 언어 (한자만 있는 제목은 사이트 국가 언어로 판별)
+_HAN_LANGUAGES = {"ja", "zh", "ko"}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_title(title):
+    """
+    캐시 키용 제목 정규화 (유니코드 NFKC, 공백 정리, 대소문자 무시)
+
+    Args:
+        title (str): 헤드라인 제목
+
+    Returns:
+        str: 정규화된 제목
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", title)).strip().casefold()
+
+
+def detect_language(title, country=None):
+    """
+    제목 원문 언어 판별
+
+    한글이 있으면 한국어, 가나가 있으면 일본어처럼 문자 체계로 먼저 판별하고,
+    라틴 문자처럼 판별할 수 없으면 사이트 국가의 언어를 사용합니다.
+    한자만 있는 제목은 사이트 국가가 한국/일본/중국어권이면 그 언어로 봅니다.
+
+    Args:
+        title (str): 헤드라인 제목
+        country (str): 사이트 국가
+
+    Returns:
+        str: 언어 코드 (판별할 수 없으면 "und")
+    """
+    country_language = Config.Translation.COUNTRY_LANGUAGES.get(country, "und")
+    for language, pattern in _SCRIPTS:
+        if pattern.search(title):
+            # 한자만 있는 제목(예: 일본 사이트의 "東京都知事選")은 사이트 국가의 한자 문화권 언어를 우선
+            if language == "zh" and country_language in _HAN_LANGUAGES:
+                return country_language
+            return language
+    return country_language
+
+
+class TitleTranslator:
+    """헤드라인 제목 한국어 번역과 영구 번역 캐시
+
+    (원문 언어, 정규화된 제목)을 키로 번역 결과를 SQLite 파일에 보관해,
+    같은 헤드라인은 실행이나 재시도가 반복되어도 다시 번역하지 않습니다.
+    캐시에 없는 제목은 모아서 한 번의 요청으로 번역합니다.
+    """
+
+    def __init__(self, path=None, enabled=None):
+        """
+        번역기 초기화 (캐시 파일은 첫 사용 시 생성)
+
+        Args:
+            path (str): 캐시 파일 경로
+            enabled (bool): 번역 사용 여부
+        """
+        self.path = path or Config.Translation.CACHE_PATH
+        self.enabled = Config.Translation.ENABLED if enabled is None else enabled
+        self.model = Config.Translation.MODEL
+        self.temperature = Config.Translation.TEMPERATURE
+        self.batch_size = Config.Translation.BATCH_SIZE
+
+        self.client = OpenAI(api_key=Config.Summarization.API_KEY)
+
+        self._lock = threading.Lock()
+        self._db = None
+        self._memory = {}
+
+    def _connect(self):
+        """캐시 DB 연결 (없으면 생성)"""
+        if self._db is None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS titles ("
+                "language TEXT NOT NULL, title_key TEXT NOT NULL, "
+                "translated TEXT NOT NULL, created_at REAL NOT NULL, "
+                "PRIMARY KEY (language, title_key))"
+            )
+            self._db.commit()
+        return self._db
+
+    def _lookup(self, keys):
+        """캐시에서 번역 결과 조회 (메모리 -> 파일 순)"""
+        found = {}
+        with self._lock:
+            missing = [key for key in keys if key not in self._memory]
+            if missing:
+                db = self._connect()
+                for language, title_key in missing:
+                    row = db.execute(
+                        "SELECT translated FROM titles WHERE language = ? AND title_key = ?",
+                        (language, title_key)
+                    ).fetchone()
+                    if row:
+                        self._memory[(language, title_key)] = row[0]
+            for key in keys:
+                if key in self._memory:
+                    found[key] = self._memory[key]
+        return found
+
+    def _store(self, translations):
+        """번역 결과를 캐시에 저장"""
+        with self._lock:
+            self._memory.update(translations)
+            db = self._connect()
+            now = time.time()
+            db.executemany(
+                "INSERT OR REPLACE INTO titles (language, title_key, translated, created_at) VALUES (?, ?, ?, ?)",
+                [(language, title_key, translated, now) for (language, title_key), translated in translations.items()]
+            )
+            db.commit()
+
+    def _request(self, titles):
+        """
+        제목 목록을 한 번의 요청으로 번역
+
+        Args:
+            titles (list): 원문 제목 목록
+
+        Returns:
+            list: 같은 순서의 번역 제목 목록 (응답 형식이 맞지 않으면 None)
+        """
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": "당신은 뉴스 헤드라인 번역가입니다. 의미를 바꾸지 않고 자연스러운 한국어 기사 제목으로 번역합니다."},
+                {"role": "user", "content": (
+                    "다음 JSON 배열의 뉴스 헤드라인을 각각 한국어로 번역해서, 같은 순서와 같은 개수의 "
+                    "JSON 문자열 배열로만 반환해주세요.\n\n" + json.dumps(titles, ensure_ascii=False)
+                )}
+            ],
+            temperature=self.temperature
+        )
+
+        text = response.choices[0].message.content.strip()
+        # 코드 블록으로 감싼 응답 처리
+        text = text.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+        translated = json.loads(text)
+
+        if not isinstance(translated, list) or len(translated) != len(titles):
+            return None
+        return [str(item).strip() or title for item, title in zip(translated, titles)]
+
+    def translate(self, items):
+        """
+        제목 목록을 한국어로 번역 (캐시 우선, 나머지는 묶어서 요청)
+
+        Args:
+            items (list): (제목, 사이트 국가) 목록
+
+        Returns:
+            list: 같은 순서의 한국어 제목 목록 (번역 실패 시 원문)
+        """
+        keyed = []
+        for title, country in items:
+            language = detect_language(title, country)
+            keyed.append((title, language, (language, normalize_title(title))))
+
+        # 한국어 제목이나 비활성화 상태는 그대로 사용
+        pending = {key for title, language, key in keyed if self.enabled and language != "ko"}
+        if not pending:
+            return [title for title, _, _ in keyed]
+
+        translations = self._lookup(list(pending))
+        misses = {}
+        for title, _, key in keyed:
+            if key in pending and key not in translations:
+                misses.setdefault(key, title)
+
+        logger.info("제목 번역: 캐시 %s개, 번역 요청 %s개", len(pending) - len(misses), len(misses))
+
+        keys = list(misses)
+        for start in range(0, len(keys), self.batch_size):
+            batch = keys[start:start + self.batch_size]
+            try:
+                translated = self._request([misses[key] for key in batch])
+                if translated is None:
+                    logger.warning("제목 번역 응답 형식 오류: %s개 원문 유지", len(batch))
+                    continue
+                fresh = dict(zip(batch, translated))
+                self._store(fresh)
+                translations.update(fresh)
+            except Exception as error:
+                logger.error("제목 번역 오류: %s", error)
+
+        return [translations.get(key, title) for title, _, key in keyed]
+
+    def translate_headlines(self, items):
+        """
+        헤드라인 제목을 한국어로 바꿈 (원문은 source_title에 보관)
+
+        Args:
+            items (list): (헤드라인 dict, 사이트 정보) 목록
+        """
+        if not items:
+            return
+
+        titles = self.translate([(headline["title"], site.get("country")) for headline, site in items])
+        for (headline, _), title in zip(items, titles):
+            if title != headline["title"]:
+                headline.setdefault("source_title", headline["title"])
+                headline["title"] = title
+
+
+# 싱글톤 인스턴스
+title_translator = TitleTranslator()
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# 프로젝트 루트를 모듈 경로에 추가 (services, utils, config 임포트용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 모듈 임포트 시 생성되는 OpenAI 클라이언트용 (테스트에서 실제 호출은 하지 않음)
+os.environ.setdefault("OPENAI_API_KEY", "test")
@@ -0,0 +1,119 @@
+"""
+FireCrawl 배치 API 로컬 대역 서버 (테스트용)
+
+POST /v1/batch/scrape로 작업을 받고, GET /v1/batch/scrape/{id}에서 정해진 횟수만큼
+"scraping" 상태를 돌려준 뒤 결과를 page_size개씩 나눠 next URL로 이어 줍니다.
+결과 항목은 테스트에서 직접 지정하고, status를 "failed"로 두면 실패한 작업을 흉내 냅니다.
+"""
+import asyncio
+import threading
+from aiohttp import web
+
+
+class BatchStub:
+    """FireCrawl 배치 스크래핑 엔드포인트 대역 (백그라운드 스레드의 이벤트 루프에서 실행)"""
+
+    def __init__(self, items=None, pending_polls=0, page_size=None, status="completed", submit_status=200):
+        """
+        대역 서버 초기화
+
+        Args:
+            items (list): 완료 시 돌려줄 결과 항목 (생략 시 요청 URL마다 본문 하나)
+            pending_polls (int): 완료 전 "scraping" 상태로 응답할 조회 횟수
+            page_size (int): 결과 페이지당 항목 수 (생략 시 한 페이지)
+            status (str): 작업 최종 상태 ("completed" 또는 "failed")
+            submit_status (int): 작업 제출 응답 상태 코드
+        """
+        self.items = items
+        self.pending_polls = pending_polls
+        self.page_size = page_size
+        self.status = status
+        self.submit_status = submit_status
+
+        self.base_url = None
+        self.submitted = []
+        self.polls = 0
+        self.page_requests = 0
+
+        self._loop = None
+        self._runner = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """서버 시작 후 기본 URL 반환"""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self._start())
+            ready.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="batch-stub", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.base_url
+
+    def stop(self):
+        """서버 종료"""
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_post("/v1/batch/scrape", self.submit)
+        app.router.add_get("/v1/batch/scrape/{job}", self.poll)
+        app.router.add_get("/v1/batch/scrape/{job}/page/{page}", self.page)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    def _results(self):
+        if self.items is not None:
+            return self.items
+        return [
+            {"metadata": {"sourceURL": url}, "extract": {"content": f"body of {url}"}}
+            for url in self.submitted[-1]["urls"]
+        ]
+
+    def _pages(self):
+        results = self._results()
+        size = self.page_size or max(len(results), 1)
+        return [results[start:start + size] for start in range(0, len(results), size)] or [[]]
+
+    def _page_body(self, job, index):
+        pages = self._pages()
+        body = {"data": pages[index]}
+        if index + 1 < len(pages):
+            body["next"] = f"{self.base_url}/v1/batch/scrape/{job}/page/{index + 1}"
+        return body
+
+    async def submit(self, request):
+        self.submitted.append(await request.json())
+        if self.submit_status != 200:
+            return web.json_response({"error": "stub failure"}, status=self.submit_status)
+        return web.json_response({"success": True, "id": f"job-{len(self.submitted)}"})
+
+    async def poll(self, request):
+        self.polls += 1
+        if self.polls <= self.pending_polls:
+            return web.json_response({"status": "scraping", "completed": 0, "total": len(self._results())})
+        if self.status == "failed":
+            return web.json_response({"status": "failed"})
+
+        job = request.match_info["job"]
+        return web.json_response({"status": "completed", "total": len(self._results()), **self._page_body(job, 0)})
+
+    async def page(self, request):
+        self.page_requests += 1
+        return web.json_response(self._page_body(request.match_info["job"], int(request.match_info["page"])))
@@ -0,0 +1,41 @@
+import glob
+import os
+
+from services.archive import INDEX_ENTRY, ArchiveReader, PageArchive
+
+
+def _archive(directory):
+    return PageArchive(directory=str(directory), enabled=True)
+
+
+def test_get_returns_latest_record(tmp_path):
+    archive = _archive(tmp_path)
+    archive.append("https://x/a", "html", "<p>old</p>", crawled_at=100)
+    archive.append("https://x/a", "html", "<p>new</p>", crawled_at=200)
+    archive.close()
+
+    with ArchiveReader(str(tmp_path)) as reader:
+        assert reader.get("https://x/a")["data"] == "<p>new</p>"
+        assert reader.get("https://x/a", at=150)["data"] == "<p>old</p>"
+        assert reader.get("https://x/missing") is None
+
+
+def test_partial_index_entry_is_truncated_on_reopen(tmp_path):
+    archive = _archive(tmp_path)
+    archive.append("https://x/old", "html", "<p>old</p>")
+    archive.close()
+
+    # 엔트리 기록 도중 프로세스가 죽은 상황
+    index_path = glob.glob(os.path.join(str(tmp_path), "*.idx"))[-1]
+    with open(index_path, "ab") as index:
+        index.write(b"\x01\x02\x03")
+
+    archive = _archive(tmp_path)
+    archive.append("https://x/new", "html", "<p>new</p>")
+    archive.close()
+
+    assert os.path.getsize(index_path) % INDEX_ENTRY.size == 0
+    with ArchiveReader(str(tmp_path)) as reader:
+        assert reader.get("https://x/old")["data"] == "<p>old</p>"
+        assert reader.get("https://x/new")["data"] == "<p>new</p>"
+        assert sorted(reader.iter_urls()) == ["https://x/new", "https://x/old"]
@@ -0,0 +1,84 @@
+import asyncio
+
+from aiohttp import web
+
+from services.feeds import FeedService
+from services.http import close_session
+
+SITEMAP_NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"'
+
+
+def _urlset(name):
+    urls = "".join(
+        f"<url><loc>/{name}/{i}</loc><news:news><news:title>{name} {i}</news:title></news:news></url>"
+        for i in range(2)
+    )
+    return f"<urlset {SITEMAP_NS}>{urls}</urlset>"
+
+
+FEEDS = {
+    "/euckr.xml": (
+        '<?xml version="1.0" encoding="EUC-KR"?><rss><channel>'
+        "<item><title>한국 뉴스 제목</title><link>/a</link></item></channel></rss>"
+    ).encode("euc-kr"),
+    "/guid.xml": (
+        '<rss><channel><item><title>A</title><guid isPermaLink="false">id-1</guid></item>'
+        "<item><title>B</title><guid>https://news.test/b</guid></item></channel></rss>"
+    ).encode(),
+    "/index.xml": (
+        f'<sitemapindex {SITEMAP_NS}>'
+        "<sitemap><loc>/old.xml</loc><lastmod>2024-01-01</lastmod></sitemap>"
+        "<sitemap><loc>/new.xml</loc><lastmod>2026-01-01</lastmod></sitemap>"
+        "</sitemapindex>"
+    ).encode(),
+    "/old.xml": _urlset("old").encode(),
+    "/new.xml": _urlset("new").encode()
+}
+
+
+async def _handler(request):
+    return web.Response(body=FEEDS[request.path], content_type="application/xml")
+
+
+def _headlines(feed_paths, limit=3):
+    """로컬 서버에 피드를 띄우고 레지스트리에 등록된 피드에서 헤드라인 추출"""
+    async def run():
+        app = web.Application()
+        app.router.add_get("/{path:.*}", _handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        base = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+        service = FeedService()
+        service.enabled = True
+        service.registry = {"test": [path if path.startswith("http") else base + path for path in feed_paths]}
+        try:
+            return await service.get_headlines({"name": "test", "url": base}, limit)
+        finally:
+            await close_session()
+            await runner.cleanup()
+
+    return asyncio.run(run())
+
+
+def test_multibyte_encoded_feed():
+    headlines = _headlines(["/euckr.xml"])
+    assert [h["title"] for h in headlines] == ["한국 뉴스 제목"]
+
+
+def test_guid_used_only_when_permalink():
+    headlines = _headlines(["/guid.xml"])
+    assert headlines == [{"title": "B", "url": "https://news.test/b"}]
+
+
+def test_sitemap_index_follows_newest_children():
+    headlines = _headlines(["/index.xml"])
+    assert [h["title"] for h in headlines] == ["new 0", "new 1", "old 0"]
+
+
+def test_failing_feed_falls_through_to_next():
+    # 연결 거부(ClientError)로 실패하는 첫 피드
+    headlines = _headlines(["http://127.0.0.1:1/rss.xml", "/euckr.xml"])
+    assert [h["title"] for h in headlines] == ["한국 뉴스 제목"]
@@ -0,0 +1,81 @@
+import pytest
+
+from config import Config
+from services.firecrawl import FireCrawl
+from firecrawl_stub import BatchStub
+
+URLS = ["https://news.test/a", "https://news.test/b", "https://news.test/c"]
+OPTIONS = {"formats": ["extract"], "extract": {"prompt": "기사 본문"}}
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(Config.FireCrawl, "BATCH_POLL_INTERVAL", 0)
+
+
+def _client(stub):
+    client = FireCrawl()
+    client.batch_url = f"{stub.base_url}/v1/batch/scrape"
+    return client
+
+
+def _item(url, extract=None, key="extract", error=None, source="sourceURL"):
+    metadata = {source: url}
+    if error:
+        metadata["error"] = error
+    return {"metadata": metadata, key: extract if extract is not None else {"content": f"body of {url}"}}
+
+
+def test_polls_until_completed():
+    with BatchStub(pending_polls=2) as stub:
+        results = _client(stub).batch_scrape(URLS, OPTIONS)
+
+    assert stub.polls == 3
+    assert stub.submitted[0]["urls"] == URLS
+    assert stub.submitted[0]["extract"] == OPTIONS["extract"]
+    assert sorted(results) == URLS
+    assert results[URLS[0]] == {"result": {"extract": {"content": f"body of {URLS[0]}"}}}
+
+
+def test_follows_next_pages():
+    with BatchStub(page_size=1) as stub:
+        results = _client(stub).batch_scrape(URLS, OPTIONS)
+
+    assert stub.page_requests == 2
+    assert sorted(results) == URLS
+
+
+def test_per_item_failures_are_left_out():
+    items = [
+        _item(URLS[0], error="blocked"),
+        _item(URLS[1], extract={"content": ""}),
+        _item(URLS[2] + "/", key="json", source="url")
+    ]
+    with BatchStub(items=items) as stub:
+        results = _client(stub).batch_scrape(URLS, OPTIONS)
+
+    # 오류 항목과 빈 본문은 빠지고, json 형식과 끝의 / 차이는 요청 URL로 맞춰짐
+    assert list(results) == [URLS[2]]
+    assert results[URLS[2]]["result"]["extract"]["content"] == f"body of {URLS[2]}/"
+
+
+@pytest.mark.parametrize("stub_options", [
+    {"status": "failed"},
+    {"submit_status": 500},
+])
+def test_job_failure_returns_empty(stub_options):
+    with BatchStub(**stub_options) as stub:
+        assert _client(stub).batch_scrape(URLS, OPTIONS) == {}
+
+
+def test_timeout_returns_empty(monkeypatch):
+    monkeypatch.setattr(Config.FireCrawl, "BATCH_TIMEOUT", 0)
+    with BatchStub(pending_polls=100) as stub:
+        assert _client(stub).batch_scrape(URLS, OPTIONS) == {}
+    assert stub.polls == 1
+
+
+def test_empty_url_list_skips_request():
+    with BatchStub() as stub:
+        assert _client(stub).batch_scrape([], OPTIONS) == {}
+    assert stub.submitted == []
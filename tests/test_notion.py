@@ -0,0 +1,66 @@
+import httpx
+import pytest
+from notion_client.errors import APIErrorCode, APIResponseError
+
+from models.article import Article
+from services.notion import NotionService
+
+
+class FakePages:
+    def __init__(self, reject_children):
+        self.reject_children = reject_children
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs.get("children") and self.reject_children:
+            response = httpx.Response(400, request=httpx.Request("POST", "https://api.notion.com/v1/pages"))
+            raise APIResponseError(response, "body failed validation", APIErrorCode.ValidationError)
+        return {"id": f"page-{len(self.calls)}"}
+
+
+class FakeBlockChildren:
+    def __init__(self):
+        self.appended = []
+
+    def append(self, block_id, children):
+        self.appended.append((block_id, children))
+
+
+@pytest.fixture
+def service():
+    service = NotionService()
+    service.write_content = True
+    service.client.pages = FakePages(reject_children=True)
+    service.client.blocks.children = FakeBlockChildren()
+    return service
+
+
+def _article():
+    article = Article(title="Title", url="https://news.test/a", site="Site", country="미국", content="Body sentence. " * 50)
+    article.summary = "요약"
+    return article
+
+
+def test_rejected_children_retry_without_body(service):
+    response = service.save_to_notion(_article())
+    service.flush()
+
+    assert response == {"id": "page-2"}
+    first, retry = service.client.pages.calls
+    assert first["children"]
+    assert "children" not in retry
+    # 본문은 페이지 생성 후 블록 추가로 전달
+    appended = service.client.blocks.children.appended
+    assert [block_id for block_id, _ in appended] == ["page-2"]
+    assert appended[0][1] == first["children"]
+
+
+def test_accepted_children_are_sent_once(service):
+    service.client.pages.reject_children = False
+    response = service.save_to_notion(_article())
+    service.flush()
+
+    assert response == {"id": "page-1"}
+    assert len(service.client.pages.calls) == 1
+    assert service.client.blocks.children.appended == []
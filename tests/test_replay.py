@@ -0,0 +1,47 @@
+from config import Config
+from services.archive import PageArchive
+from services.replay import replay_archive
+
+FRONT_PAGE = (
+    "<html><body>"
+    '<h2><a href="/one">First story</a></h2>'
+    '<h3><a href="/two">Second story</a></h3>'
+    '<div class="headline"><a href="/three">Third story</a></div>'
+    "</body></html>"
+)
+
+
+def _headlines(*titles):
+    paths = {"First story": "one", "Second story": "two", "Third story": "three"}
+    return [{"title": title, "url": f"https://news.test/{paths[title]}"} for title in titles]
+
+
+def _replay(tmp_path, source, archived):
+    archive = PageArchive(directory=str(tmp_path), enabled=True)
+    archive.append("https://news.test/", "html", FRONT_PAGE, crawled_at=100)
+    archive.append("https://news.test/", "headlines", {"source": source, "headlines": archived}, crawled_at=101)
+    archive.close()
+
+    report = replay_archive(directory=str(tmp_path), workers=1)
+    assert report["front_pages"] == 1
+    return report, report["results"][0]
+
+
+def test_scrape_headlines_replay_uses_crawler_selectors(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config.Crawler, "HEADLINES_PER_SITE", 2)
+    report, result = _replay(tmp_path, "scrape", _headlines("First story", "Second story"))
+
+    # crawler.HEADLINE_SELECTORS에는 .headline a가 없고, 개수는 HEADLINES_PER_SITE로 제한
+    assert result["source"] == "scrape"
+    assert result["headlines"] == _headlines("First story", "Second story")
+    assert result["headlines_diff"]["changed"] is False
+    assert report["headlines_changed"] == 0
+
+
+def test_headline_changes_are_reported(tmp_path):
+    report, result = _replay(tmp_path, "fallback", _headlines("First story"))
+
+    assert result["headlines_diff"]["changed"] is True
+    assert result["headlines_diff"]["added"] == _headlines("Second story", "Third story")
+    assert result["headlines_diff"]["removed"] == []
+    assert report["headlines_changed"] == 1
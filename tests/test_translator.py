@@ -0,0 +1,20 @@
+import pytest
+
+from services.translator import detect_language, normalize_title
+
+
+@pytest.mark.parametrize("title, country, expected", [
+    ("東京都知事選", "일본", "ja"),
+    ("北京举行会议", "중국", "zh"),
+    ("東京都知事選", "미국", "zh"),
+    ("東京で地震が発生", "중국", "ja"),
+    ("서울 시장 선거", "일본", "ko"),
+    ("Election results", "영국", "en"),
+    ("Election results", None, "und"),
+])
+def test_detect_language(title, country, expected):
+    assert detect_language(title, country) == expected
+
+
+def test_normalize_title():
+    assert normalize_title("  Ｂreaking　News ") == normalize_title("breaking news")
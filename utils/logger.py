@@ -1,30 +1,211 @@
 import os
+import sys
+import json
+import queue
+import copy
+import atexit
+import random
+import asyncio
 import logging
-from logging.handlers import RotatingFileHandler
+import weakref
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 
 # 로그 레벨 설정
 log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
 
+# 로그 형식 설정 (json: Cloud Logging 구조화 로그, text: 로컬 개발용)
+log_format = os.getenv('LOG_FORMAT', 'json').lower()
+
+# 단계/레벨별 샘플링 비율 (예: "fetch:INFO=0.1,archive:DEBUG=0,*:DEBUG=0.5")
+log_sampling = os.getenv('LOG_SAMPLING', '')
+
+# 실행 ID, 사이트, 단계 등 로그에 자동으로 붙일 컨텍스트
+_context = contextvars.ContextVar('log_context', default={})
+
+# 구조화 필드로 내보낼 레코드 속성
+CONTEXT_FIELDS = ('run_id', 'site', 'stage', 'duration')
+
+
+# 태스크별 현재 로그 컨텍스트 (다른 스레드에서 이벤트 루프 태스크의 단계를 조회할 때 사용)
+# Task.get_context()는 Python 3.12부터 있으므로 log_context가 직접 기록합니다.
+_task_context = weakref.WeakKeyDictionary()
+
+
+def _current_task():
+    """현재 스레드에서 실행 중인 asyncio 태스크 (없으면 None)"""
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+@contextmanager
+def log_context(**fields):
+    """
+    블록 안에서 기록되는 모든 로그에 필드를 추가
+
+    Args:
+        **fields: run_id, site, stage 등 로그에 붙일 필드
+    """
+    merged = {**_context.get(), **fields}
+    token = _context.set(merged)
+
+    task = _current_task()
+    if task is not None:
+        previous = _task_context.get(task)
+        _task_context[task] = merged
+
+    try:
+        yield
+    finally:
+        _context.reset(token)
+        if task is not None:
+            if previous is None:
+                _task_context.pop(task, None)
+            else:
+                _task_context[task] = previous
+
+
+def context_fields(context=None):
+    """
+    로그 컨텍스트 필드 조회
+
+    Args:
+        context (contextvars.Context): 조회할 컨텍스트 (생략 시 현재 컨텍스트)
+
+    Returns:
+        dict: run_id, site, stage 등 컨텍스트 필드
+    """
+    if context is None:
+        return _context.get()
+    return context.get(_context, {})
+
+
+def task_fields(task):
+    """
+    asyncio 태스크의 로그 컨텍스트 필드 조회 (다른 스레드에서도 호출 가능)
+
+    Args:
+        task (asyncio.Task): 조회할 태스크
+
+    Returns:
+        dict: 태스크 안에서 가장 최근에 들어간 log_context의 필드 (없으면 빈 dict)
+    """
+    return _task_context.get(task) or {}
+
+
+class ContextFilter(logging.Filter):
+    """로그 컨텍스트 필드를 레코드 속성으로 복사 (호출 스레드에서 실행)"""
+
+    def filter(self, record):
+        for key, value in _context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """단계/레벨별 비율에 따라 로그를 샘플링"""
+
+    def __init__(self, spec):
+        super().__init__()
+        self.rates = {}
+        for item in filter(None, (part.strip() for part in spec.split(','))):
+            key, _, rate = item.partition('=')
+            stage, _, level = key.rpartition(':')
+            self.rates[(stage or '*', level.upper())] = float(rate)
+
+    def filter(self, record):
+        if not self.rates:
+            return True
+
+        stage = getattr(record, 'stage', None)
+        rate = self.rates.get((stage, record.levelname), self.rates.get(('*', record.levelname)))
+        return rate is None or random.random() < rate
+
+
+class CloudLoggingFormatter(logging.Formatter):
+    """Cloud Logging 구조화 로그(JSON 한 줄) 형식"""
+
+    def format(self, record):
+        entry = {
+            'severity': record.levelname,
+            'message': record.getMessage(),
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'logger': record.name
+        }
+
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+
+        if record.exc_text:
+            entry['stack_trace'] = record.exc_text
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """사람이 읽기 쉬운 텍스트 형식 (컨텍스트 필드는 뒤에 덧붙임)"""
+
+    def format(self, record):
+        line = super().format(record)
+        extras = ' '.join(
+            f'{field}={getattr(record, field)}'
+            for field in CONTEXT_FIELDS if getattr(record, field, None) is not None
+        )
+        return f'{line} [{extras}]' if extras else line
+
+
+class StructuredQueueHandler(QueueHandler):
+    """메시지만 완성해 큐에 넣고 JSON 직렬화는 리스너 스레드에 맡기는 큐 핸들러"""
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
 # 로거 생성
 logger = logging.getLogger('newsscrap')
 logger.setLevel(getattr(logging, log_level))
+logger.propagate = False
 
 # 포맷 정의
-formatter = logging.Formatter(
-    '%(asctime)s [%(levelname)s] %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+if log_format == 'text':
+    formatter = TextFormatter('%(asctime)s [%(levelname)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+else:
+    formatter = CloudLoggingFormatter()
 
-# 콘솔 핸들러
-console_handler = logging.StreamHandler()
+# 콘솔 핸들러 - 실제 출력은 리스너 스레드에서만 수행
+# GCP Cloud Run에서는 콘솔 로그가 Cloud Logging으로 자동 전송됨
+console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
 
-# GCP Cloud Run에서는 콘솔 로그가 Cloud Logging으로 자동 전송됨
+# 큐 핸들러 - 이벤트 루프와 작업 스레드는 큐에 넣기만 하고 바로 반환
+log_queue = queue.SimpleQueue()
+queue_handler = StructuredQueueHandler(log_queue)
+queue_handler.addFilter(ContextFilter())
+queue_handler.addFilter(SamplingFilter(log_sampling))
+logger.addHandler(queue_handler)
+
+listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+listener.start()
+
+# 종료 시 큐에 남은 로그 출력
+atexit.register(listener.stop)
 
 def get_logger():
     """로거 인스턴스 반환"""
     return logger
 
 # 기본 로거 인스턴스 제공
-logger = get_logger() 
\ No newline at end of file
+logger = get_logger()
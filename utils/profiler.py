@@ -0,0 +1,302 @@
+import os
+import re
+import sys
+import hmac
+import time
+import asyncio
+import threading
+import contextvars
+import tracemalloc
+from collections import Counter
+from utils.logger import logger, context_fields, task_fields
+from config import Config
+
+# 프로젝트 루트 (프레임 경로를 짧게 표시하는 데 사용)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 대기 중인 스레드로 보고 CPU 프로파일에서 제외할 가장 안쪽 프레임 (파일 이름, 함수 이름)
+_IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+    ("handlers.py", "dequeue")
+}
+
+# 스레드 풀 번호를 지워 같은 풀의 스레드를 하나로 묶음 (blocking-io_3 -> blocking-io)
+_THREAD_NUMBER = re.compile(r"[_-]?\d+$")
+
+# 샘플링 간격 하한 (초, 더 짧으면 샘플링 스레드가 사실상 쉬지 않음)
+MIN_SAMPLE_INTERVAL = 0.001
+
+# 동시에 하나의 프로파일링만 허용 (tracemalloc과 프레임 샘플링은 프로세스 전역)
+_active = threading.Lock()
+
+
+def authorized(header):
+    """
+    디버그 엔드포인트 인증 확인
+
+    Args:
+        header (str): Authorization 헤더 값 ("Bearer <토큰>")
+
+    Returns:
+        bool: 디버그 엔드포인트가 켜져 있고 토큰이 일치하면 True
+    """
+    if not Config.Debug.ENABLED or not Config.Debug.TOKEN:
+        return False
+    scheme, _, token = (header or "").partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(token.encode(), Config.Debug.TOKEN.encode())
+
+
+def _frame_label(code):
+    """프레임 표시 이름 (함수 이름과 짧은 파일 경로)"""
+    path = code.co_filename
+    if path.startswith(_ROOT):
+        path = os.path.relpath(path, _ROOT)
+    else:
+        path = "/".join(path.replace("\\", "/").split("/")[-2:])
+    return f"{code.co_name} ({path}:{code.co_firstlineno})"
+
+
+def _frame_fields(frame):
+    """
+    스레드가 실행 중인 작업의 로그 컨텍스트 필드 찾기
+
+    다른 스레드의 컨텍스트는 직접 읽을 수 없으므로 표준 라이브러리의 실행 지점에서 찾습니다.
+    asyncio.to_thread로 실행 중인 작업 스레드는 _WorkItem.run 프레임의 작업 함수
+    (ctx.run)의 컨텍스트에서, 이벤트 루프 스레드는 _run_once 프레임의 루프에서 실행 중인
+    태스크에 log_context가 기록한 필드에서 얻습니다.
+    """
+    while frame is not None:
+        code = frame.f_code
+        try:
+            if code.co_name == "run" and code.co_filename.endswith(os.path.join("concurrent", "futures", "thread.py")):
+                func = getattr(frame.f_locals.get("self"), "fn", None)
+                context = getattr(getattr(func, "func", None), "__self__", None)
+                if isinstance(context, contextvars.Context):
+                    return context_fields(context)
+            elif code.co_name == "_run_once" and code.co_filename.endswith(os.path.join("asyncio", "base_events.py")):
+                task = asyncio.current_task(frame.f_locals.get("self"))
+                if task is not None:
+                    return task_fields(task)
+        except Exception:
+            return None
+        frame = frame.f_back
+    return None
+
+
+def _positive(params, name, convert, minimum):
+    """양수 쿼리 파라미터 변환 (형식이 틀리거나 최소값보다 작으면 ValueError)"""
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        value = convert(value)
+    except ValueError:
+        raise ValueError(f"{name} 값이 올바르지 않습니다: {value}") from None
+    if not value >= minimum:
+        raise ValueError(f"{name} 값은 {minimum} 이상이어야 합니다: {value}")
+    return value
+
+
+class Profiler:
+    """크롤링 실행 단위 샘플링 CPU 프로파일러와 메모리 추적
+
+    백그라운드 스레드가 일정 간격으로 모든 스레드의 스택을 모아 collapsed-stack
+    형식(flamegraph.pl, speedscope 입력)으로 집계하고, 각 스택에는 해당 스레드가
+    실행 중인 로그 컨텍스트의 단계(stage)를 붙입니다. 작업 대기 중인 스레드는 제외하지만
+    외부 API 응답 대기처럼 작업 중 블로킹된 시간은 포함됩니다. 메모리 추적을 켜면 tracemalloc으로
+    단계별 최대 사용량과 최대 시점의 할당 위치 상위 N개를 기록합니다.
+    시작하지 않으면 아무 작업도 하지 않습니다.
+    """
+
+    def __init__(self, cpu=True, memory=False, interval=None, top=None):
+        """
+        프로파일러 초기화
+
+        Args:
+            cpu (bool): 스택 샘플링 사용 여부
+            memory (bool): tracemalloc 메모리 추적 사용 여부
+            interval (float): 샘플링 간격 (초)
+            top (int): 메모리 보고서에 포함할 할당 위치 수
+        """
+        self.cpu = cpu
+        self.memory = memory
+        self.interval = interval or Config.Debug.SAMPLE_INTERVAL
+        self.top = top or Config.Debug.TOP_N
+
+        self.stacks = Counter()
+        self.stage_samples = Counter()
+        self.stage_peaks = {}
+        self.samples = 0
+        self.elapsed = 0.0
+
+        self._labels = {}
+        self._peak_bytes = 0
+        self._peak_stages = []
+        self._peak_snapshot = None
+        self._final_snapshot = None
+        self._started = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """프로파일링 시작 (이미 다른 프로파일링이 진행 중이면 RuntimeError)"""
+        if not _active.acquire(blocking=False):
+            raise RuntimeError("이미 프로파일링이 진행 중입니다")
+
+        if self.memory:
+            tracemalloc.start(Config.Debug.TRACEBACK_LIMIT)
+
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        logger.info("프로파일링 시작 (CPU: %s, 메모리: %s, 간격: %s초)", self.cpu, self.memory, self.interval)
+
+    def stop(self):
+        """프로파일링 종료"""
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.elapsed = time.perf_counter() - self._started
+
+        if self.memory:
+            self._final_snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+        _active.release()
+        logger.info("프로파일링 종료 (%s초, 샘플 %s개)", round(self.elapsed, 2), self.samples)
+
+    def _run(self):
+        """샘플링 스레드"""
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            active = set()
+
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+
+                code = frame.f_code
+                if (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+                    continue
+
+                stage = (_frame_fields(frame) or {}).get("stage") or "-"
+                active.add(stage)
+
+                if self.cpu:
+                    labels = []
+                    while frame is not None:
+                        label = self._labels.get(frame.f_code)
+                        if label is None:
+                            label = self._labels[frame.f_code] = _frame_label(frame.f_code)
+                        labels.append(label)
+                        frame = frame.f_back
+                    thread = _THREAD_NUMBER.sub("", names.get(thread_id, str(thread_id)))
+                    self.stacks[";".join([stage, thread, *reversed(labels)])] += 1
+                    self.stage_samples[stage] += 1
+
+            self.samples += 1
+
+            if self.memory:
+                self._sample_memory(active)
+
+    def _sample_memory(self, stages):
+        """현재 추적 메모리를 단계별 최대값에 반영하고, 크게 늘었으면 스냅샷 저장"""
+        current, _ = tracemalloc.get_traced_memory()
+        for stage in stages:
+            self.stage_peaks[stage] = max(self.stage_peaks.get(stage, 0), current)
+
+        # 스냅샷 비용이 크므로 이전 최대값보다 10% 이상 늘었을 때만 저장
+        if current > self._peak_bytes * 1.1:
+            self._peak_bytes = current
+            self._peak_stages = sorted(stages)
+            self._peak_snapshot = tracemalloc.take_snapshot()
+
+    def collapsed(self):
+        """
+        collapsed-stack 형식 결과 ("단계;스레드;바깥 프레임;...;안쪽 프레임 샘플 수" 줄 목록)
+
+        Returns:
+            str: flamegraph.pl, speedscope 등에 바로 넣을 수 있는 텍스트
+        """
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+    def _top_allocations(self, snapshot):
+        """스냅샷의 할당 위치별 상위 N개"""
+        if snapshot is None:
+            return []
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__, all_frames=True)
+        ))
+        return [
+            {"location": str(stat.traceback[0]), "size_kb": round(stat.size / 1024, 1), "count": stat.count}
+            for stat in snapshot.statistics("lineno")[:self.top]
+        ]
+
+    def report(self):
+        """
+        프로파일링 결과 요약
+
+        Returns:
+            dict: 샘플 수, 단계별 샘플 비율, 상위 스택, 메모리 보고서
+        """
+        report = {
+            "elapsed": round(self.elapsed, 3),
+            "interval": self.interval,
+            "samples": self.samples
+        }
+
+        if self.cpu:
+            total = sum(self.stage_samples.values()) or 1
+            report["stages"] = {
+                stage: round(count / total, 3) for stage, count in self.stage_samples.most_common()
+            }
+            report["top_stacks"] = [
+                {"stack": stack, "samples": count} for stack, count in self.stacks.most_common(self.top)
+            ]
+
+        if self.memory:
+            report["memory"] = {
+                "peak_kb": round(self._peak_bytes / 1024, 1),
+                "peak_stages": self._peak_stages,
+                "stage_peak_kb": {stage: round(size / 1024, 1) for stage, size in self.stage_peaks.items()},
+                "peak_top": self._top_allocations(self._peak_snapshot),
+                "final_top": self._top_allocations(self._final_snapshot)
+            }
+
+        return report
+
+
+def profile_options(params):
+    """
+    쿼리 파라미터에서 프로파일러 옵션 추출 (?cpu=true&memory=true&interval=0.01&top=20)
+
+    Args:
+        params (Mapping): 요청 쿼리 파라미터
+
+    Returns:
+        dict: Profiler 생성 인자
+
+    Raises:
+        ValueError: interval, top 값이 숫자가 아니거나 허용 범위를 벗어난 경우
+    """
+    return {
+        "cpu": params.get("cpu", "true").lower() == "true",
+        "memory": params.get("memory", "false").lower() == "true",
+        "interval": _positive(params, "interval", float, MIN_SAMPLE_INTERVAL),
+        "top": _positive(params, "top", int, 1)
+    }